@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import argparse
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Optional
 
 from textual.app import App
 
 from domain.booking import is_valid_booking
-from domain.models import Match
+from domain.models import Match, MatchResult
 from domain.roster import seed_roster
-from sim.engine import apply_result, simulate_match
-from ui.confirm import ConfirmScreen
+from domain.state import ROSTER, AppState
+from sim.analytics import RosterAnalytics
+from sim.engine import simulate_match
+from sim.ledger import RosterLedger
 from ui.hub import HubScreen
-from ui.selector import SelectorScreen
-from ui.simulating import SimulatingScreen
-from ui.state import AppState
+
+if TYPE_CHECKING:
+    from domain.search import NameIndex
+    from sim.metrics import MetricsRegistry
+    from storage.history import HistoryWriter
+    from storage.sqlite import SQLiteStore
+    from ui.simulating import ProgressCallback
 
 
 class WrestleGMApp(App):
@@ -23,30 +32,83 @@ class WrestleGMApp(App):
     Responsibilities:
     - Hold the live roster and the global AppState.
     - Route navigation between Hub, Selector, Confirm, Simulating, and Results screens.
-    - Trigger simulations and apply stat deltas to the roster.
+    - Trigger simulations and apply stat deltas through the roster ledger.
+
+    Only the hub is imported up front; the other screens (and optional
+    storage) are imported on first use to keep cold start short.
     """
     CSS_PATH = "ui/styles.tcss"
     BINDINGS = [("q", "quit", "Quit")]
 
-    def __init__(self) -> None:
-        """Initialize roster and application state."""
+    def __init__(
+        self,
+        history_path: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        db_path: Optional[str] = None,
+    ) -> None:
+        """Initialize roster, application state, optional persistence, and metrics.
+
+        With `db_path`, the roster and state are loaded from that SQLite
+        database (seeded on first use) and every booking is recorded there.
+        """
         super().__init__()
+        self.metrics = metrics
         self.roster = seed_roster()
         self.state = AppState()
+        self.store: Optional[SQLiteStore] = None
+        if db_path:
+            from storage.sqlite import SQLiteStore
+
+            self.store = SQLiteStore(db_path)
+            stored = self.store.load_roster()
+            if stored:
+                self.roster = stored
+                self.state = self.store.load_state()
+            else:
+                self.store.save_roster(self.roster)
+        self.ledger = RosterLedger(self.roster)
+        self.analytics = RosterAnalytics(self.roster)
+        self.ledger.subscribe(self.analytics)
+        self.history: Optional[HistoryWriter] = None
+        if history_path:
+            from storage.history import HistoryWriter
+
+            self.history = HistoryWriter(history_path)
+        self._name_index: Optional[NameIndex] = None
+
+    def on_unmount(self) -> None:
+        """Close the history log and database when the app shuts down."""
+        if self.history is not None:
+            self.history.close()
+        if self.store is not None:
+            self.store.save_state(self.state)
+            self.store.close()
 
     def on_mount(self) -> None:
-        """Mount the hub screen and schedule the first refresh."""
+        """Mount the hub screen; it renders itself from the current state."""
         self.push_screen(HubScreen())
-        self.call_after_refresh(self.refresh_hub)
+
+    def push_screen(self, screen: Any, *args: Any, **kwargs: Any) -> Any:
+        """Push a screen, timing the transition when metrics are enabled."""
+        if self.metrics is not None:
+            self._time_transition("push", type(screen).__name__)
+        return super().push_screen(screen, *args, **kwargs)
+
+    def pop_screen(self) -> Any:
+        """Pop a screen, timing the transition when metrics are enabled."""
+        if self.metrics is not None:
+            self._time_transition("pop", type(self.screen).__name__)
+        return super().pop_screen()
 
     def refresh_hub(self) -> None:
-        """Update the hub UI with current selections."""
-        hub = self.screen
-        if isinstance(hub, HubScreen):
-            hub.update_view(self.roster, self.state.selected_a_id, self.state.selected_b_id)
+        """Push pending state changes to subscribed widgets."""
+        self.state.flush()
 
     def open_selector(self, slot_label: str) -> None:
         """Open the selection modal for a slot, with opponent locking."""
+        from domain.search import NameIndex
+        from ui.selector import SelectorScreen
+
         locked_id = (
             self.state.selected_b_id if slot_label == "A" else self.state.selected_a_id
         )
@@ -60,10 +122,24 @@ class WrestleGMApp(App):
                     self.state.selected_b_id = selected_id
             self.refresh_hub()
 
-        self.push_screen(SelectorScreen(self.roster, slot_label, locked_id), _on_selection)
+        if self._name_index is None:
+            self._name_index = NameIndex.from_roster(self.roster)
+            # Keeps the index's filter stats in step with bookings, undo, and redo.
+            self.ledger.subscribe(self._name_index)
+        self.push_screen(
+            SelectorScreen(self.roster, slot_label, locked_id, self._name_index), _on_selection
+        )
+
+    def open_analytics(self) -> None:
+        """Open the roster analytics panel over the hub."""
+        from ui.analytics import AnalyticsScreen
+
+        self.push_screen(AnalyticsScreen(self.analytics))
 
     def open_confirm(self) -> None:
         """Open booking confirmation modal if selection is valid."""
+        from ui.confirm import ConfirmScreen
+
         if not is_valid_booking(self.state.selected_a_id, self.state.selected_b_id):
             self.notify("Select two different wrestlers before booking.", severity="warning")
             return
@@ -82,13 +158,7 @@ class WrestleGMApp(App):
         if not is_valid_booking(self.state.selected_a_id, self.state.selected_b_id):
             return
         match = Match(self.state.selected_a_id, self.state.selected_b_id)
-        # Simulation is pure; roster is mutated only by apply_result.
-        result = simulate_match(match, self.roster, self.state.seed)
-        apply_result(self.roster, result)
-        self.state.last_match = match
-        self.state.last_result = result
-        self.state.seed += 1
-        self.push_screen(SimulatingScreen(match, result))
+        self._start_simulation(match)
 
     def reset_booking(self) -> None:
         """Clear the current booking and return to an empty hub state."""
@@ -102,13 +172,128 @@ class WrestleGMApp(App):
         """Simulate a rematch using the last booked pairing."""
         if not self.state.last_match:
             return
-        match = self.state.last_match
-        result = simulate_match(match, self.roster, self.state.seed)
-        apply_result(self.roster, result)
+        self._start_simulation(self.state.last_match)
+
+    def finish_simulation(self, match: Match, result: MatchResult) -> None:
+        """Commit a finished simulation to the roster and state.
+
+        Called on the UI thread once the SimulatingScreen's worker completes.
+        """
+        self.ledger.apply(result, match)
+        self._record(match, result)
+        self.state.last_match = match
         self.state.last_result = result
         self.state.seed += 1
-        self.push_screen(SimulatingScreen(match, result))
+        if self.store is not None:
+            self.store.save_state(self.state)
+        self.state.touch(ROSTER)
+
+    def undo_booking(self) -> None:
+        """Roll the roster back to before the most recent booking."""
+        result = self.ledger.undo()
+        if result is None:
+            self.notify("Nothing to undo.", severity="warning")
+            return
+        self._sync_undo(result, undone=True)
+        self.state.last_match = None
+        self.state.last_result = None
+        self.state.touch(ROSTER)
+        self.notify("Last booking undone.")
+        self.refresh_hub()
+
+    def redo_booking(self) -> None:
+        """Reapply the most recently undone booking."""
+        result = self.ledger.redo()
+        if result is None:
+            self.notify("Nothing to redo.", severity="warning")
+            return
+        self._sync_undo(result, undone=False)
+        self.state.last_match = self.ledger.booking(self.ledger.match_count)
+        self.state.last_result = result
+        self.state.touch(ROSTER)
+        self.notify("Booking restored.")
+        self.refresh_hub()
+
+    def _start_simulation(self, match: Match) -> None:
+        """Show the simulating screen and run the match off the UI thread."""
+        from ui.simulating import SimulatingScreen
+
+        roster = self.roster
+        seed = self.state.seed
+
+        def _job(progress: ProgressCallback) -> MatchResult:
+            """Simulate the match; the roster is only read until the result is committed."""
+            progress(0, 1)
+            result = simulate_match(match, roster, seed)
+            progress(1, 1)
+            return result
+
+        self.push_screen(SimulatingScreen(match, _job))
+
+    def _time_transition(self, action: str, screen_name: str) -> None:
+        """Count a push/pop and time it until the next frame is drawn."""
+        metrics = self.metrics
+        labels = {"action": action, "screen": screen_name}
+        start = time.perf_counter()
+
+        def _done() -> None:
+            """Observe the elapsed time once the screen stack has refreshed."""
+            metrics.increment("screen_transitions", labels=labels)
+            metrics.observe("screen_transition", time.perf_counter() - start, labels)
+
+        self.call_after_refresh(_done)
+
+    def _record(self, match: Match, result: MatchResult) -> None:
+        """Append a result to the history log and database, if configured."""
+        if self.history is not None:
+            self.history.append(result, self.state.seed)
+            self.history.flush()
+        if self.store is not None:
+            self.store.record(match, result, self.state.seed, self.roster)
+
+    def _sync_undo(self, result: MatchResult, undone: bool) -> None:
+        """Mirror an undo or redo in the history log and database (with both wrestlers' stats)."""
+        if self.history is not None:
+            if undone:
+                self.history.revert()
+            else:
+                self.history.restore()
+            self.history.flush()
+        if self.store is None:
+            return
+        wrestlers = [self.roster[result.winner_id], self.roster[result.loser_id]]
+        if undone:
+            self.store.undo_last(wrestlers)
+        else:
+            self.store.redo_next(wrestlers)
 
 
 if __name__ == "__main__":
-    WrestleGMApp().run()
+    parser = argparse.ArgumentParser(description="WrestleGM vertical slice")
+    parser.add_argument("--history", help="append match results to this history log")
+    parser.add_argument("--db", help="load and save the roster, state, and history in SQLite")
+    parser.add_argument(
+        "--metrics", help="record counters/latencies and write them here on exit (.json or text)"
+    )
+    parser.add_argument("--profile", help="profile the session and write the output here")
+    parser.add_argument("--profiler", choices=("cprofile", "sample"), default="cprofile")
+    args = parser.parse_args()
+
+    registry = None
+    if args.metrics:
+        from sim.metrics import MetricsRegistry, install, uninstall
+
+        registry = MetricsRegistry()
+        install(registry)
+    session = nullcontext()
+    if args.profile:
+        from sim.profiling import profile_session
+
+        session = profile_session(args.profile, args.profiler)
+    try:
+        with session:
+            WrestleGMApp(history_path=args.history, metrics=registry, db_path=args.db).run()
+    finally:
+        if registry is not None:
+            uninstall()
+            registry.write(args.metrics)
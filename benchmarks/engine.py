@@ -0,0 +1,231 @@
+"""Simulation engine benchmarks with a stored baseline.
+
+Measures single-match latency, `apply_result` throughput, RNG construction
+cost, scalar and batch throughput across roster sizes, and memory per
+`MatchResult`. Results are compared against `engine_baseline.json`; any
+metric worse than the baseline by more than `--tolerance` is a regression
+and makes the script exit non-zero.
+
+    uv run python benchmarks/engine.py
+    uv run python benchmarks/engine.py --sizes 8,1000 --json
+    uv run python benchmarks/engine.py --update-baseline
+
+Baselines are machine-specific: refresh them on the reference machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from domain.models import Match, Wrestler  # noqa: E402
+from domain.roster import seed_roster  # noqa: E402
+from sim.engine import apply_result, simulate_match  # noqa: E402
+from sim.rng import RNG, CounterRNG  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).with_name("engine_baseline.json")
+DEFAULT_SIZES = (8, 1_000, 100_000, 1_000_000)
+SCALAR_MATCHES = 10_000
+BATCH_MATCHES = 100_000
+
+Metrics = Dict[str, Dict[str, object]]
+
+
+def best_per_call(func: Callable[[], object], calls: int, repeat: int = 5) -> float:
+    """Return the best-of-`repeat` seconds per call over `calls` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def synthetic_roster(size: int) -> Dict[str, Wrestler]:
+    """Return a deterministic roster of `size` wrestlers."""
+    return {
+        f"w{row:07d}": Wrestler(
+            f"w{row:07d}",
+            f"Wrestler {row}",
+            "Face" if row % 2 else "Heel",
+            (row * 37) % 101,
+            (row * 53) % 101,
+        )
+        for row in range(size)
+    }
+
+
+def bench_core(metrics: Metrics, repeat: int) -> None:
+    """Single-match latency, apply throughput, and RNG construction cost."""
+    roster = seed_roster()
+    match = Match("asha", "rohan")
+    latency = best_per_call(lambda: simulate_match(match, roster, 1), 2_000, repeat)
+    _record(metrics, "simulate_match.latency", latency * 1e6, "us", "lower")
+    counter = best_per_call(
+        lambda: simulate_match(match, roster, 1, rng_factory=CounterRNG), 2_000, repeat
+    )
+    _record(metrics, "simulate_match.counter_rng.latency", counter * 1e6, "us", "lower")
+
+    result = simulate_match(match, roster, 1)
+    applied = best_per_call(lambda: apply_result(roster, result), 20_000, repeat)
+    _record(metrics, "apply_result.throughput", 1 / applied, "ops/s", "higher")
+
+    for name, factory in (("rng", RNG), ("counter_rng", CounterRNG)):
+        construct = best_per_call(lambda: factory(1), 5_000, repeat)
+        _record(metrics, f"{name}.construct", construct * 1e9, "ns", "lower")
+
+
+def bench_scalar(metrics: Metrics, size: int, repeat: int) -> None:
+    """simulate_match + apply_result throughput over a roster of `size` (best of `repeat`)."""
+    roster = synthetic_roster(size)
+    ids = list(roster)
+    matches = [
+        Match(ids[(i * 7919) % size], ids[(i * 7919 + 1 + i % (size - 1)) % size])
+        for i in range(SCALAR_MATCHES)
+    ]
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for seed, match in enumerate(matches):
+            apply_result(roster, simulate_match(match, roster, seed))
+        elapsed = min(elapsed, time.perf_counter() - start)
+    rate = len(matches) / elapsed
+    _record(metrics, f"scalar.throughput[{size}]", rate, "matches/s", "higher")
+
+
+def bench_batch(metrics: Metrics, size: int, repeat: int) -> None:
+    """simulate_batch + apply_batch throughput over a columnar roster (best of `repeat`)."""
+    import numpy as np
+
+    from domain.store import RosterStore
+    from sim.batch import apply_batch, simulate_batch
+
+    rows = np.arange(size)
+    store = RosterStore(
+        [f"w{row:07d}" for row in range(size)],
+        [f"Wrestler {row}" for row in range(size)],
+        rows % 2 == 1,
+        (rows * 37) % 101,
+        (rows * 53) % 101,
+    )
+    a_idx = (np.arange(BATCH_MATCHES) * 7919) % size
+    b_idx = (a_idx + 1 + np.arange(BATCH_MATCHES) % (size - 1)) % size
+    seeds = np.arange(BATCH_MATCHES)
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        apply_batch(store, simulate_batch(store, a_idx, b_idx, seeds))
+        elapsed = min(elapsed, time.perf_counter() - start)
+    rate = BATCH_MATCHES / elapsed
+    _record(metrics, f"batch.throughput[{size}]", rate, "matches/s", "higher")
+
+
+def bench_memory(metrics: Metrics, count: int = 10_000) -> None:
+    """Bytes allocated per retained MatchResult (including its deltas)."""
+    roster = seed_roster()
+    match = Match("asha", "rohan")
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [simulate_match(match, roster, seed) for seed in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    _record(metrics, "match_result.bytes", allocated / len(results), "bytes", "lower")
+
+
+def compare(metrics: Metrics, baseline: Metrics, tolerance: float) -> List[str]:
+    """Return human-readable regressions against a baseline."""
+    regressions = []
+    for name, current in metrics.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        value, reference = float(current["value"]), float(base["value"])
+        if current["better"] == "higher":
+            worse = value < reference * (1 - tolerance)
+        else:
+            worse = value > reference * (1 + tolerance)
+        if worse:
+            regressions.append(
+                f"{name}: {value:,.1f} {current['unit']} vs baseline {reference:,.1f}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite and return a process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated roster sizes",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="repeats for micro-benchmarks")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown fraction")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    metrics: Metrics = {}
+    bench_core(metrics, args.repeat)
+    bench_memory(metrics)
+    for size in sizes:
+        bench_scalar(metrics, size, args.repeat)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("numpy not installed; skipping batch benchmarks", file=sys.stderr)
+    else:
+        for size in sizes:
+            bench_batch(metrics, size, args.repeat)
+
+    report = {"environment": _environment(), "metrics": metrics}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, metric in metrics.items():
+            print(f"{name:40s} {metric['value']:>14,.1f} {metric['unit']}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline", file=sys.stderr)
+        return 0
+    baseline = json.loads(args.baseline.read_text())["metrics"]
+    regressions = compare(metrics, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _record(metrics: Metrics, name: str, value: float, unit: str, better: str) -> None:
+    """Store one metric with its unit and direction."""
+    metrics[name] = {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def _environment() -> Dict[str, str]:
+    """Describe the interpreter and platform the numbers came from."""
+    environment = {"python": platform.python_version(), "platform": platform.platform()}
+    try:
+        import numpy
+    except ImportError:
+        return environment
+    environment["numpy"] = numpy.__version__
+    return environment
+
+
+if __name__ == "__main__":
+    sys.exit(main())
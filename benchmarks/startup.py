@@ -0,0 +1,144 @@
+"""Startup benchmark: time to first hub paint and per-module import cost.
+
+Each measurement runs in a fresh interpreter so nothing is cached between
+runs. The median over `--runs` is compared against a JSON budget and the
+script exits non-zero when any budget is exceeded.
+
+    uv run python benchmarks/startup.py
+    uv run python benchmarks/startup.py --runs 9 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_BUDGET = Path(__file__).with_name("startup_budget.json")
+
+# Runs the real app headless and reports once the hub has rendered a frame.
+_PAINT_PROBE = """
+import os, sys, time
+start = time.perf_counter()
+from app import WrestleGMApp
+from ui.hub import HubScreen
+
+class Probe(WrestleGMApp):
+    CSS_PATH = os.path.abspath(WrestleGMApp.CSS_PATH)
+
+    def on_mount(self):
+        super().on_mount()
+        self.call_after_refresh(self._wait_for_hub)
+
+    def _wait_for_hub(self):
+        if isinstance(self.screen, HubScreen) and self.screen.is_mounted:
+            self.call_after_refresh(self._painted)
+        else:
+            self.call_after_refresh(self._wait_for_hub)
+
+    def _painted(self):
+        self.paint_ms = (time.perf_counter() - start) * 1000
+        self.loaded = sorted(name for name in sys.modules if name.split(".")[0] in LOCAL)
+        self.exit()
+
+LOCAL = {"app", "ui", "sim", "domain", "storage"}
+app = Probe()
+app.run(headless=True)
+print(app.paint_ms)
+print(" ".join(app.loaded))
+"""
+
+
+def measure_paint() -> tuple:
+    """Return (in-process ms to first hub paint, wall ms incl. interpreter, loaded modules)."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _PAINT_PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    paint_line, modules_line = result.stdout.strip().splitlines()[-2:]
+    return float(paint_line), wall_ms, modules_line.split()
+
+
+def measure_imports(module: str = "app") -> Dict[str, float]:
+    """Return cumulative import time in ms per module, from `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = int(cumulative) / 1000
+    return timings
+
+
+def check_budget(report: Dict, budget: Dict) -> List[str]:
+    """Return a list of budget violations (empty when within budget)."""
+    failures = []
+    limit = budget.get("first_paint_ms")
+    if limit is not None and report["first_paint_ms"] > limit:
+        failures.append(f"first paint {report['first_paint_ms']:.0f} ms > {limit} ms")
+    for module, limit in budget.get("imports_ms", {}).items():
+        spent = report["imports_ms"].get(module)
+        if spent is not None and spent > limit:
+            failures.append(f"import {module} {spent:.0f} ms > {limit} ms")
+    for module in budget.get("lazy_modules", []):
+        if module in report["loaded_at_paint"]:
+            failures.append(f"{module} was imported before the first paint")
+    return failures
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the benchmark and return a process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    paints = [measure_paint() for _ in range(args.runs)]
+    imports = [measure_imports() for _ in range(args.runs)]
+    modules = sorted(set().union(*imports))
+    report = {
+        "runs": args.runs,
+        "first_paint_ms": statistics.median(paint for paint, _, _ in paints),
+        "first_paint_wall_ms": statistics.median(wall for _, wall, _ in paints),
+        "loaded_at_paint": paints[-1][2],
+        "imports_ms": {
+            module: statistics.median(run.get(module, 0.0) for run in imports)
+            for module in modules
+        },
+    }
+    failures = check_budget(report, json.loads(args.budget.read_text()))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"first hub paint: {report['first_paint_ms']:.0f} ms in-process, "
+              f"{report['first_paint_wall_ms']:.0f} ms wall")
+        slowest = sorted(report["imports_ms"].items(), key=lambda item: -item[1])[:15]
+        for module, spent in slowest:
+            print(f"  {spent:8.1f} ms  {module}")
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Headless command-line runner for batch bookings.
+
+Reads one booking per line (two wrestler IDs separated by whitespace or a
+comma), simulates them in order against a live roster exactly as the TUI
+would, and streams one result per line to stdout as JSON Lines or CSV.
+Never imports Textual, so it starts quickly in cron jobs and containers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from contextlib import ExitStack
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from domain.booking import is_valid_booking
+from domain.models import Match, MatchResult, Wrestler
+from domain.roster import seed_roster
+from sim.engine import apply_result, simulate_match
+
+FIELDS = [
+    "match",
+    "seed",
+    "wrestler_a",
+    "wrestler_b",
+    "winner",
+    "loser",
+    "rating",
+    "winner_popularity",
+    "winner_stamina",
+    "loser_popularity",
+    "loser_stamina",
+]
+
+
+class BookingError(ValueError):
+    """Raised for a malformed or invalid booking line."""
+
+
+def parse_bookings(lines: Iterable[str], roster: Dict[str, Wrestler]) -> Iterator[Match]:
+    """Yield matches from booking lines, skipping blanks and `#` comments."""
+    for line_no, line in enumerate(lines, start=1):
+        text = line.split("#", 1)[0].replace(",", " ").split()
+        if not text:
+            continue
+        if len(text) != 2:
+            raise BookingError(f"line {line_no}: expected two wrestler IDs, got {len(text)}")
+        for wrestler_id in text:
+            if wrestler_id not in roster:
+                raise BookingError(f"line {line_no}: unknown wrestler {wrestler_id!r}")
+        if not is_valid_booking(text[0], text[1]):
+            raise BookingError(f"line {line_no}: a wrestler cannot face themselves")
+        yield Match(text[0], text[1])
+
+
+def run_bookings(
+    matches: Iterable[Match], roster: Dict[str, Wrestler], seed: int = 1
+) -> Iterator[Tuple[int, Match, MatchResult]]:
+    """Simulate and apply matches in order, yielding (seed, match, result).
+
+    The seed advances by one per match, matching the TUI's booking flow.
+    """
+    for match in matches:
+        result = simulate_match(match, roster, seed)
+        apply_result(roster, result)
+        yield seed, match, result
+        seed += 1
+
+
+def result_row(number: int, seed: int, match: Match, result: MatchResult) -> List[object]:
+    """Flatten one result into values in FIELDS order."""
+    return [
+        number,
+        seed,
+        match.wrestler_a_id,
+        match.wrestler_b_id,
+        result.winner_id,
+        result.loser_id,
+        result.rating,
+        result.winner_delta.popularity,
+        result.winner_delta.stamina,
+        result.loser_delta.popularity,
+        result.loser_delta.stamina,
+    ]
+
+
+def main(
+    argv: Optional[List[str]] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+) -> int:
+    """Run the CLI and return a process exit status."""
+    parser = argparse.ArgumentParser(description="Simulate bookings without the TUI")
+    parser.add_argument(
+        "bookings", nargs="?", default="-", help="one 'A B' pair per line (default: stdin)"
+    )
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the first match")
+    parser.add_argument("--roster", help="load the roster from a snapshot file")
+    parser.add_argument("--history", help="also append results to this history log")
+    args = parser.parse_args(argv)
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    writer = csv.writer(stdout, lineterminator="\n") if args.format == "csv" else None
+    # Opened inside the try so unreadable or corrupt files are reported like bad
+    # bookings (BookingError is a ValueError) and anything already open is closed.
+    with ExitStack() as stack:
+        try:
+            roster = seed_roster()
+            if args.roster:
+                from storage.snapshot import load_snapshot
+
+                roster = load_snapshot(args.roster)[0]
+            history = None
+            if args.history:
+                from storage.history import HistoryWriter
+
+                history = stack.enter_context(HistoryWriter(args.history))
+            source = stdin
+            if args.bookings != "-":
+                source = stack.enter_context(open(args.bookings, encoding="utf-8"))
+            if writer is not None:
+                writer.writerow(FIELDS)
+            results = run_bookings(parse_bookings(source, roster), roster, args.seed)
+            for number, (seed, match, result) in enumerate(results, start=1):
+                row = result_row(number, seed, match, result)
+                if writer is not None:
+                    writer.writerow(row)
+                else:
+                    stdout.write(json.dumps(dict(zip(FIELDS, row))) + "\n")
+                if history is not None:
+                    history.append(result, seed)
+        except (ValueError, OSError) as exc:
+            print(f"{parser.prog}: {exc}", file=sys.stderr)
+            return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
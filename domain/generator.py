@@ -0,0 +1,141 @@
+"""Seeded procedural roster generator for load testing.
+
+Wrestlers are produced in fixed-size blocks, each column drawn from its own
+NumPy stream seeded by (seed, block number, column), so a roster of any size is
+reproducible and a prefix of a large roster equals the smaller roster.
+IDs are sequential and fixed-width (`w0000000`, `w0000001`, ...), which makes
+them unique without any collision checks and keeps a prefix's IDs unchanged
+in a larger roster. The width caps a roster at 10**ID_WIDTH wrestlers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the optional extra
+    raise ImportError("domain.generator requires numpy; install the 'fast' extra") from exc
+
+from domain.models import Wrestler
+from domain.store import STAT_DTYPE, RosterStore
+
+BLOCK_SIZE = 65536
+ID_WIDTH = 7
+
+FIRST_NAMES = (
+    "Asha", "Rohan", "Mina", "Leo", "Jax", "Ivy", "Ember", "Goro",
+    "Kai", "Nadia", "Orin", "Priya", "Quinn", "Rex", "Sable", "Tariq",
+    "Uma", "Vik", "Wren", "Xena", "Yuki", "Zane", "Bianca", "Cole",
+    "Dara", "Eli", "Freya", "Gage", "Hana", "Idris", "Juno", "Koa",
+)
+LAST_NAMES = (
+    "Blaze", "Steel", "Kage", "Nova", "Thunder", "Wren", "Vale", "Wolfe",
+    "Storm", "Cross", "Fury", "Knight", "Rook", "Viper", "Stone", "Ash",
+    "Frost", "Hawk", "Iron", "Jade", "Kross", "Lynx", "Mako", "Nash",
+    "Onyx", "Pike", "Quill", "Raze", "Slate", "Titan", "Vex", "Zero",
+)
+
+
+@dataclass(frozen=True)
+class StatDistribution:
+    """Normal distribution for one stat, rounded and clipped to [low, high]."""
+    mean: float = 55.0
+    stddev: float = 15.0
+    low: int = 0
+    high: int = 100
+
+    def __post_init__(self) -> None:
+        """Reject an empty clipping range."""
+        if self.low > self.high:
+            raise ValueError(f"low ({self.low}) must not exceed high ({self.high})")
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Draw `size` stat values as uint8."""
+        values = np.rint(rng.normal(self.mean, self.stddev, size))
+        return np.clip(values, max(0, self.low), min(100, self.high)).astype(STAT_DTYPE)
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """Stat distributions and alignment mix for generated rosters."""
+    popularity: StatDistribution = field(default_factory=StatDistribution)
+    stamina: StatDistribution = field(default_factory=lambda: StatDistribution(70.0, 15.0))
+    face_ratio: float = 0.5
+
+
+GeneratedBlock = Tuple[List[str], List[str], np.ndarray, np.ndarray, np.ndarray]
+
+
+def iter_blocks(
+    count: int, seed: int = 0, config: GeneratorConfig = GeneratorConfig()
+) -> Iterator[GeneratedBlock]:
+    """Yield (ids, names, face, popularity, stamina) columns block by block."""
+    _check_count(count)
+    for block, start in enumerate(range(0, count, BLOCK_SIZE)):
+        size = min(BLOCK_SIZE, count - start)
+        # One stream per column, so a shorter final block draws a prefix of
+        # what a full block would have drawn.
+        face_rng, pop_rng, sta_rng, first_rng, last_rng = (
+            np.random.default_rng([seed, block, column]) for column in range(5)
+        )
+        face = face_rng.random(size) < config.face_ratio
+        popularity = config.popularity.sample(pop_rng, size)
+        stamina = config.stamina.sample(sta_rng, size)
+        first = first_rng.integers(0, len(FIRST_NAMES), size)
+        last = last_rng.integers(0, len(LAST_NAMES), size)
+        ids = [f"w{row:0{ID_WIDTH}d}" for row in range(start, start + size)]
+        names = [
+            f"{FIRST_NAMES[f]} {LAST_NAMES[n]}" for f, n in zip(first.tolist(), last.tolist())
+        ]
+        yield ids, names, face, popularity, stamina
+
+
+def generate_store(
+    count: int, seed: int = 0, config: GeneratorConfig = GeneratorConfig()
+) -> RosterStore:
+    """Generate a roster straight into a RosterStore, one block at a time."""
+    _check_count(count)
+    ids: List[str] = []
+    names: List[str] = []
+    face = np.empty(count, dtype=bool)
+    popularity = np.empty(count, dtype=STAT_DTYPE)
+    stamina = np.empty(count, dtype=STAT_DTYPE)
+    start = 0
+    for block in iter_blocks(count, seed, config):
+        block_ids, block_names, block_face, block_pop, block_sta = block
+        stop = start + len(block_ids)
+        ids.extend(block_ids)
+        names.extend(block_names)
+        face[start:stop] = block_face
+        popularity[start:stop] = block_pop
+        stamina[start:stop] = block_sta
+        start = stop
+    return RosterStore(ids, names, face, popularity, stamina)
+
+
+def iter_wrestlers(
+    count: int, seed: int = 0, config: GeneratorConfig = GeneratorConfig()
+) -> Iterator[Wrestler]:
+    """Yield generated Wrestler objects lazily, for dict rosters and streaming writers."""
+    for ids, names, face, popularity, stamina in iter_blocks(count, seed, config):
+        for wrestler_id, name, is_face, pop, sta in zip(
+            ids, names, face.tolist(), popularity.tolist(), stamina.tolist()
+        ):
+            yield Wrestler(wrestler_id, name, "Face" if is_face else "Heel", pop, sta)
+
+
+def generate_roster(
+    count: int, seed: int = 0, config: GeneratorConfig = GeneratorConfig()
+) -> Dict[str, Wrestler]:
+    """Generate a plain `Dict[str, Wrestler]` roster."""
+    return {wrestler.id: wrestler for wrestler in iter_wrestlers(count, seed, config)}
+
+
+def _check_count(count: int) -> None:
+    """Reject counts that are negative or need IDs wider than ID_WIDTH digits."""
+    if count < 0:
+        raise ValueError("count must not be negative")
+    if count > 10**ID_WIDTH:
+        raise ValueError(f"count must not exceed {10**ID_WIDTH:,} ({ID_WIDTH}-digit IDs)")
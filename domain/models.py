@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Dict, Literal
+from typing import Dict, Iterator, Literal, Tuple, Union
 
 Alignment = Literal["Face", "Heel"]
 
+DEFAULT_MATCH_TYPE = "Singles"
+
 
 def clamp_stat(value: int) -> int:
     """Clamp a stat to the 0-100 range.
@@ -16,7 +19,7 @@ def clamp_stat(value: int) -> int:
     return max(0, min(100, value))
 
 
-@dataclass
+@dataclass(slots=True)
 class Wrestler:
     """Represents a wrestler used by booking and simulation.
 
@@ -35,17 +38,19 @@ class Wrestler:
         self.stamina = clamp_stat(self.stamina)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Match:
     """Represents a booked match by wrestler IDs.
 
-    The model is immutable to keep simulation inputs stable.
+    The model is immutable to keep simulation inputs stable. `match_type`
+    names the rule set in `sim.rules` used to simulate it.
     """
     wrestler_a_id: str
     wrestler_b_id: str
+    match_type: str = DEFAULT_MATCH_TYPE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatDelta:
     """Represents popularity and stamina changes after a match.
 
@@ -55,13 +60,139 @@ class StatDelta:
     stamina: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     """Represents a simulated outcome with explicit deltas.
 
     The result includes the winner/loser IDs, a rating, and per-wrestler deltas.
+    Deltas live in fixed fields; `deltas` exposes them as an ID-keyed mapping.
     """
     winner_id: str
     loser_id: str
     rating: int
+    winner_delta: StatDelta
+    loser_delta: StatDelta
+
+    @property
+    def deltas(self) -> ResultDeltas:
+        """Return a read-only mapping of wrestler ID to StatDelta."""
+        return ResultDeltas(self)
+
+
+class ResultDeltas(Mapping):
+    """Lazy two-entry mapping view over a MatchResult's deltas."""
+    __slots__ = ("_result",)
+
+    def __init__(self, result: MatchResult) -> None:
+        """Bind the view to a result."""
+        self._result = result
+
+    def __getitem__(self, wrestler_id: str) -> StatDelta:
+        """Return the delta for the winner or loser."""
+        if wrestler_id == self._result.winner_id:
+            return self._result.winner_delta
+        if wrestler_id == self._result.loser_id:
+            return self._result.loser_delta
+        raise KeyError(wrestler_id)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate winner then loser IDs."""
+        return iter((self._result.winner_id, self._result.loser_id))
+
+    def __len__(self) -> int:
+        """Return 2; a result always holds both deltas."""
+        return 2
+
+    def __repr__(self) -> str:
+        """Return a dict-style representation."""
+        return repr(dict(self))
+
+
+@dataclass(frozen=True, slots=True)
+class TeamMatch:
+    """Represents a match between two or more sides of one or more wrestlers.
+
+    Covers tag matches (two sides of two), triple threats (three sides of
+    one), and similar. Sides are ordered; a wrestler may appear only once.
+    `match_type` names the rule set in `sim.rules`, as for `Match`.
+    """
+    sides: Tuple[Tuple[str, ...], ...]
+    match_type: str = DEFAULT_MATCH_TYPE
+
+    def __post_init__(self) -> None:
+        """Validate side count and reject empty sides or repeated wrestlers."""
+        if len(self.sides) < 2:
+            raise ValueError("a match needs at least two sides")
+        if any(not side for side in self.sides):
+            raise ValueError("every side needs at least one wrestler")
+        if len(set(self.wrestler_ids)) != len(self.wrestler_ids):
+            raise ValueError("a wrestler cannot appear twice in one match")
+
+    @classmethod
+    def tag(
+        cls,
+        team_a: Tuple[str, ...],
+        team_b: Tuple[str, ...],
+        match_type: str = DEFAULT_MATCH_TYPE,
+    ) -> TeamMatch:
+        """Return a two-sided tag match."""
+        return cls((tuple(team_a), tuple(team_b)), match_type)
+
+    @classmethod
+    def free_for_all(
+        cls, *wrestler_ids: str, match_type: str = DEFAULT_MATCH_TYPE
+    ) -> TeamMatch:
+        """Return a match where every wrestler is their own side."""
+        return cls(tuple((wrestler_id,) for wrestler_id in wrestler_ids), match_type)
+
+    @property
+    def wrestler_ids(self) -> Tuple[str, ...]:
+        """Return every participant in side order."""
+        return tuple(wrestler_id for side in self.sides for wrestler_id in side)
+
+
+@dataclass(frozen=True, slots=True)
+class TeamMatchResult:
+    """Represents the outcome of a TeamMatch.
+
+    Every member of the winning side gets `winner_delta`; everyone else gets
+    `loser_delta`.
+    """
+    winners: Tuple[str, ...]
+    losers: Tuple[str, ...]
+    rating: int
+    winner_delta: StatDelta
+    loser_delta: StatDelta
+
+    @property
+    def deltas(self) -> Dict[str, StatDelta]:
+        """Return a mapping of wrestler ID to StatDelta."""
+        deltas = dict.fromkeys(self.winners, self.winner_delta)
+        deltas.update(dict.fromkeys(self.losers, self.loser_delta))
+        return deltas
+
+
+CardMatch = Union[Match, TeamMatch]
+CardMatchResult = Union[MatchResult, TeamMatchResult]
+
+
+@dataclass(frozen=True, slots=True)
+class Card:
+    """Represents an ordered show of matches run back to back.
+
+    Wrestlers may appear in more than one match; later matches see the stat
+    changes from earlier ones.
+    """
+    matches: Tuple[CardMatch, ...]
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class CardResult:
+    """Represents a simulated card: per-match results plus net deltas.
+
+    `deltas` holds each participant's total change across the card (after
+    per-match clamping), ready to commit to the roster in one pass.
+    """
+    results: Tuple[CardMatchResult, ...]
     deltas: Dict[str, StatDelta]
@@ -0,0 +1,287 @@
+"""Name search and stat filters for large rosters.
+
+`NameIndex` answers case-insensitive name lookups without scanning every
+wrestler: short queries use a sorted word-prefix list, longer ones intersect
+trigram posting lists. `parse_query` turns selector input such as
+"vale heel pop>=50" into a `RosterQuery`, and `NameIndex.filter` applies its
+alignment and stat filters without touching per-wrestler objects.
+"""
+
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from domain.models import Alignment, MatchResult, Wrestler
+
+_STAT_FIELDS = {"pop": "popularity", "sta": "stamina"}
+# Above this many rows, re-querying the index beats filtering the last result.
+NARROW_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class RosterQuery:
+    """Parsed selector query: name text plus optional filters."""
+    text: str = ""
+    alignment: Optional[Alignment] = None
+    min_popularity: int = 0
+    min_stamina: int = 0
+
+    @property
+    def has_filters(self) -> bool:
+        """Return True when any stat or alignment filter is set."""
+        return bool(self.alignment or self.min_popularity or self.min_stamina)
+
+
+def parse_query(raw: str) -> RosterQuery:
+    """Parse free text with `face`/`heel` and `pop>=N`/`sta>=N` filter tokens.
+
+    Unrecognized tokens are treated as name text.
+    """
+    words: List[str] = []
+    alignment: Optional[Alignment] = None
+    minimums = {"popularity": 0, "stamina": 0}
+    for token in raw.lower().split():
+        if token in ("face", "heel"):
+            alignment = "Face" if token == "face" else "Heel"
+            continue
+        stat = _parse_minimum(token)
+        if stat:
+            minimums[stat[0]] = stat[1]
+            continue
+        words.append(token)
+    return RosterQuery(
+        text=" ".join(words),
+        alignment=alignment,
+        min_popularity=minimums["popularity"],
+        min_stamina=minimums["stamina"],
+    )
+
+
+class NameIndex:
+    """Case-insensitive name index over a fixed list of roster IDs.
+
+    Results are row numbers into `ids`, in roster order. An index built with
+    `from_roster` can also filter rows by alignment and stats. For a
+    `RosterStore` it masks the store's live columns. For other rosters it
+    keeps one byte per row for alignment, popularity, and stamina. Subscribe
+    the index to a `RosterLedger` (or call `refresh`) to keep those in step.
+    """
+
+    def __init__(self, ids: Sequence[str], names: Sequence[str]) -> None:
+        """Build word-prefix and trigram indexes for the given names."""
+        self.ids = list(ids)
+        self._names = [name.lower() for name in names]
+        words: List[Tuple[str, int]] = []
+        grams: Dict[str, List[int]] = defaultdict(list)
+        for row, name in enumerate(self._names):
+            for word in set(name.split()):
+                words.append((word, row))
+            for gram in set(map("".join, zip(name, name[1:], name[2:]))):
+                grams[gram].append(row)
+        words.sort()
+        self._words = [word for word, _ in words]
+        self._word_rows = [row for _, row in words]
+        self._grams = dict(grams)
+        self._last_text = ""
+        self._last_rows: List[int] = []
+        self._roster: Optional[Mapping[str, Wrestler]] = None
+        self._store = None
+        self._rows: Dict[str, int] = {}
+        self._face = bytearray()
+        self._popularity = bytearray()
+        self._stamina = bytearray()
+
+    @classmethod
+    def from_roster(cls, roster: Mapping[str, Wrestler]) -> NameIndex:
+        """Build an index over a roster mapping in iteration order."""
+        store_cls = _store_class()
+        if store_cls is not None and isinstance(roster, store_cls):
+            index = cls(roster.ids, roster.names)
+            index._store = roster
+            return index
+        index = cls(list(roster), [wrestler.name for wrestler in roster.values()])
+        index._roster = roster
+        index._rows = {wrestler_id: row for row, wrestler_id in enumerate(index.ids)}
+        index._face = bytearray(len(index.ids))
+        index._popularity = bytearray(len(index.ids))
+        index._stamina = bytearray(len(index.ids))
+        index.refresh(index.ids)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self.ids)
+
+    def search(self, text: str) -> List[int]:
+        """Return rows whose name contains `text` (or starts a word, for 1-2 chars).
+
+        The previous query's result is remembered; when the user extends it
+        (type-ahead), the new result is filtered from that list instead of
+        going back to the index, as long as that list is short.
+        """
+        text = text.lower().strip()
+        if not text:
+            rows = list(range(len(self.ids)))
+        elif self._extends_last(text) and len(self._last_rows) <= NARROW_LIMIT:
+            rows = [row for row in self._last_rows if self._matches(row, text)]
+        elif len(text) < 3:
+            rows = self._prefix_rows(text)
+        else:
+            rows = self._trigram_rows(text)
+        self._last_text, self._last_rows = text, rows
+        return rows
+
+    def filter(self, rows: Sequence[int], query: RosterQuery) -> List[int]:
+        """Apply a query's alignment and minimum-stat filters to search results.
+
+        Same result as `filter_rows` against the roster the index was built from.
+        """
+        if not query.has_filters:
+            return list(rows)
+        if self._store is not None:
+            return self._filter_store(rows, query)
+        if self._roster is None:
+            raise ValueError("stat filters need an index built with NameIndex.from_roster")
+        size = len(self.ids)
+        masks = []
+        if query.alignment:
+            masks.append(self._face.translate(_FACE if query.alignment == "Face" else _HEEL))
+        if query.min_popularity:
+            masks.append(self._popularity.translate(_at_least(query.min_popularity)))
+        if query.min_stamina:
+            masks.append(self._stamina.translate(_at_least(query.min_stamina)))
+        # AND the 0/1 byte masks in one big-int operation.
+        combined = int.from_bytes(masks[0], "big")
+        for mask in masks[1:]:
+            combined &= int.from_bytes(mask, "big")
+        keep = combined.to_bytes(size, "big")
+        if len(rows) == size:
+            return list(compress(range(size), keep))
+        return [row for row in rows if keep[row]]
+
+    def refresh(self, wrestler_ids: Iterable[str]) -> None:
+        """Re-read alignment and stats for the given wrestlers from the roster."""
+        if self._roster is None:
+            return
+        for wrestler_id in wrestler_ids:
+            row = self._rows[wrestler_id]
+            wrestler = self._roster[wrestler_id]
+            self._face[row] = wrestler.alignment == "Face"
+            self._popularity[row] = wrestler.popularity
+            self._stamina[row] = wrestler.stamina
+
+    def record(self, result: MatchResult) -> None:
+        """Ledger hook: pick up both wrestlers' new stats."""
+        self.refresh((result.winner_id, result.loser_id))
+
+    def revert(self, result: MatchResult) -> None:
+        """Ledger hook: pick up both wrestlers' restored stats."""
+        self.refresh((result.winner_id, result.loser_id))
+
+    def _filter_store(self, rows: Sequence[int], query: RosterQuery) -> List[int]:
+        """Filter rows with NumPy masks over the store's live columns."""
+        import numpy as np
+
+        store = self._store
+        mask = np.ones(len(self.ids), dtype=bool)
+        if query.alignment:
+            mask &= store.face if query.alignment == "Face" else ~store.face
+        if query.min_popularity:
+            mask &= store.popularity >= query.min_popularity
+        if query.min_stamina:
+            mask &= store.stamina >= query.min_stamina
+        if len(rows) == len(self.ids):
+            return np.flatnonzero(mask).tolist()
+        selected = np.asarray(rows, dtype=np.intp)
+        return selected[mask[selected]].tolist()
+
+    def _extends_last(self, text: str) -> bool:
+        """Return True when text narrows the previous query under the same rule."""
+        last = self._last_text
+        if not last or not text.startswith(last):
+            return False
+        return len(last) >= 3 or len(text) < 3
+
+    def _matches(self, row: int, text: str) -> bool:
+        """Return True when a row satisfies the same rule `search` uses."""
+        name = self._names[row]
+        if len(text) < 3:
+            return any(word.startswith(text) for word in name.split())
+        return text in name
+
+    def _prefix_rows(self, text: str) -> List[int]:
+        """Return rows with a name word starting with text."""
+        start = bisect_left(self._words, text)
+        end = bisect_left(self._words, text + "\uffff", start)
+        return sorted(set(self._word_rows[start:end]))
+
+    def _trigram_rows(self, text: str) -> List[int]:
+        """Intersect trigram postings, then confirm the substring match."""
+        postings = []
+        for gram in {text[i : i + 3] for i in range(len(text) - 2)}:
+            rows = self._grams.get(gram)
+            if rows is None:
+                return []
+            postings.append(rows)
+        if len(postings) == 1:
+            return list(postings[0])
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            candidates.intersection_update(rows)
+            if not candidates:
+                return []
+        return sorted(row for row in candidates if text in self._names[row])
+
+
+def filter_rows(
+    rows: Iterable[int], ids: Sequence[str], roster: Mapping[str, Wrestler], query: RosterQuery
+) -> List[int]:
+    """Apply a query's alignment and minimum-stat filters against live stats.
+
+    Looks up every row in the roster; `NameIndex.filter` is the fast path.
+    """
+    if not query.has_filters:
+        return list(rows)
+    kept = []
+    for row in rows:
+        wrestler = roster[ids[row]]
+        if query.alignment and wrestler.alignment != query.alignment:
+            continue
+        if wrestler.popularity < query.min_popularity or wrestler.stamina < query.min_stamina:
+            continue
+        kept.append(row)
+    return kept
+
+
+# translate() tables mapping an alignment byte (1 = Face) to a 0/1 keep flag.
+_FACE = bytes([0, 1]) + bytes(254)
+_HEEL = bytes([1, 0]) + bytes(254)
+
+
+@lru_cache(maxsize=None)
+def _at_least(minimum: int) -> bytes:
+    """Return a translate() table mapping a stat byte to 1 when it is >= minimum."""
+    return bytes(value >= minimum for value in range(256))
+
+
+def _store_class() -> Optional[type]:
+    """Return RosterStore if it has been imported; otherwise no roster can be one."""
+    module = sys.modules.get("domain.store")
+    return getattr(module, "RosterStore", None)
+
+
+def _parse_minimum(token: str) -> Optional[Tuple[str, int]]:
+    """Parse `pop>=N`, `pop>N`, or `sta>=N` tokens into (field, minimum)."""
+    for prefix, field in _STAT_FIELDS.items():
+        for operator, offset in ((">=", 0), (">", 1)):
+            marker = prefix + operator
+            if token.startswith(marker) and token[len(marker) :].isdigit():
+                return field, int(token[len(marker) :]) + offset
+    return None
@@ -0,0 +1,73 @@
+"""Shared application state: selections, last result, and RNG seed."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, FrozenSet, List, Optional, Set
+
+from domain.models import Match, MatchResult
+
+# Pseudo-field reported when roster stats change without an AppState field changing.
+ROSTER = "roster"
+
+StateListener = Callable[[FrozenSet[str]], None]
+
+
+@dataclass
+class AppState:
+    """Holds selection and simulation state across screens.
+
+    Tracks selected wrestler IDs, the last simulated match/result, and RNG seed
+    used by the simulation engine.
+
+    The state is observable: assigning a field to a different value marks it
+    dirty, and `flush` hands the set of dirty field names to every subscriber
+    once, so widgets re-render only what changed. `touch` marks names dirty
+    explicitly, e.g. `ROSTER` after stats change under an unchanged selection.
+    """
+    selected_a_id: Optional[str] = None
+    selected_b_id: Optional[str] = None
+    last_match: Optional[Match] = None
+    last_result: Optional[MatchResult] = None
+    seed: int = 1
+    _dirty: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _listeners: List[StateListener] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field, marking it dirty when the value changes."""
+        dirty = self.__dict__.get("_dirty")
+        if dirty is not None and not name.startswith("_"):
+            if self.__dict__.get(name) != value:
+                dirty.add(name)
+        object.__setattr__(self, name, value)
+
+    @property
+    def dirty(self) -> FrozenSet[str]:
+        """Return the names changed since the last flush."""
+        return frozenset(self._dirty)
+
+    def touch(self, *names: str) -> None:
+        """Mark names dirty without changing them."""
+        self._dirty.update(names)
+
+    def touch_all(self) -> None:
+        """Mark every field (and the roster) dirty, for a full re-render."""
+        self._dirty.update(f.name for f in fields(self) if not f.name.startswith("_"))
+        self._dirty.add(ROSTER)
+
+    def subscribe(self, listener: StateListener) -> Callable[[], None]:
+        """Register a listener for flushed changes; returns an unsubscribe callable."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def flush(self) -> FrozenSet[str]:
+        """Notify listeners of pending changes, clear them, and return them."""
+        if not self._dirty:
+            return frozenset()
+        changed = frozenset(self._dirty)
+        self._dirty.clear()
+        for listener in list(self._listeners):
+            listener(changed)
+        return changed
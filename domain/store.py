@@ -0,0 +1,186 @@
+"""Columnar struct-of-arrays roster storage.
+
+`RosterStore` keeps wrestler stats in contiguous NumPy arrays with an ID to
+row index map. It behaves like the `Dict[str, Wrestler]` roster used across the
+app, handing out lightweight views, and supports vectorized stat updates.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the optional extra
+    raise ImportError("domain.store requires numpy; install the 'fast' extra") from exc
+
+from domain.models import Alignment, Wrestler, clamp_stat
+
+STAT_DTYPE = np.uint8
+
+
+class WrestlerView:
+    """Attribute view of one roster row that reads and writes the store arrays.
+
+    Mirrors the `Wrestler` fields so screens and the engine can use it as-is.
+    Assigned stats are clamped to 0-100, matching `Wrestler` normalization.
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: RosterStore, row: int) -> None:
+        """Bind the view to a store row."""
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        """Return the wrestler ID."""
+        return self._store.ids[self._row]
+
+    @property
+    def name(self) -> str:
+        """Return the display name."""
+        return self._store.names[self._row]
+
+    @property
+    def alignment(self) -> Alignment:
+        """Return Face or Heel."""
+        return "Face" if self._store.face[self._row] else "Heel"
+
+    @property
+    def popularity(self) -> int:
+        """Return popularity as a Python int."""
+        return int(self._store.popularity[self._row])
+
+    @popularity.setter
+    def popularity(self, value: int) -> None:
+        """Store a clamped popularity value."""
+        self._store.popularity[self._row] = clamp_stat(value)
+
+    @property
+    def stamina(self) -> int:
+        """Return stamina as a Python int."""
+        return int(self._store.stamina[self._row])
+
+    @stamina.setter
+    def stamina(self, value: int) -> None:
+        """Store a clamped stamina value."""
+        self._store.stamina[self._row] = clamp_stat(value)
+
+    def to_wrestler(self) -> Wrestler:
+        """Return a detached Wrestler copy of this row."""
+        return Wrestler(self.id, self.name, self.alignment, self.popularity, self.stamina)
+
+    def __repr__(self) -> str:
+        """Return a Wrestler-style representation."""
+        return (
+            f"WrestlerView(id={self.id!r}, name={self.name!r}, alignment={self.alignment!r}, "
+            f"popularity={self.popularity}, stamina={self.stamina})"
+        )
+
+
+class RosterStore(Mapping):
+    """Roster held as parallel typed arrays plus an ID to row index map.
+
+    Row i of `popularity`, `stamina` and `face` belongs to `ids[i]`. The store
+    can be passed anywhere a roster mapping is expected and exposes the same
+    array attributes as `sim.batch.RosterArrays` for batch simulation. The ID
+    map is built on first lookup, which is also when duplicate IDs are reported.
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        names: List[str],
+        face: np.ndarray,
+        popularity: np.ndarray,
+        stamina: np.ndarray,
+    ) -> None:
+        """Create a store from prepared columns; stats are clamped to 0-100."""
+        size = len(ids)
+        if not (len(names) == len(face) == len(popularity) == len(stamina) == size):
+            raise ValueError("roster columns must have equal length")
+        self.ids = ids
+        self.names = names
+        self.face = np.asarray(face, dtype=bool)
+        self.popularity = np.clip(popularity, 0, 100).astype(STAT_DTYPE)
+        self.stamina = np.clip(stamina, 0, 100).astype(STAT_DTYPE)
+        self._index_map: Optional[Dict[str, int]] = None
+
+    @property
+    def _index(self) -> Dict[str, int]:
+        """Return the ID to row map, building it on first use.
+
+        Deferring the map keeps bulk loads that only touch the stat columns cheap.
+        """
+        if self._index_map is None:
+            index = dict(zip(self.ids, range(len(self.ids))))
+            if len(index) != len(self.ids):
+                raise ValueError("roster IDs must be unique")
+            self._index_map = index
+        return self._index_map
+
+    @classmethod
+    def from_wrestlers(cls, wrestlers: Iterable[Wrestler]) -> RosterStore:
+        """Build a store from Wrestler objects in iteration order."""
+        wrestlers = list(wrestlers)
+        return cls(
+            ids=[wrestler.id for wrestler in wrestlers],
+            names=[wrestler.name for wrestler in wrestlers],
+            face=np.array([w.alignment == "Face" for w in wrestlers], dtype=bool),
+            popularity=np.array([w.popularity for w in wrestlers], dtype=np.int64),
+            stamina=np.array([w.stamina for w in wrestlers], dtype=np.int64),
+        )
+
+    @classmethod
+    def from_roster(cls, roster: Mapping) -> RosterStore:
+        """Build a store from a roster mapping."""
+        return cls.from_wrestlers(roster.values())
+
+    def __getitem__(self, wrestler_id: str) -> WrestlerView:
+        """Return a live view of a wrestler's row."""
+        return WrestlerView(self, self._index[wrestler_id])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate wrestler IDs in row order."""
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        """Return the number of wrestlers."""
+        return len(self.ids)
+
+    def __contains__(self, wrestler_id: object) -> bool:
+        """Return True when the ID is in the store."""
+        return wrestler_id in self._index
+
+    def index_of(self, wrestler_id: str) -> int:
+        """Return the row index for a wrestler ID."""
+        return self._index[wrestler_id]
+
+    def indices(self, wrestler_ids: Iterable[str]) -> np.ndarray:
+        """Return row indices for several IDs as an int64 array."""
+        index = self._index
+        return np.fromiter((index[wrestler_id] for wrestler_id in wrestler_ids), dtype=np.int64)
+
+    def apply_deltas(
+        self,
+        rows: np.ndarray,
+        popularity: Optional[np.ndarray] = None,
+        stamina: Optional[np.ndarray] = None,
+    ) -> None:
+        """Add per-row stat deltas in one vectorized pass and clamp to 0-100.
+
+        Rows may repeat; repeated deltas accumulate before clamping.
+        """
+        rows, inverse = np.unique(np.asarray(rows, dtype=np.int64), return_inverse=True)
+        for column, deltas in ((self.popularity, popularity), (self.stamina, stamina)):
+            if deltas is None:
+                continue
+            weights = np.broadcast_to(np.asarray(deltas, dtype=np.int64), inverse.shape)
+            totals = np.bincount(inverse, weights=weights, minlength=len(rows))
+            column[rows] = np.clip(column[rows] + totals.astype(np.int64), 0, 100)
+
+    def to_roster(self) -> Dict[str, Wrestler]:
+        """Return a detached `Dict[str, Wrestler]` copy of the store."""
+        return {wrestler_id: self[wrestler_id].to_wrestler() for wrestler_id in self.ids}
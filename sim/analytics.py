@@ -0,0 +1,244 @@
+"""Running roster analytics maintained as each result is applied.
+
+`RosterAnalytics` keeps per-wrestler win/loss counts, rating totals, and a
+bounded buffer of recent post-match stats, plus totals per (winner, loser)
+alignment pairing.
+Recording or reverting a result touches only its two wrestlers and one
+matchup bucket, so leaderboards and matchup stats cost the same after ten
+matches or a million; nothing rescans the history.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from heapq import nlargest
+from typing import Callable, Deque, Dict, List, Mapping, Tuple
+
+from domain.models import Alignment, MatchResult, Wrestler
+from sim.engine import apply_result
+
+# Number of recent matches covered by rolling stamina and popularity trend.
+WINDOW = 5
+# Extra recent matches kept per wrestler so undo restores the window exactly.
+UNDO_DEPTH = 64
+
+_ALIGNMENTS: Tuple[Alignment, Alignment] = ("Face", "Heel")
+
+
+@dataclass(slots=True)
+class WrestlerStats:
+    """Running aggregates for one wrestler.
+
+    Counts and totals are plain integers. `recent` holds (popularity,
+    stamina) after each of the last `window + undo_depth + 1` matches (the
+    trend needs one match before the window), so memory per wrestler is
+    fixed however long the session runs. The extra entries let undo restore
+    the window exactly; after more than `undo_depth` undos in a row the
+    rolling values cover fewer matches until new results refill them.
+    """
+    window: int
+    start: Tuple[int, int]
+    recent: Deque[Tuple[int, int]]
+    matches: int = 0
+    wins: int = 0
+    rating_total: int = 0
+
+    @property
+    def losses(self) -> int:
+        """Return the number of recorded losses."""
+        return self.matches - self.wins
+
+    @property
+    def win_rate(self) -> float:
+        """Return wins per match, or 0.0 before the first match."""
+        return self.wins / self.matches if self.matches else 0.0
+
+    @property
+    def average_rating(self) -> float:
+        """Return the mean rating of this wrestler's matches, or 0.0."""
+        return self.rating_total / self.matches if self.matches else 0.0
+
+    @property
+    def popularity_trend(self) -> int:
+        """Return the popularity change over the last `window` matches."""
+        recent = self.recent
+        if not recent:
+            return 0
+        if self.matches <= self.window:
+            baseline = self.start[0]
+        else:
+            baseline = recent[max(0, len(recent) - self.window - 1)][0]
+        return recent[-1][0] - baseline
+
+    @property
+    def rolling_stamina(self) -> float:
+        """Return mean stamina after the last `window` matches, or starting stamina."""
+        recent = self.recent
+        if not recent:
+            return float(self.start[1])
+        count = min(self.window, len(recent))
+        return sum(recent[-offset][1] for offset in range(1, count + 1)) / count
+
+    def record(self, won: bool, rating: int, popularity: int, stamina: int) -> None:
+        """Add one match with the wrestler's stats after it."""
+        self.matches += 1
+        self.wins += won
+        self.rating_total += rating
+        self.recent.append((popularity, stamina))
+
+    def revert(self, won: bool, rating: int, popularity: int, stamina: int) -> None:
+        """Remove the most recent match, given the wrestler's restored stats."""
+        self.matches -= 1
+        self.wins -= won
+        self.rating_total -= rating
+        self.recent.pop()
+        if self.matches and not self.recent:
+            # Undone past the buffer: the restored stats are the previous match's.
+            self.recent.append((popularity, stamina))
+
+
+@dataclass(slots=True)
+class MatchupStats:
+    """Match count and rating total for one (winner, loser) alignment pairing."""
+    matches: int = 0
+    rating_total: int = 0
+
+    @property
+    def average_rating(self) -> float:
+        """Return the mean rating, or 0.0 before the first match."""
+        return self.rating_total / self.matches if self.matches else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderboardRow:
+    """One wrestler's line in a leaderboard."""
+    wrestler_id: str
+    name: str
+    matches: int
+    wins: int
+    win_rate: float
+    average_rating: float
+    popularity_trend: int
+    rolling_stamina: float
+
+
+LEADERBOARD_KEYS: Dict[str, Callable[[WrestlerStats], float]] = {
+    "win_rate": lambda stats: stats.win_rate,
+    "average_rating": lambda stats: stats.average_rating,
+    "popularity_trend": lambda stats: stats.popularity_trend,
+    "rolling_stamina": lambda stats: stats.rolling_stamina,
+    "wins": lambda stats: stats.wins,
+}
+
+
+class RosterAnalytics:
+    """Incrementally maintained win, rating, stat-trend, and matchup aggregates.
+
+    Build one over a live roster before any results are applied, then either
+    apply results through `apply_result` or subscribe it to a `RosterLedger`,
+    which calls `record` after each apply or redo and `revert` after each
+    undo. Results must be reverted in the reverse order they were recorded.
+    """
+
+    def __init__(
+        self, roster: Mapping[str, Wrestler], window: int = WINDOW, undo_depth: int = UNDO_DEPTH
+    ) -> None:
+        """Snapshot the roster's starting stats; `window` sizes the rolling stats."""
+        if window < 1:
+            raise ValueError("window must be positive")
+        if undo_depth < 0:
+            raise ValueError("undo_depth must not be negative")
+        self.roster = roster
+        self.window = window
+        self.matches = 0
+        self.rating_total = 0
+        self._wrestlers = {
+            wrestler.id: WrestlerStats(
+                window,
+                (wrestler.popularity, wrestler.stamina),
+                deque(maxlen=window + undo_depth + 1),
+            )
+            for wrestler in roster.values()
+        }
+        self._matchups: Dict[Tuple[Alignment, Alignment], MatchupStats] = {
+            (winner, loser): MatchupStats() for winner in _ALIGNMENTS for loser in _ALIGNMENTS
+        }
+
+    @property
+    def average_rating(self) -> float:
+        """Return the mean rating over all recorded matches, or 0.0."""
+        return self.rating_total / self.matches if self.matches else 0.0
+
+    def apply_result(self, roster: Dict[str, Wrestler], result: MatchResult) -> None:
+        """Apply a result to the roster and record it."""
+        apply_result(roster, result)
+        self.record(result)
+
+    def record(self, result: MatchResult) -> None:
+        """Add a result that has just been applied to the roster."""
+        winner = self.roster[result.winner_id]
+        loser = self.roster[result.loser_id]
+        rating = result.rating
+        self.matches += 1
+        self.rating_total += rating
+        self._wrestlers[winner.id].record(True, rating, winner.popularity, winner.stamina)
+        self._wrestlers[loser.id].record(False, rating, loser.popularity, loser.stamina)
+        matchup = self._matchups[winner.alignment, loser.alignment]
+        matchup.matches += 1
+        matchup.rating_total += rating
+
+    def revert(self, result: MatchResult) -> None:
+        """Remove the most recently recorded result, after the roster is rolled back."""
+        winner = self.roster[result.winner_id]
+        loser = self.roster[result.loser_id]
+        rating = result.rating
+        self.matches -= 1
+        self.rating_total -= rating
+        self._wrestlers[winner.id].revert(True, rating, winner.popularity, winner.stamina)
+        self._wrestlers[loser.id].revert(False, rating, loser.popularity, loser.stamina)
+        matchup = self._matchups[winner.alignment, loser.alignment]
+        matchup.matches -= 1
+        matchup.rating_total -= rating
+
+    def wrestler(self, wrestler_id: str) -> WrestlerStats:
+        """Return one wrestler's aggregates; raises KeyError for unknown IDs."""
+        return self._wrestlers[wrestler_id]
+
+    def matchup(self, winner: Alignment, loser: Alignment) -> MatchupStats:
+        """Return aggregates for matches a `winner`-aligned wrestler won over a `loser`."""
+        return self._matchups[winner, loser]
+
+    def face_win_rate(self) -> float:
+        """Return the share of Face vs Heel matches won by the Face, or 0.0."""
+        face = self._matchups["Face", "Heel"].matches
+        total = face + self._matchups["Heel", "Face"].matches
+        return face / total if total else 0.0
+
+    def leaderboard(
+        self, key: str = "win_rate", limit: int = 10, min_matches: int = 1
+    ) -> List[LeaderboardRow]:
+        """Return the top `limit` wrestlers by `key` among those with `min_matches`.
+
+        `key` is one of `LEADERBOARD_KEYS`; ties keep roster order.
+        """
+        score = LEADERBOARD_KEYS[key]
+        eligible = (
+            (wrestler_id, stats)
+            for wrestler_id, stats in self._wrestlers.items()
+            if stats.matches >= min_matches
+        )
+        top = nlargest(limit, eligible, key=lambda item: score(item[1]))
+        return [
+            LeaderboardRow(
+                wrestler_id,
+                self.roster[wrestler_id].name,
+                stats.matches,
+                stats.wins,
+                stats.win_rate,
+                stats.average_rating,
+                stats.popularity_trend,
+                stats.rolling_stamina,
+            )
+            for wrestler_id, stats in top
+        ]
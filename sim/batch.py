@@ -0,0 +1,199 @@
+"""Vectorized batch simulation over NumPy arrays.
+
+Mirrors the rules in `sim.engine.simulate_match` for many pairings at once and
+returns columnar arrays instead of per-match result objects.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Mapping, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the optional extra
+    raise ImportError("sim.batch requires numpy; install the 'fast' extra") from exc
+
+from domain.models import DEFAULT_MATCH_TYPE, Wrestler
+from domain.store import RosterStore
+from sim.rng import MASK64, SPLITMIX_GAMMA, SPLITMIX_MIX_1, SPLITMIX_MIX_2
+from sim.rules import (
+    LOSER_POPULARITY,
+    STAT_BITS,
+    WINNER_POPULARITY,
+    CompiledRules,
+    compiled_rules,
+)
+
+_GAMMA = np.uint64(SPLITMIX_GAMMA)
+_MIX_1 = np.uint64(SPLITMIX_MIX_1)
+_MIX_2 = np.uint64(SPLITMIX_MIX_2)
+
+# Draw order matches the scalar engine: two weight jitters, the winner roll,
+# rating variance, then stamina loss.
+_DRAWS_PER_MATCH = 5
+
+
+@dataclass(frozen=True)
+class RosterArrays:
+    """Columnar view of a roster used as batch simulation input.
+
+    Row i of every array describes the wrestler whose ID is ids[i].
+    """
+    ids: List[str]
+    popularity: np.ndarray
+    stamina: np.ndarray
+    face: np.ndarray
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Columnar outcomes for a batch of simulated matches.
+
+    Winner and loser are roster row indices. Popularity deltas are fixed by the
+    match type, so only the per-match stamina loss is stored.
+    """
+    winner_idx: np.ndarray
+    loser_idx: np.ndarray
+    rating: np.ndarray
+    stamina_loss: np.ndarray
+    winner_popularity: int = WINNER_POPULARITY
+    loser_popularity: int = LOSER_POPULARITY
+
+    def __len__(self) -> int:
+        """Return the number of matches in the batch."""
+        return len(self.rating)
+
+
+def roster_arrays(roster: Mapping[str, Wrestler]) -> RosterArrays:
+    """Convert a roster mapping into columnar arrays in iteration order."""
+    wrestlers = list(roster.values())
+    return RosterArrays(
+        ids=[wrestler.id for wrestler in wrestlers],
+        popularity=np.array([w.popularity for w in wrestlers], dtype=np.int64),
+        stamina=np.array([w.stamina for w in wrestlers], dtype=np.int64),
+        face=np.array([w.alignment == "Face" for w in wrestlers], dtype=bool),
+    )
+
+
+def simulate_batch(
+    roster: RosterArrays,
+    a_idx: np.ndarray,
+    b_idx: np.ndarray,
+    seeds: Union[np.ndarray, Iterable[int]],
+    match_type: str = DEFAULT_MATCH_TYPE,
+) -> BatchResult:
+    """Simulate many matches at once and return columnar outcomes.
+
+    Inputs:
+    - roster: columnar stats; any object with popularity/stamina/face arrays.
+    - a_idx, b_idx: roster row indices for each pairing.
+    - seeds: one seed per pairing; equal seeds yield equal outcomes. Any
+      integers are accepted, including negative ones and unsigned 64-bit
+      `derive_seed` outputs; like `CounterRNG`, only the low 64 bits count.
+    - match_type: registered rule set (see `sim.rules`) used for every match.
+
+    Each match draws from its own counter-based stream, so results do not
+    depend on batch size or order. Outcomes are bit-identical to
+    `simulate_match(..., rng_factory=CounterRNG)` and follow the same
+    distribution as the default Mersenne Twister path.
+    """
+    rules = compiled_rules(match_type)
+    weight_table, rating_table, pairing_table = _tables(rules)
+    a_idx = np.asarray(a_idx, dtype=np.int64)
+    b_idx = np.asarray(b_idx, dtype=np.int64)
+    draws = _draws(_seed_array(seeds), _DRAWS_PER_MATCH)
+
+    pop_a = roster.popularity[a_idx].astype(np.int64)
+    pop_b = roster.popularity[b_idx].astype(np.int64)
+    face_a = roster.face[a_idx].astype(np.int64)
+    face_b = roster.face[b_idx].astype(np.int64)
+    # Same packing as sim.rules.pack_profile.
+    key_a = pop_a | roster.stamina[a_idx].astype(np.int64) << STAT_BITS | face_a << 2 * STAT_BITS
+    key_b = pop_b | roster.stamina[b_idx].astype(np.int64) << STAT_BITS | face_b << 2 * STAT_BITS
+
+    jitter = rules.weight_jitter
+    a_weight = weight_table[key_a] + _randint(draws[0], -jitter, jitter)
+    b_weight = weight_table[key_b] + _randint(draws[1], -jitter, jitter)
+    a_weight = np.maximum(1, a_weight)
+    b_weight = np.maximum(1, b_weight)
+    roll = 1 + _randint_span(draws[2], a_weight + b_weight)
+    a_wins = roll <= a_weight
+
+    modifiers = pairing_table[face_a << 1 | face_b] + rating_table[key_a] + rating_table[key_b]
+    variance = _randint(draws[3], -rules.rating_variance, rules.rating_variance)
+    # int() in the scalar engine truncates toward zero; astype does the same.
+    raw = (pop_a + pop_b) / 2 + modifiers + variance
+    rating = np.clip(raw.astype(np.int64), 0, 100)
+
+    stamina_loss = rules.stamina_loss_base + _randint(draws[4], 0, rules.stamina_loss_spread)
+
+    return BatchResult(
+        winner_idx=np.where(a_wins, a_idx, b_idx),
+        loser_idx=np.where(a_wins, b_idx, a_idx),
+        rating=rating.astype(np.int16),
+        stamina_loss=stamina_loss.astype(np.int16),
+        winner_popularity=rules.winner_popularity,
+        loser_popularity=rules.loser_popularity,
+    )
+
+
+def apply_batch(store: RosterStore, result: BatchResult) -> None:
+    """Apply every delta in a batch result to a RosterStore in one pass.
+
+    Deltas for a wrestler who appears in several matches accumulate before
+    clamping, unlike sequential `apply_result` calls which clamp per match.
+    """
+    rows = np.concatenate([result.winner_idx, result.loser_idx])
+    popularity = np.concatenate(
+        [
+            np.full(len(result), result.winner_popularity),
+            np.full(len(result), result.loser_popularity),
+        ]
+    )
+    stamina = -np.concatenate([result.stamina_loss, result.stamina_loss]).astype(np.int64)
+    store.apply_deltas(rows, popularity=popularity, stamina=stamina)
+
+
+@lru_cache(maxsize=16)
+def _tables(rules: CompiledRules) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return a compiled rule set's weight, rating, and pairing tables as arrays."""
+    return (
+        np.array(rules.weight, dtype=np.int64),
+        np.array(rules.rating, dtype=np.int64),
+        np.array(rules.pairing, dtype=np.int64),
+    )
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    """Apply the SplitMix64 finalizer to a uint64 array."""
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    return z ^ (z >> np.uint64(31))
+
+
+def _seed_array(seeds: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+    """Return seeds as uint64, keeping the low 64 bits of each as CounterRNG does."""
+    if isinstance(seeds, np.ndarray) and seeds.dtype.kind in "iu":
+        # Casting wraps negative int64 values modulo 2**64.
+        return seeds.astype(np.uint64)
+    # np.asarray would turn a mix of large and small ints into lossy floats.
+    return np.fromiter((int(seed) & MASK64 for seed in seeds), dtype=np.uint64)
+
+
+def _draws(seeds: np.ndarray, count: int) -> List[np.ndarray]:
+    """Return `count` independent uint64 draws per uint64 seed."""
+    key = _mix(seeds + _GAMMA)
+    offsets = np.arange(1, count + 1, dtype=np.uint64) * _GAMMA
+    return [_mix(key + offset) for offset in offsets]
+
+
+def _randint(draw: np.ndarray, low: int, high: int) -> np.ndarray:
+    """Map uint64 draws onto integers between low and high, inclusive."""
+    return low + (draw % np.uint64(high - low + 1)).astype(np.int64)
+
+
+def _randint_span(draw: np.ndarray, span: np.ndarray) -> np.ndarray:
+    """Map uint64 draws onto 0..span-1 with a per-element span."""
+    return (draw % span.astype(np.uint64)).astype(np.int64)
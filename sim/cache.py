@@ -0,0 +1,152 @@
+"""Opt-in LRU cache of match results for replay and what-if tooling.
+
+`simulate_match` is a pure function of both wrestlers' IDs, stats, and
+alignments, the match type, the seed, and the RNG backend, so identical
+calls can reuse one result. Keys pack each wrestler's stats into a single int, which keeps
+them small and lets separate roster copies with equal stats (ledger forks,
+replays) share entries.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Mapping, NamedTuple, Set, Tuple
+
+from domain.models import Match, MatchResult, Wrestler
+from sim.engine import apply_result, simulate_match
+from sim.rng import RNG, RandomSource
+from sim.rules import CompiledRules, compiled_rules, pack_profile
+
+CacheKey = Tuple[str, str, int, int, str, int, Hashable]
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss/eviction counters and current size, like `lru_cache`'s."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ResultCache:
+    """Bounded LRU cache in front of `simulate_match`.
+
+    Keys include the stats each result was computed from, so a changed
+    wrestler can never get a stale hit. Applying a result through
+    `apply_result` also drops every entry for its two wrestlers, since their
+    old stats rarely recur; a per-wrestler key index keeps that proportional
+    to the entries dropped rather than the cache size. Keys name the match
+    type rather than its rules, so entries for a type are dropped the first
+    time it is simulated after being re-registered.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        """Create an empty cache holding at most `maxsize` results."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, MatchResult] = OrderedDict()
+        self._by_wrestler: Dict[str, Set[CacheKey]] = {}
+        self._rules: Dict[str, CompiledRules] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def simulate(
+        self,
+        match: Match,
+        roster: Mapping[str, Wrestler],
+        seed: int,
+        rng_factory: Callable[[int], RandomSource] = RNG,
+    ) -> MatchResult:
+        """Return the cached result for these inputs, simulating on a miss.
+
+        Drop-in replacement for `simulate_match` with the same arguments.
+        """
+        rules = compiled_rules(match.match_type)
+        if self._rules.get(match.match_type) is not rules:
+            self._drop_match_type(match.match_type)
+            self._rules[match.match_type] = rules
+        wrestler_a = roster[match.wrestler_a_id]
+        wrestler_b = roster[match.wrestler_b_id]
+        key = (
+            wrestler_a.id,
+            wrestler_b.id,
+            pack_profile(wrestler_a.popularity, wrestler_a.stamina, wrestler_a.alignment),
+            pack_profile(wrestler_b.popularity, wrestler_b.stamina, wrestler_b.alignment),
+            match.match_type,
+            seed,
+            rng_factory,
+        )
+        entries = self._entries
+        result = entries.get(key)
+        if result is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = simulate_match(match, roster, seed, rng_factory)
+        entries[key] = result
+        by_wrestler = self._by_wrestler
+        by_wrestler.setdefault(wrestler_a.id, set()).add(key)
+        by_wrestler.setdefault(wrestler_b.id, set()).add(key)
+        if len(entries) > self.maxsize:
+            oldest, _ = entries.popitem(last=False)
+            self._unindex(oldest)
+            self.evictions += 1
+        return result
+
+    def apply_result(self, roster: Dict[str, Wrestler], result: MatchResult) -> None:
+        """Apply a result to the roster and invalidate both wrestlers' entries."""
+        apply_result(roster, result)
+        self.invalidate(result.winner_id)
+        self.invalidate(result.loser_id)
+
+    def invalidate(self, wrestler_id: str) -> int:
+        """Drop every entry involving a wrestler and return how many were dropped."""
+        keys = self._by_wrestler.pop(wrestler_id, None)
+        if not keys:
+            return 0
+        entries = self._entries
+        for key in keys:
+            del entries[key]
+            other = key[1] if key[0] == wrestler_id else key[0]
+            others = self._by_wrestler.get(other)
+            if others is not None:
+                others.discard(key)
+                if not others:
+                    del self._by_wrestler[other]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._by_wrestler.clear()
+        self._rules.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current counters and size."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def _drop_match_type(self, match_type: str) -> None:
+        """Remove every entry computed under a match type's previous rules."""
+        stale = [key for key in self._entries if key[4] == match_type]
+        for key in stale:
+            del self._entries[key]
+            self._unindex(key)
+
+    def _unindex(self, key: CacheKey) -> None:
+        """Remove an evicted key from both wrestlers' index sets."""
+        for wrestler_id in key[:2]:
+            keys = self._by_wrestler.get(wrestler_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_wrestler[wrestler_id]
+
@@ -0,0 +1,215 @@
+"""Whole-card simulation with deltas committed once at the end.
+
+`simulate_card` runs a card's matches in order against a copy-on-write
+overlay of the roster: only participants are copied, each match sees the
+stats left by earlier matches, and the live roster is untouched until
+`apply_card` commits the net deltas in a single pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List
+
+from domain.booking import is_valid_booking
+from domain.models import (
+    Card,
+    CardMatch,
+    CardMatchResult,
+    CardResult,
+    Match,
+    StatDelta,
+    TeamMatch,
+    TeamMatchResult,
+    Wrestler,
+    clamp_stat,
+)
+from sim.engine import simulate_match
+from sim.rng import RNG, RandomSource
+from sim.rules import compiled_rules, pack_profile
+
+
+class CardRoster(Mapping):
+    """Copy-on-write roster view used while a card is simulated.
+
+    Reads fall through to the base roster until a wrestler's stats change;
+    the first change copies that one wrestler into the overlay.
+    """
+    __slots__ = ("base", "touched")
+
+    def __init__(self, base: Mapping[str, Wrestler]) -> None:
+        """Wrap a base roster without copying it."""
+        self.base = base
+        self.touched: Dict[str, Wrestler] = {}
+
+    def __getitem__(self, wrestler_id: str) -> Wrestler:
+        """Return the overlay copy if one exists, else the base wrestler."""
+        wrestler = self.touched.get(wrestler_id)
+        return wrestler if wrestler is not None else self.base[wrestler_id]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate base roster IDs."""
+        return iter(self.base)
+
+    def __len__(self) -> int:
+        """Return the base roster size."""
+        return len(self.base)
+
+    def apply_result(self, result: CardMatchResult) -> None:
+        """Apply a match's clamped deltas to overlay copies of its participants."""
+        if isinstance(result, TeamMatchResult):
+            changes = [(wrestler_id, result.winner_delta) for wrestler_id in result.winners]
+            changes += [(wrestler_id, result.loser_delta) for wrestler_id in result.losers]
+        else:
+            changes = [
+                (result.winner_id, result.winner_delta),
+                (result.loser_id, result.loser_delta),
+            ]
+        touched = self.touched
+        for wrestler_id, delta in changes:
+            wrestler = touched.get(wrestler_id)
+            if wrestler is None:
+                source = self.base[wrestler_id]
+                wrestler = Wrestler(
+                    source.id, source.name, source.alignment, source.popularity, source.stamina
+                )
+                touched[wrestler_id] = wrestler
+            wrestler.popularity = clamp_stat(wrestler.popularity + delta.popularity)
+            wrestler.stamina = clamp_stat(wrestler.stamina + delta.stamina)
+
+    def net_deltas(self) -> Dict[str, StatDelta]:
+        """Return each touched wrestler's total change from the base roster."""
+        deltas = {}
+        for wrestler_id, wrestler in self.touched.items():
+            source = self.base[wrestler_id]
+            deltas[wrestler_id] = StatDelta(
+                popularity=wrestler.popularity - source.popularity,
+                stamina=wrestler.stamina - source.stamina,
+            )
+        return deltas
+
+
+def simulate_team_match(
+    match: TeamMatch,
+    roster: Mapping[str, Wrestler],
+    seed: int,
+    rng_factory: Callable[[int], RandomSource] = RNG,
+) -> TeamMatchResult:
+    """Simulate a tag or multi-person match and return a deterministic result.
+
+    Follows `simulate_match` under the match type's compiled rules: each
+    side's weight is its members' average of table weight + jitter, the
+    winning side is a weighted roll, and the rating blends everyone's
+    popularity with every member's rating modifiers and one pairing
+    adjustment. Two wrestlers use their ordered alignment pair; a larger
+    field counts as Face vs Heel when alignments are mixed, otherwise as the
+    shared alignment against itself. A two-sided match of one wrestler each
+    therefore reproduces `simulate_match` exactly.
+    """
+    rules = compiled_rules(match.match_type)
+    rng = rng_factory(seed)
+    sides = [[roster[wrestler_id] for wrestler_id in side] for side in match.sides]
+    jitter = rules.weight_jitter
+    weights: List[int] = []
+    for side in sides:
+        total = 0
+        for wrestler in side:
+            key = pack_profile(wrestler.popularity, wrestler.stamina, wrestler.alignment)
+            total += rules.weight[key] + rng.randint(-jitter, jitter)
+        weights.append(max(1, total // len(side)))
+    roll = rng.randint(1, max(1, sum(weights)))
+    winner_side = len(weights) - 1
+    for index, weight in enumerate(weights):
+        if roll <= weight:
+            winner_side = index
+            break
+        roll -= weight
+
+    everyone = [wrestler for side in sides for wrestler in side]
+    base = sum(wrestler.popularity for wrestler in everyone) / len(everyone)
+    modifiers = rules.pairing[_pairing_index(everyone)] + sum(
+        rules.rating[pack_profile(wrestler.popularity, wrestler.stamina, wrestler.alignment)]
+        for wrestler in everyone
+    )
+    variance = rng.randint(-rules.rating_variance, rules.rating_variance)
+    rating = clamp_stat(int(base + modifiers + variance))
+    stamina_loss = rules.stamina_loss_base + rng.randint(0, rules.stamina_loss_spread)
+
+    return TeamMatchResult(
+        winners=match.sides[winner_side],
+        losers=tuple(
+            wrestler_id
+            for index, side in enumerate(match.sides)
+            if index != winner_side
+            for wrestler_id in side
+        ),
+        rating=rating,
+        winner_delta=StatDelta(popularity=rules.winner_popularity, stamina=-stamina_loss),
+        loser_delta=StatDelta(popularity=rules.loser_popularity, stamina=-stamina_loss),
+    )
+
+
+def _pairing_index(everyone: List[Wrestler]) -> int:
+    """Return the compiled `pairing` index for a match's participants."""
+    faces = [wrestler.alignment == "Face" for wrestler in everyone]
+    if len(faces) == 2:
+        return faces[0] << 1 | faces[1]
+    if len(set(faces)) > 1:
+        return 0b10
+    return 0b11 if faces[0] else 0b00
+
+
+def simulate_card(
+    card: Card,
+    roster: Mapping[str, Wrestler],
+    seed: int,
+    rng_factory: Callable[[int], RandomSource] = RNG,
+) -> CardResult:
+    """Simulate every match on a card in order without mutating the roster.
+
+    Match i uses seed + i, so a card of singles matches gives the same
+    results as booking them one at a time from `seed`.
+    """
+    overlay = CardRoster(roster)
+    results: List[CardMatchResult] = []
+    for offset, match in enumerate(card.matches):
+        result = _simulate_entry(match, overlay, seed + offset, rng_factory)
+        overlay.apply_result(result)
+        results.append(result)
+    return CardResult(results=tuple(results), deltas=overlay.net_deltas())
+
+
+def apply_card(roster: Dict[str, Wrestler], result: CardResult) -> None:
+    """Commit a card's net deltas to the roster in one pass."""
+    for wrestler_id, delta in result.deltas.items():
+        wrestler = roster[wrestler_id]
+        wrestler.popularity = clamp_stat(wrestler.popularity + delta.popularity)
+        wrestler.stamina = clamp_stat(wrestler.stamina + delta.stamina)
+
+
+def is_valid_card(card: Card, roster: Mapping[str, Wrestler]) -> bool:
+    """Return True when a card has matches and every participant is on the roster."""
+    if not card.matches:
+        return False
+    for match in card.matches:
+        if isinstance(match, Match):
+            if not is_valid_booking(match.wrestler_a_id, match.wrestler_b_id):
+                return False
+            ids = (match.wrestler_a_id, match.wrestler_b_id)
+        else:
+            ids = match.wrestler_ids
+        if any(wrestler_id not in roster for wrestler_id in ids):
+            return False
+    return True
+
+
+def _simulate_entry(
+    match: CardMatch,
+    roster: CardRoster,
+    seed: int,
+    rng_factory: Callable[[int], RandomSource],
+) -> CardMatchResult:
+    """Dispatch one card entry to the singles or team engine."""
+    if isinstance(match, TeamMatch):
+        return simulate_team_match(match, roster, seed, rng_factory)
+    return simulate_match(match, roster, seed, rng_factory)
@@ -2,58 +2,64 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict
 
 from domain.models import Match, MatchResult, StatDelta, Wrestler, clamp_stat
-from sim.rng import RNG
+from sim.rng import RNG, RandomSource
+from sim.rules import STAT_BITS, compiled_rules
 
 
-def simulate_match(match: Match, roster: Dict[str, Wrestler], seed: int) -> MatchResult:
+def simulate_match(
+    match: Match,
+    roster: Dict[str, Wrestler],
+    seed: int,
+    rng_factory: Callable[[int], RandomSource] = RNG,
+) -> MatchResult:
     """Simulate a match and return a deterministic MatchResult.
 
     Inputs:
-    - match: the booked pairing by wrestler IDs.
+    - match: the booked pairing by wrestler IDs and its match type.
     - roster: lookup table for stats used in weighting and rating.
     - seed: RNG seed to make outcomes reproducible.
+    - rng_factory: RNG backend; pass CounterRNG for counter-based streams.
+
+    Modifiers come from the match type's compiled tables in `sim.rules`, so
+    each match costs the same few lookups however many modifiers apply.
     """
-    rng = RNG(seed)
+    rules = compiled_rules(match.match_type)
+    rng = rng_factory(seed)
     wrestler_a = roster[match.wrestler_a_id]
     wrestler_b = roster[match.wrestler_b_id]
+    face_a = wrestler_a.alignment == "Face"
+    face_b = wrestler_b.alignment == "Face"
+    # Inlined sim.rules.pack_profile.
+    key_a = wrestler_a.popularity | wrestler_a.stamina << STAT_BITS | face_a << 2 * STAT_BITS
+    key_b = wrestler_b.popularity | wrestler_b.stamina << STAT_BITS | face_b << 2 * STAT_BITS
 
     # Weight outcome by core stats with a small randomness band.
-    a_weight = wrestler_a.popularity + wrestler_a.stamina + rng.randint(-5, 5)
-    b_weight = wrestler_b.popularity + wrestler_b.stamina + rng.randint(-5, 5)
+    jitter = rules.weight_jitter
+    a_weight = rules.weight[key_a] + rng.randint(-jitter, jitter)
+    b_weight = rules.weight[key_b] + rng.randint(-jitter, jitter)
     winner_id = rng.weighted_choice(
         wrestler_a.id, max(1, a_weight), wrestler_b.id, max(1, b_weight)
     )
     loser_id = wrestler_b.id if winner_id == wrestler_a.id else wrestler_a.id
 
-    # Rating blends popularity with alignment bonus and stamina penalties.
+    # Rating blends popularity with the alignment and per-wrestler modifiers.
     base = (wrestler_a.popularity + wrestler_b.popularity) / 2
-    bonus = 5 if wrestler_a.alignment != wrestler_b.alignment else 0
-    penalty = 0
-    if wrestler_a.stamina < 40:
-        penalty -= 5
-    if wrestler_b.stamina < 40:
-        penalty -= 5
-    variance = rng.randint(-5, 5)
-    rating = clamp_stat(int(base + bonus + penalty + variance))
+    modifiers = rules.pairing[face_a << 1 | face_b] + rules.rating[key_a] + rules.rating[key_b]
+    variance = rng.randint(-rules.rating_variance, rules.rating_variance)
+    rating = clamp_stat(int(base + modifiers + variance))
 
     # Apply small, bounded deltas so results feel meaningful but stable.
-    winner_popularity = 3
-    loser_popularity = -1
-    stamina_loss = 8 + rng.randint(0, 4)
-
-    deltas = {
-        winner_id: StatDelta(popularity=winner_popularity, stamina=-stamina_loss),
-        loser_id: StatDelta(popularity=loser_popularity, stamina=-stamina_loss),
-    }
+    stamina_loss = rules.stamina_loss_base + rng.randint(0, rules.stamina_loss_spread)
 
     return MatchResult(
         winner_id=winner_id,
         loser_id=loser_id,
         rating=rating,
-        deltas=deltas,
+        winner_delta=StatDelta(popularity=rules.winner_popularity, stamina=-stamina_loss),
+        loser_delta=StatDelta(popularity=rules.loser_popularity, stamina=-stamina_loss),
     )
 
 
@@ -62,7 +68,10 @@ def apply_result(roster: Dict[str, Wrestler], result: MatchResult) -> None:
 
     This mutates the roster in-place to reflect post-match stat changes.
     """
-    for wrestler_id, delta in result.deltas.items():
+    for wrestler_id, delta in (
+        (result.winner_id, result.winner_delta),
+        (result.loser_id, result.loser_delta),
+    ):
         wrestler = roster[wrestler_id]
         wrestler.popularity = clamp_stat(wrestler.popularity + delta.popularity)
         wrestler.stamina = clamp_stat(wrestler.stamina + delta.stamina)
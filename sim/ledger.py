@@ -0,0 +1,199 @@
+"""Event-sourced roster ledger with checkpoints, undo/redo, and forks."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
+
+from domain.models import Match, MatchResult, Wrestler, clamp_stat
+from sim.engine import apply_result
+
+# (popularity column, stamina column) in ledger row order, one byte per stat.
+_Checkpoint = Tuple[bytes, bytes]
+
+
+class LedgerObserver(Protocol):
+    """Receives results as the ledger applies and undoes them."""
+
+    def record(self, result: MatchResult) -> None:
+        """Called after a result is applied or redone."""
+
+    def revert(self, result: MatchResult) -> None:
+        """Called after a result is undone."""
+
+
+class RosterLedger:
+    """Records every applied result so past roster states can be rebuilt.
+
+    The ledger owns mutation of a live roster: `apply` runs `apply_result` and
+    appends the result to an event log. Every `checkpoint_every` events it
+    stores a compact copy of all stats, so the roster at any match number is a
+    binary search for the nearest checkpoint plus a short replay. Undo/redo
+    move a head pointer over the log; applying a new result after an undo
+    discards the redo tail. Subscribed observers (e.g. `RosterAnalytics`) see
+    each apply, undo, and redo once the live roster reflects it.
+    """
+
+    def __init__(self, roster: Dict[str, Wrestler], checkpoint_every: int = 256) -> None:
+        """Start a ledger at the roster's current state (match number 0)."""
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be positive")
+        self.roster = roster
+        self.checkpoint_every = checkpoint_every
+        self._ids = list(roster)
+        self._rows = {wrestler_id: row for row, wrestler_id in enumerate(self._ids)}
+        self._events: List[MatchResult] = []
+        self._bookings: List[Optional[Match]] = []
+        self._head = 0
+        self._checkpoint_at: List[int] = [0]
+        self._checkpoints: List[_Checkpoint] = [self._capture()]
+        self._observers: List[LedgerObserver] = []
+
+    @property
+    def match_count(self) -> int:
+        """Return how many results are currently applied."""
+        return self._head
+
+    @property
+    def can_undo(self) -> bool:
+        """Return True when there is a result to undo."""
+        return self._head > 0
+
+    @property
+    def can_redo(self) -> bool:
+        """Return True when an undone result can be reapplied."""
+        return self._head < len(self._events)
+
+    def event(self, match_number: int) -> MatchResult:
+        """Return the result applied as match `match_number` (1-based)."""
+        if not 1 <= match_number <= self._head:
+            raise IndexError(match_number)
+        return self._events[match_number - 1]
+
+    def booking(self, match_number: int) -> Optional[Match]:
+        """Return the booking recorded with match `match_number`, if one was given."""
+        if not 1 <= match_number <= self._head:
+            raise IndexError(match_number)
+        return self._bookings[match_number - 1]
+
+    def subscribe(self, observer: LedgerObserver) -> Callable[[], None]:
+        """Register an observer for applied and undone results; returns an unsubscribe."""
+        self._observers.append(observer)
+        return lambda: self._observers.remove(observer)
+
+    def apply(self, result: MatchResult, match: Optional[Match] = None) -> None:
+        """Apply a result to the live roster and record it with its booking."""
+        if self._head < len(self._events):
+            del self._events[self._head :]
+            del self._bookings[self._head :]
+            keep = bisect_right(self._checkpoint_at, self._head)
+            del self._checkpoint_at[keep:]
+            del self._checkpoints[keep:]
+        apply_result(self.roster, result)
+        self._events.append(result)
+        self._bookings.append(match)
+        self._head += 1
+        if self._head % self.checkpoint_every == 0:
+            self._checkpoint_at.append(self._head)
+            self._checkpoints.append(self._capture())
+        for observer in self._observers:
+            observer.record(result)
+
+    def undo(self) -> Optional[MatchResult]:
+        """Roll the live roster back one result and return it, if any."""
+        if not self.can_undo:
+            return None
+        self._head -= 1
+        self._restore(self._head)
+        result = self._events[self._head]
+        for observer in self._observers:
+            observer.revert(result)
+        return result
+
+    def redo(self) -> Optional[MatchResult]:
+        """Reapply the most recently undone result and return it, if any."""
+        if not self.can_redo:
+            return None
+        result = self._events[self._head]
+        apply_result(self.roster, result)
+        self._head += 1
+        for observer in self._observers:
+            observer.record(result)
+        return result
+
+    def stats_at(self, match_number: int) -> Dict[str, Tuple[int, int]]:
+        """Return {id: (popularity, stamina)} after `match_number` results."""
+        popularity, stamina = self._replay(match_number)
+        return {
+            wrestler_id: (popularity[row], stamina[row])
+            for row, wrestler_id in enumerate(self._ids)
+        }
+
+    def roster_at(self, match_number: int) -> Dict[str, Wrestler]:
+        """Return a detached roster as it stood after `match_number` results."""
+        popularity, stamina = self._replay(match_number)
+        return {
+            wrestler_id: Wrestler(
+                wrestler_id,
+                self.roster[wrestler_id].name,
+                self.roster[wrestler_id].alignment,
+                popularity[row],
+                stamina[row],
+            )
+            for row, wrestler_id in enumerate(self._ids)
+        }
+
+    def fork(self, match_number: Optional[int] = None) -> RosterLedger:
+        """Branch a new ledger from `match_number` (default: now) for what-ifs.
+
+        The fork gets its own roster copy and shares the immutable checkpoints
+        up to the branch point; nothing is replayed beyond the last checkpoint.
+        Observers are not carried over.
+        """
+        at = self._head if match_number is None else match_number
+        fork = RosterLedger.__new__(RosterLedger)
+        fork.roster = self.roster_at(at)
+        fork.checkpoint_every = self.checkpoint_every
+        fork._ids = self._ids
+        fork._rows = self._rows
+        fork._events = self._events[:at]
+        fork._bookings = self._bookings[:at]
+        fork._head = at
+        keep = bisect_right(self._checkpoint_at, at)
+        fork._checkpoint_at = self._checkpoint_at[:keep]
+        fork._checkpoints = self._checkpoints[:keep]
+        fork._observers = []
+        return fork
+
+    def _capture(self) -> _Checkpoint:
+        """Copy the live roster stats into a checkpoint."""
+        wrestlers = [self.roster[wrestler_id] for wrestler_id in self._ids]
+        return (
+            bytes(wrestler.popularity for wrestler in wrestlers),
+            bytes(wrestler.stamina for wrestler in wrestlers),
+        )
+
+    def _replay(self, match_number: int) -> Tuple[bytearray, bytearray]:
+        """Rebuild stat columns after `match_number` events from a checkpoint."""
+        if not 0 <= match_number <= self._head:
+            raise IndexError(match_number)
+        slot = bisect_right(self._checkpoint_at, match_number) - 1
+        popularity, stamina = (bytearray(column) for column in self._checkpoints[slot])
+        rows = self._rows
+        for result in self._events[self._checkpoint_at[slot] : match_number]:
+            for wrestler_id, delta in (
+                (result.winner_id, result.winner_delta),
+                (result.loser_id, result.loser_delta),
+            ):
+                row = rows[wrestler_id]
+                popularity[row] = clamp_stat(popularity[row] + delta.popularity)
+                stamina[row] = clamp_stat(stamina[row] + delta.stamina)
+        return popularity, stamina
+
+    def _restore(self, match_number: int) -> None:
+        """Write reconstructed stats back into the live roster."""
+        popularity, stamina = self._replay(match_number)
+        for row, wrestler_id in enumerate(self._ids):
+            wrestler = self.roster[wrestler_id]
+            wrestler.popularity = popularity[row]
+            wrestler.stamina = stamina[row]
@@ -0,0 +1,248 @@
+"""Opt-in counters and latency histograms for simulation hot paths.
+
+Nothing here runs unless `install` is called: it swaps `simulate_match`,
+`apply_result`, and the RNG draw methods for timed wrappers (including any
+references other modules imported by name), and `uninstall` puts the
+originals back. With instrumentation off the hot paths are the plain
+functions, so there is no per-call cost.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds: 1us .. ~10s, four per decade.
+BUCKETS: Tuple[float, ...] = tuple(10 ** (exponent / 4) * 1e-6 for exponent in range(29))
+
+LabelKey = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, LabelKey]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (seconds)."""
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        """Create an empty histogram over BUCKETS plus an overflow bucket."""
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Return the bucket upper bound containing quantile q (0-1)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """Named counters and histograms with optional string labels.
+
+    Export with `snapshot` (plain dict), `to_json`, or `to_prometheus`;
+    `write` picks JSON for `.json` paths and Prometheus text otherwise.
+    """
+
+    def __init__(self, prefix: str = "wrestlegm") -> None:
+        """Create an empty registry; `prefix` namespaces Prometheus names."""
+        self.prefix = prefix
+        self.counters: Dict[MetricKey, int] = {}
+        self.histograms: Dict[MetricKey, Histogram] = {}
+
+    def increment(
+        self, name: str, amount: int = 1, labels: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """Add to a counter."""
+        key = (name, _label_key(labels))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(
+        self, name: str, seconds: float, labels: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """Record a latency observation in a histogram."""
+        key = (name, _label_key(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str, labels: Optional[Mapping[str, str]] = None) -> Iterator[None]:
+        """Time a block into a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, labels)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, List[Dict[str, object]]]:
+        """Return all metrics as plain data suitable for JSON."""
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ],
+            "histograms": [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": histogram.total,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": _cumulative(histogram),
+                }
+                for (name, labels), histogram in sorted(self.histograms.items())
+            ],
+        }
+
+    def to_json(self) -> str:
+        """Return the snapshot as JSON text."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Return metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name in sorted({name for name, _ in self.counters}):
+            metric = f"{self.prefix}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (counter_name, labels), value in sorted(self.counters.items()):
+                if counter_name == name:
+                    lines.append(f"{metric}{_format_labels(labels)} {value}")
+        for name in sorted({name for name, _ in self.histograms}):
+            metric = f"{self.prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for (histogram_name, labels), histogram in sorted(self.histograms.items()):
+                if histogram_name != name:
+                    continue
+                for bound, count in _cumulative(histogram).items():
+                    bucket_labels = labels + (("le", bound),)
+                    lines.append(f"{metric}_bucket{_format_labels(bucket_labels)} {count}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.total!r}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write a JSON (`.json`) or Prometheus text dump to path."""
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+
+
+# Originals replaced by `install`, as (owner, attribute, original) triples.
+_patches: List[Tuple[object, str, object]] = []
+
+
+def install(registry: MetricsRegistry) -> None:
+    """Instrument simulate_match, apply_result, and RNG draws into registry.
+
+    Module-level references created with `from sim.engine import ...` are
+    rebound too, so call this after the app's modules are imported.
+    """
+    if _patches:
+        raise RuntimeError("metrics are already installed; call uninstall() first")
+    from sim import engine, rng
+
+    for name in ("simulate_match", "apply_result"):
+        original = getattr(engine, name)
+        wrapper = _timed(registry, name, original)
+        for module in list(sys.modules.values()):
+            if getattr(module, name, None) is original:
+                _patch(module, name, wrapper)
+    for cls in (rng.RNG, rng.CounterRNG):
+        for method in ("randint", "weighted_choice", "shuffle"):
+            _patch(cls, method, _counted(registry, cls.__name__, method, getattr(cls, method)))
+
+
+def uninstall() -> None:
+    """Restore every function patched by `install`."""
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+
+
+def installed() -> bool:
+    """Return True while instrumentation is active."""
+    return bool(_patches)
+
+
+def _patch(owner: object, attribute: str, replacement: object) -> None:
+    """Replace an attribute and remember the original."""
+    _patches.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, replacement)
+
+
+def _timed(registry: MetricsRegistry, name: str, func: Callable) -> Callable:
+    """Wrap func to count calls and time them into a histogram."""
+    counters = registry.counters
+    key = (f"{name}_calls", ())
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.observe(name, time.perf_counter() - start)
+            counters[key] = counters.get(key, 0) + 1
+
+    return wrapper
+
+
+def _counted(registry: MetricsRegistry, backend: str, method: str, func: Callable) -> Callable:
+    """Wrap an RNG method to count calls per backend and method."""
+    counters = registry.counters
+    key = ("rng_calls", (("backend", backend), ("method", method)))
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        counters[key] = counters.get(key, 0) + 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _label_key(labels: Optional[Mapping[str, str]]) -> LabelKey:
+    """Return a hashable, ordered form of labels."""
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _format_labels(labels: LabelKey) -> str:
+    """Render labels as `{a="x",b="y"}`, or nothing when empty."""
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{value}"' for key, value in labels)
+    return "{" + body + "}"
+
+
+def _cumulative(histogram: Histogram) -> Dict[str, int]:
+    """Return Prometheus-style cumulative bucket counts keyed by `le`."""
+    buckets: Dict[str, int] = {}
+    seen = 0
+    for bound, count in zip(BUCKETS, histogram.counts):
+        seen += count
+        buckets[f"{bound:.3g}"] = seen
+    buckets["+Inf"] = histogram.count
+    return buckets
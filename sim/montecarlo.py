@@ -0,0 +1,169 @@
+"""Monte Carlo win-probability and rating-distribution estimates."""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.models import Match, Wrestler
+from sim.engine import simulate_match
+from sim.rules import compiled_rules, install_rules, portable_rules
+
+
+@dataclass(frozen=True)
+class OddsEstimate:
+    """Aggregated outcome of N seeded replicas of a single pairing.
+
+    Win probability is for wrestler A of the match. Intervals are two-sided at
+    the requested confidence level. The histogram has one bucket per rating 0-100.
+    """
+    samples: int
+    win_probability: float
+    win_interval: Tuple[float, float]
+    mean_rating: float
+    rating_interval: Tuple[float, float]
+    rating_histogram: Tuple[int, ...]
+
+
+@dataclass
+class _Tally:
+    """Running sums for a run of replicas."""
+    samples: int = 0
+    wins: int = 0
+    rating_sum: int = 0
+    rating_sq_sum: int = 0
+    histogram: Optional[List[int]] = None
+
+    def merge(self, other: _Tally) -> None:
+        """Fold another tally into this one."""
+        self.samples += other.samples
+        self.wins += other.wins
+        self.rating_sum += other.rating_sum
+        self.rating_sq_sum += other.rating_sq_sum
+        if self.histogram is None:
+            self.histogram = [0] * 101
+        for rating, count in enumerate(other.histogram or ()):
+            self.histogram[rating] += count
+
+
+def estimate_odds(
+    match: Match,
+    roster: Dict[str, Wrestler],
+    samples: int = 10000,
+    seed: int = 0,
+    tolerance: Optional[float] = 0.01,
+    confidence: float = 0.95,
+    chunk_size: int = 1000,
+    workers: Optional[int] = None,
+    parallel_threshold: int = 50000,
+) -> OddsEstimate:
+    """Run up to `samples` seeded replicas of a match and summarize them.
+
+    Replica i uses seed + i, the same sequence the app walks through. Chunks are
+    folded in order and the run stops once the win-probability interval is
+    within +/- tolerance (pass None to always run every sample). Runs of at
+    least `parallel_threshold` samples are spread across a process pool unless
+    workers is 1; workers receive the parent's compiled rules for the match
+    type, so results are identical to a serial run.
+    """
+    if samples < 1:
+        raise ValueError("samples must be positive")
+    pairing = {
+        match.wrestler_a_id: roster[match.wrestler_a_id],
+        match.wrestler_b_id: roster[match.wrestler_b_id],
+    }
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    starts = range(seed, seed + samples, chunk_size)
+    spans = [(start, min(chunk_size, seed + samples - start)) for start in starts]
+
+    total = _Tally()
+    if samples >= parallel_threshold and workers != 1:
+        max_workers = workers or os.cpu_count() or 1
+        rules = (portable_rules(compiled_rules(match.match_type)),)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=install_rules, initargs=(rules,)
+        ) as pool:
+            tallies = _parallel_tallies(pool, 2 * max_workers, match, pairing, spans)
+            for tally in tallies:
+                total.merge(tally)
+                if _converged(total, z, tolerance):
+                    break
+            # Cancel chunks that are still queued once the estimate converges.
+            tallies.close()
+    else:
+        for start, count in spans:
+            total.merge(_run_chunk(match, pairing, start, count))
+            if _converged(total, z, tolerance):
+                break
+    return _summarize(total, z)
+
+
+def _parallel_tallies(
+    pool: ProcessPoolExecutor,
+    wave: int,
+    match: Match,
+    pairing: Dict[str, Wrestler],
+    spans: List[Tuple[int, int]],
+) -> Iterator[_Tally]:
+    """Yield chunk tallies in order, keeping one wave of chunks in flight."""
+    for offset in range(0, len(spans), wave):
+        futures = [
+            pool.submit(_run_chunk, match, pairing, start, count)
+            for start, count in spans[offset : offset + wave]
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _run_chunk(match: Match, pairing: Dict[str, Wrestler], start: int, count: int) -> _Tally:
+    """Simulate replicas start..start+count-1 and tally the outcomes."""
+    tally = _Tally(histogram=[0] * 101)
+    for seed in range(start, start + count):
+        result = simulate_match(match, pairing, seed)
+        tally.wins += result.winner_id == match.wrestler_a_id
+        tally.rating_sum += result.rating
+        tally.rating_sq_sum += result.rating * result.rating
+        tally.histogram[result.rating] += 1
+    tally.samples = count
+    return tally
+
+
+def _wilson_interval(wins: int, samples: int, z: float) -> Tuple[float, float]:
+    """Return the Wilson score interval for a binomial proportion."""
+    p = wins / samples
+    denom = 1 + z * z / samples
+    centre = (p + z * z / (2 * samples)) / denom
+    half = z * math.sqrt(p * (1 - p) / samples + z * z / (4 * samples * samples)) / denom
+    return (max(0.0, centre - half), min(1.0, centre + half))
+
+
+def _converged(tally: _Tally, z: float, tolerance: Optional[float]) -> bool:
+    """Return True once the win interval half-width is within tolerance."""
+    if tolerance is None:
+        return False
+    low, high = _wilson_interval(tally.wins, tally.samples, z)
+    return (high - low) / 2 <= tolerance
+
+
+def _summarize(tally: _Tally, z: float) -> OddsEstimate:
+    """Convert running sums into an OddsEstimate."""
+    n = tally.samples
+    mean = tally.rating_sum / n
+    variance = max(0.0, tally.rating_sq_sum / n - mean * mean)
+    half = z * math.sqrt(variance / n)
+    return OddsEstimate(
+        samples=n,
+        win_probability=tally.wins / n,
+        win_interval=_wilson_interval(tally.wins, n, z),
+        mean_rating=mean,
+        rating_interval=(mean - half, mean + half),
+        rating_histogram=tuple(tally.histogram or [0] * 101),
+    )
@@ -0,0 +1,208 @@
+"""Beam-search card optimizer over exact expected ratings.
+
+Every eligible pairing is scored with the expected rating from
+`sim.outcomes.outcome_table` (exact under the engine rules). Scores are cached
+per pair of stat profiles, and large batches of new profile pairs are scored
+on a process pool; workers receive the parent's compiled Singles tables, so
+runtime-registered modifiers apply under any start method. A beam search then
+picks disjoint pairings that maximize the card's total expected rating under
+the booking constraints.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from domain.booking import is_valid_booking
+from domain.models import DEFAULT_MATCH_TYPE, Match, Wrestler
+from sim.outcomes import TABLE_CACHE_SIZE, Profile, outcome_table, profile
+from sim.rules import compiled_rules, install_rules, on_rules_changed, portable_rules
+
+ProfilePair = Tuple[Profile, Profile]
+
+# Expected rating per unordered profile pair, shared across optimizer runs.
+_rating_cache: Dict[ProfilePair, float] = {}
+
+
+@dataclass(frozen=True)
+class BookingConstraints:
+    """Rules every optimized card must satisfy.
+
+    Each wrestler appears at most once. `max_same_alignment` caps how many
+    matches may pair two Faces or two Heels (0 means every match is Face vs
+    Heel; None means no limit).
+    """
+    min_stamina: int = 0
+    max_same_alignment: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class OptimizedCard:
+    """Best card found, in booking order, with per-match expected ratings."""
+    matches: Tuple[Match, ...]
+    expected_ratings: Tuple[float, ...]
+    total_expected_rating: float
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    """One eligible pairing with its score."""
+    rating: float
+    a_id: str
+    b_id: str
+    same_alignment: bool
+
+
+@dataclass(frozen=True)
+class _BeamState:
+    """A partial card: chosen candidate indices, used wrestlers, and totals."""
+    total: float
+    chosen: Tuple[int, ...]
+    used: FrozenSet[str]
+    same_alignment: int
+
+
+def optimize_card(
+    roster: Mapping[str, Wrestler],
+    matches: int,
+    constraints: BookingConstraints = BookingConstraints(),
+    beam_width: int = 32,
+    workers: Optional[int] = None,
+    parallel_threshold: int = 5000,
+) -> OptimizedCard:
+    """Pick `matches` disjoint pairings with the highest total expected rating.
+
+    Beam search over pairings sorted by expected rating: each state extends
+    with its next `beam_width` feasible pairings, and the best `beam_width`
+    states by optimistic total survive each round. When at least
+    `parallel_threshold` profile pairs are not yet cached and more than one
+    worker is available, they are scored on a process pool. Raises ValueError
+    when the constraints leave too few eligible wrestlers.
+    """
+    if matches < 1:
+        raise ValueError("matches must be positive")
+    candidates = _candidates(roster, constraints, workers, parallel_threshold)
+    limit = constraints.max_same_alignment
+
+    beam = [_BeamState(0.0, (), frozenset(), 0)]
+    for depth in range(matches):
+        remaining = matches - depth - 1
+        expanded: List[Tuple[float, int, _BeamState]] = []
+        for state in beam:
+            start = state.chosen[-1] + 1 if state.chosen else 0
+            added = 0
+            for index in range(start, len(candidates)):
+                candidate = candidates[index]
+                if candidate.a_id in state.used or candidate.b_id in state.used:
+                    continue
+                same = state.same_alignment + candidate.same_alignment
+                if limit is not None and same > limit:
+                    continue
+                total = state.total + candidate.rating
+                # Later picks come after this index, so none can score higher.
+                bound = total + remaining * candidate.rating
+                child = _BeamState(
+                    total,
+                    state.chosen + (index,),
+                    state.used | {candidate.a_id, candidate.b_id},
+                    same,
+                )
+                expanded.append((bound, len(expanded), child))
+                added += 1
+                if added == beam_width:
+                    break
+        if not expanded:
+            raise ValueError(f"constraints allow at most {depth} matches")
+        beam = [state for _, _, state in heapq.nlargest(beam_width, expanded)]
+
+    best = max(beam, key=lambda state: state.total)
+    chosen = [candidates[index] for index in best.chosen]
+    return OptimizedCard(
+        matches=tuple(Match(candidate.a_id, candidate.b_id) for candidate in chosen),
+        expected_ratings=tuple(candidate.rating for candidate in chosen),
+        total_expected_rating=best.total,
+    )
+
+
+def expected_ratings(
+    pairs: List[ProfilePair], workers: Optional[int] = None, parallel_threshold: int = 5000
+) -> Dict[ProfilePair, float]:
+    """Return expected ratings for profile pairs, filling the shared cache.
+
+    Pairs are unordered; keys in the result are as given.
+    """
+    keys = {pair: _pair_key(pair) for pair in pairs}
+    missing = sorted({key for key in keys.values() if key not in _rating_cache})
+    if missing:
+        if len(_rating_cache) + len(missing) > TABLE_CACHE_SIZE:
+            _rating_cache.clear()
+        max_workers = workers or os.cpu_count() or 1
+        if len(missing) >= parallel_threshold and max_workers > 1:
+            chunk = max(1, len(missing) // (4 * max_workers))
+            rules = (portable_rules(compiled_rules(DEFAULT_MATCH_TYPE)),)
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=install_rules, initargs=(rules,)
+            ) as pool:
+                scores = list(pool.map(_score, missing, chunksize=chunk))
+        else:
+            scores = [_score(key) for key in missing]
+        _rating_cache.update(zip(missing, scores))
+    return {pair: _rating_cache[key] for pair, key in keys.items()}
+
+
+def clear_rating_cache() -> None:
+    """Drop cached pairing scores."""
+    _rating_cache.clear()
+
+
+def _on_rules_changed(name: str) -> None:
+    """Drop cached scores when the Singles rules they were computed under change."""
+    if name == DEFAULT_MATCH_TYPE:
+        clear_rating_cache()
+
+
+on_rules_changed(_on_rules_changed)
+
+
+def _candidates(
+    roster: Mapping[str, Wrestler],
+    constraints: BookingConstraints,
+    workers: Optional[int],
+    parallel_threshold: int,
+) -> List[_Candidate]:
+    """Score every eligible pairing and sort best first (ties by roster order)."""
+    eligible = [
+        wrestler for wrestler in roster.values() if wrestler.stamina >= constraints.min_stamina
+    ]
+    allow_same = constraints.max_same_alignment != 0
+    pairs = []
+    for i, wrestler_a in enumerate(eligible):
+        for wrestler_b in eligible[i + 1 :]:
+            if not is_valid_booking(wrestler_a.id, wrestler_b.id):
+                continue
+            if not allow_same and wrestler_a.alignment == wrestler_b.alignment:
+                continue
+            pairs.append((wrestler_a, wrestler_b))
+    profiles = [(profile(a), profile(b)) for a, b in pairs]
+    scores = expected_ratings(profiles, workers, parallel_threshold)
+    candidates = [
+        _Candidate(scores[key], a.id, b.id, a.alignment == b.alignment)
+        for (a, b), key in zip(pairs, profiles)
+    ]
+    candidates.sort(key=lambda candidate: -candidate.rating)
+    return candidates
+
+
+def _pair_key(pair: ProfilePair) -> ProfilePair:
+    """Return the order-independent cache key for a profile pair."""
+    a, b = pair
+    return (a, b) if a <= b else (b, a)
+
+
+def _score(pair: ProfilePair) -> float:
+    """Return the exact expected rating for a profile pair."""
+    return outcome_table(*pair).expected_rating
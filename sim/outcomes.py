@@ -0,0 +1,92 @@
+"""Exact outcome tables for pairings, enumerated from the engine rules.
+
+The engine's randomness is a handful of small uniform integer rolls, so win
+probability and the rating distribution can be computed exactly instead of
+sampled. Tables are cached per match type and (popularity, stamina, alignment)
+profile pair.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from domain.models import DEFAULT_MATCH_TYPE, Match, Wrestler, clamp_stat
+from sim.rules import CompiledRules, Profile, compiled_rules, on_rules_changed, pack_profile
+
+TABLE_CACHE_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class OutcomeTable:
+    """Exact outcome distribution for wrestler A against wrestler B.
+
+    rating_distribution[r] is the probability of a final rating of r (0-100).
+    """
+    win_probability: float
+    rating_distribution: Tuple[float, ...]
+    expected_rating: float
+    expected_stamina_loss: float
+
+
+def profile(wrestler: Wrestler) -> Profile:
+    """Return the stats tuple that determines a wrestler's outcomes."""
+    return (wrestler.popularity, wrestler.stamina, wrestler.alignment)
+
+
+def pairing_odds(match: Match, roster: Dict[str, Wrestler]) -> OutcomeTable:
+    """Return the cached outcome table for a booked match."""
+    return outcome_table(
+        profile(roster[match.wrestler_a_id]),
+        profile(roster[match.wrestler_b_id]),
+        match.match_type,
+    )
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def outcome_table(
+    a: Profile, b: Profile, match_type: str = DEFAULT_MATCH_TYPE
+) -> OutcomeTable:
+    """Enumerate every roll combination for a pairing of stat profiles.
+
+    Results are LRU-cached by match type name and cleared whenever a match
+    type is registered; use `outcome_table.cache_info()` to inspect hits.
+    """
+    return enumerate_outcomes(a, b, compiled_rules(match_type))
+
+
+def enumerate_outcomes(a: Profile, b: Profile, rules: CompiledRules) -> OutcomeTable:
+    """Build the outcome table for a pairing under already compiled rules (uncached)."""
+    key_a = pack_profile(*a)
+    key_b = pack_profile(*b)
+
+    # Winner: both weight jitters are uniform, then roll 1..total picks A
+    # with probability a_weight / total.
+    jitters = range(-rules.weight_jitter, rules.weight_jitter + 1)
+    win = 0.0
+    for jitter_a in jitters:
+        a_weight = max(1, rules.weight[key_a] + jitter_a)
+        for jitter_b in jitters:
+            b_weight = max(1, rules.weight[key_b] + jitter_b)
+            win += a_weight / (a_weight + b_weight)
+    win /= len(jitters) ** 2
+
+    # Rating depends only on the variance roll.
+    base = (a[0] + b[0]) / 2
+    pairing = (a[2] == "Face") << 1 | (b[2] == "Face")
+    modifiers = rules.pairing[pairing] + rules.rating[key_a] + rules.rating[key_b]
+    variances = range(-rules.rating_variance, rules.rating_variance + 1)
+    distribution = [0.0] * 101
+    for variance in variances:
+        distribution[clamp_stat(int(base + modifiers + variance))] += 1 / len(variances)
+
+    return OutcomeTable(
+        win_probability=win,
+        rating_distribution=tuple(distribution),
+        expected_rating=sum(rating * p for rating, p in enumerate(distribution)),
+        expected_stamina_loss=rules.stamina_loss_base + rules.stamina_loss_spread / 2,
+    )
+
+
+on_rules_changed(lambda name: outcome_table.cache_clear())
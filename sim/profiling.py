@@ -0,0 +1,98 @@
+"""Session profilers: deterministic (cProfile) or low-overhead sampling.
+
+`profile_session` wraps a block (typically the whole app run) and writes the
+result to a file. cProfile output is a `pstats` file for `python -m pstats`
+or snakeviz. The sampler periodically records every thread's stack,
+including simulation workers that cProfile does not see, and writes folded
+stacks ("frame;frame;frame count") for flame-graph tools.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from types import FrameType
+from typing import Iterator, List, Optional
+
+PROFILERS = ("cprofile", "sample")
+
+
+class SamplingProfiler:
+    """Background thread that samples all thread stacks at a fixed interval."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Create a stopped sampler; interval is in seconds."""
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Begin sampling in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def folded(self) -> str:
+        """Return samples in folded-stack format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def write(self, path: str) -> None:
+        """Write folded stacks to path."""
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(self.folded())
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own:
+                    self.samples[_stack(frame)] += 1
+
+
+@contextmanager
+def profile_session(path: str, profiler: str = "cprofile") -> Iterator[None]:
+    """Profile the enclosed block and write the output to path.
+
+    cProfile only traces the thread that enters the block; use the
+    "sample" profiler to see worker threads as well.
+    """
+    if profiler == "cprofile":
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(path)
+    elif profiler == "sample":
+        sampler = SamplingProfiler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write(path)
+    else:
+        raise ValueError(f"unknown profiler {profiler!r}; expected one of {PROFILERS}")
+
+
+def _stack(frame: Optional[FrameType]) -> str:
+    """Render a frame chain root-first as `file:function` entries."""
+    names: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
@@ -1,8 +1,16 @@
-"""Deterministic RNG wrapper for simulation."""
+"""Deterministic RNG wrappers for simulation."""
 
 from __future__ import annotations
 
 import random
+from typing import List, TypeVar, Union
+
+T = TypeVar("T")
+
+MASK64 = (1 << 64) - 1
+SPLITMIX_GAMMA = 0x9E3779B97F4A7C15
+SPLITMIX_MIX_1 = 0xBF58476D1CE4E5B9
+SPLITMIX_MIX_2 = 0x94D049BB133111EB
 
 
 class RNG:
@@ -24,3 +32,76 @@ class RNG:
         total = max(1, a_weight + b_weight)
         roll = self._rng.randint(1, total)
         return a_id if roll <= a_weight else b_id
+
+    def shuffle(self, items: List[T]) -> None:
+        """Shuffle a list in place."""
+        self._rng.shuffle(items)
+
+
+class CounterRNG:
+    """Counter-based RNG with the same interface as RNG.
+
+    Draw n is a SplitMix64 hash of (key, n), so construction is O(1), any draw
+    can be reached without replaying earlier ones, and streams derived with
+    `derive_seed` are independent. `sim.batch` uses the same construction, so
+    `simulate_match(..., rng_factory=CounterRNG)` agrees with `simulate_batch`.
+    """
+    __slots__ = ("_key", "_counter")
+
+    def __init__(self, seed: int, counter: int = 0) -> None:
+        """Create a stream for a seed, optionally skipped ahead by `counter` draws."""
+        self._key = _mix64((seed + SPLITMIX_GAMMA) & MASK64)
+        self._counter = counter
+
+    @classmethod
+    def for_stream(cls, seed: int, *path: int) -> CounterRNG:
+        """Return the stream for a path such as (season, week, match)."""
+        return cls(derive_seed(seed, *path))
+
+    @property
+    def counter(self) -> int:
+        """Return how many draws have been taken."""
+        return self._counter
+
+    def next_u64(self) -> int:
+        """Return the next raw 64-bit draw."""
+        self._counter += 1
+        return _mix64((self._key + self._counter * SPLITMIX_GAMMA) & MASK64)
+
+    def randint(self, low: int, high: int) -> int:
+        """Return a random integer between low and high, inclusive."""
+        return low + self.next_u64() % (high - low + 1)
+
+    def weighted_choice(self, a_id: str, a_weight: int, b_id: str, b_weight: int) -> str:
+        """Pick a_id or b_id based on the provided weights."""
+        total = max(1, a_weight + b_weight)
+        roll = self.randint(1, total)
+        return a_id if roll <= a_weight else b_id
+
+    def shuffle(self, items: List[T]) -> None:
+        """Shuffle a list in place (Fisher-Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randint(0, i)
+            items[i], items[j] = items[j], items[i]
+
+
+RandomSource = Union[RNG, CounterRNG]
+
+
+def derive_seed(seed: int, *path: int) -> int:
+    """Fold a path of integers into a 64-bit seed for an independent stream.
+
+    For example derive_seed(base, season, week, match) names one match's
+    stream directly, so workers can rebuild it without replaying anything.
+    """
+    key = _mix64((seed + SPLITMIX_GAMMA) & MASK64)
+    for part in path:
+        key = _mix64(((key ^ (part & MASK64)) + SPLITMIX_GAMMA) & MASK64)
+    return key
+
+
+def _mix64(z: int) -> int:
+    """Apply the SplitMix64 finalizer to a 64-bit integer."""
+    z = ((z ^ (z >> 30)) * SPLITMIX_MIX_1) & MASK64
+    z = ((z ^ (z >> 27)) * SPLITMIX_MIX_2) & MASK64
+    return z ^ (z >> 31)
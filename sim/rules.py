@@ -0,0 +1,221 @@
+"""Match rules compiled into flat lookup tables per match type.
+
+A match type holds the engine's roll ranges, fixed deltas, and a list of
+modifiers registered by the type itself or by stipulations. A modifier
+adjusts win weight or rating from one wrestler's (popularity, stamina,
+alignment) profile, or adjusts rating from the pair of alignments.
+`compiled_rules` evaluates every modifier over every possible profile once
+and caches the resulting tables. `simulate_match` therefore does the same
+few lookups per match however many modifiers a type has. Modules that cache
+results derived from the rules register an `on_rules_changed` listener so
+re-registering a type drops them too. Process pools ship the parent's
+compiled tables to their workers with `portable_registry` and `install_rules`,
+because a spawned worker only has the built-in types.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from domain.models import DEFAULT_MATCH_TYPE, Alignment
+
+# Tuning constants for the default Singles rules.
+WEIGHT_JITTER = 5
+RATING_VARIANCE = 5
+ALIGNMENT_BONUS = 5
+LOW_STAMINA_THRESHOLD = 40
+LOW_STAMINA_PENALTY = 5
+WINNER_POPULARITY = 3
+LOSER_POPULARITY = -1
+STAMINA_LOSS_BASE = 8
+STAMINA_LOSS_SPREAD = 4
+
+# Compiled tables cover stats 0-127 (7 bits each) plus one alignment bit.
+STAT_BITS = 7
+
+Profile = Tuple[int, int, Alignment]
+
+
+def pack_profile(popularity: int, stamina: int, alignment: Alignment) -> int:
+    """Return a wrestler profile's index into compiled tables."""
+    return popularity | stamina << STAT_BITS | (alignment == "Face") << (2 * STAT_BITS)
+
+
+@dataclass(frozen=True)
+class Modifier:
+    """A named adjustment contributed by a match type or stipulation.
+
+    `weight` and `rating` receive one wrestler's profile and return an amount
+    added for that wrestler; `pairing` receives both alignments and returns
+    an amount added to the rating once per match. Any of them may be None.
+    """
+    name: str
+    weight: Optional[Callable[[Profile], int]] = None
+    rating: Optional[Callable[[Profile], int]] = None
+    pairing: Optional[Callable[[Alignment, Alignment], int]] = None
+
+
+@dataclass(frozen=True)
+class MatchType:
+    """Roll ranges, fixed deltas, and modifiers for one kind of match."""
+    name: str
+    modifiers: Tuple[Modifier, ...] = ()
+    weight_jitter: int = WEIGHT_JITTER
+    rating_variance: int = RATING_VARIANCE
+    winner_popularity: int = WINNER_POPULARITY
+    loser_popularity: int = LOSER_POPULARITY
+    stamina_loss_base: int = STAMINA_LOSS_BASE
+    stamina_loss_spread: int = STAMINA_LOSS_SPREAD
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledRules:
+    """Flat tables and scalars for one match type.
+
+    `weight[key]` is a wrestler's win weight before jitter (popularity +
+    stamina + weight modifiers) and `rating[key]` their rating adjustment,
+    where key is `pack_profile(...)`. `pairing[face_a << 1 | face_b]` is the
+    rating adjustment for the alignment pair.
+    """
+    match_type: MatchType
+    weight: Tuple[int, ...]
+    rating: Tuple[int, ...]
+    pairing: Tuple[int, int, int, int]
+    weight_jitter: int
+    rating_variance: int
+    winner_popularity: int
+    loser_popularity: int
+    stamina_loss_base: int
+    stamina_loss_spread: int
+
+
+_match_types: Dict[str, MatchType] = {}
+_compiled: Dict[str, CompiledRules] = {}
+_listeners: List[Callable[[str], None]] = []
+
+
+def on_rules_changed(listener: Callable[[str], None]) -> None:
+    """Call `listener(name)` whenever a match type is registered or replaced."""
+    _listeners.append(listener)
+
+
+def register_match_type(match_type: MatchType) -> None:
+    """Add or replace a match type; its tables are rebuilt on next use."""
+    _match_types[match_type.name] = match_type
+    _compiled.pop(match_type.name, None)
+    for listener in _listeners:
+        listener(match_type.name)
+
+
+def add_modifier(name: str, modifier: Modifier) -> MatchType:
+    """Append a modifier (e.g. a stipulation) to a registered match type."""
+    current = get_match_type(name)
+    updated = replace(current, modifiers=current.modifiers + (modifier,))
+    register_match_type(updated)
+    return updated
+
+
+def get_match_type(name: str) -> MatchType:
+    """Return a registered match type; raises KeyError for unknown names."""
+    try:
+        return _match_types[name]
+    except KeyError:
+        raise KeyError(f"unknown match type {name!r}") from None
+
+
+def match_type_names() -> Tuple[str, ...]:
+    """Return registered match type names in registration order."""
+    return tuple(_match_types)
+
+
+def compiled_rules(name: str = DEFAULT_MATCH_TYPE) -> CompiledRules:
+    """Return the cached tables for a match type, compiling on first use."""
+    rules = _compiled.get(name)
+    if rules is None:
+        rules = _compiled[name] = compile_rules(get_match_type(name))
+    return rules
+
+
+def compile_rules(match_type: MatchType) -> CompiledRules:
+    """Evaluate a match type's modifiers over every profile into flat tables."""
+    weight_mods = [modifier.weight for modifier in match_type.modifiers if modifier.weight]
+    rating_mods = [modifier.rating for modifier in match_type.modifiers if modifier.rating]
+    pairing_mods = [modifier.pairing for modifier in match_type.modifiers if modifier.pairing]
+    stats = range(1 << STAT_BITS)
+    # Same order as pack_profile: popularity varies fastest, alignment slowest.
+    profiles = [
+        (popularity, stamina, alignment)
+        for alignment in ("Heel", "Face")
+        for stamina in stats
+        for popularity in stats
+    ]
+    weight = [popularity + stamina for popularity, stamina, _ in profiles]
+    for modifier in weight_mods:
+        weight = [value + modifier(profile) for value, profile in zip(weight, profiles)]
+    rating = [0] * len(profiles)
+    for modifier in rating_mods:
+        rating = [value + modifier(profile) for value, profile in zip(rating, profiles)]
+    pairing = tuple(
+        sum(modifier(alignment_a, alignment_b) for modifier in pairing_mods)
+        for alignment_a in ("Heel", "Face")
+        for alignment_b in ("Heel", "Face")
+    )
+    return CompiledRules(
+        match_type=match_type,
+        weight=tuple(weight),
+        rating=tuple(rating),
+        pairing=pairing,
+        weight_jitter=match_type.weight_jitter,
+        rating_variance=match_type.rating_variance,
+        winner_popularity=match_type.winner_popularity,
+        loser_popularity=match_type.loser_popularity,
+        stamina_loss_base=match_type.stamina_loss_base,
+        stamina_loss_spread=match_type.stamina_loss_spread,
+    )
+
+
+def portable_rules(rules: CompiledRules) -> CompiledRules:
+    """Return the tables without modifier callables, so they pickle to other processes.
+
+    The modifiers are already baked into the tables; lambdas and other local
+    callables cannot be sent to spawned pool workers.
+    """
+    return replace(rules, match_type=replace(rules.match_type, modifiers=()))
+
+
+def portable_registry() -> Tuple[CompiledRules, ...]:
+    """Return picklable tables for every registered match type, compiling as needed."""
+    return tuple(portable_rules(compiled_rules(name)) for name in _match_types)
+
+
+def install_rules(rules: Iterable[CompiledRules]) -> None:
+    """Use tables compiled in another process; meant as a pool initializer.
+
+    Each match type is replaced by its tables, so workers simulate with the
+    parent's rules, including anything registered at runtime.
+    """
+    for compiled in rules:
+        _match_types[compiled.match_type.name] = compiled.match_type
+        _compiled[compiled.match_type.name] = compiled
+
+
+def alignment_bonus(alignment_a: Alignment, alignment_b: Alignment) -> int:
+    """Face vs Heel matches rate higher."""
+    return ALIGNMENT_BONUS if alignment_a != alignment_b else 0
+
+
+def low_stamina_penalty(profile: Profile) -> int:
+    """Each tired wrestler drags the rating down."""
+    return -LOW_STAMINA_PENALTY if profile[1] < LOW_STAMINA_THRESHOLD else 0
+
+
+register_match_type(
+    MatchType(
+        DEFAULT_MATCH_TYPE,
+        modifiers=(
+            Modifier("alignment_bonus", pairing=alignment_bonus),
+            Modifier("low_stamina_penalty", rating=low_stamina_penalty),
+        ),
+    )
+)
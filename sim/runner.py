@@ -0,0 +1,95 @@
+"""Sharded multi-process tournament runner."""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from domain.models import Match, MatchResult, Wrestler
+from sim.engine import simulate_match
+from sim.rng import RNG, RandomSource
+from sim.rules import CompiledRules, install_rules, portable_registry
+
+RngFactory = Callable[[int], RandomSource]
+
+# Per-process state installed once by the pool initializer.
+_WORKER_ROSTER: Dict[str, Wrestler] = {}
+_WORKER_RNG: RngFactory = RNG
+
+
+def round_robin(wrestler_ids: Iterable[str]) -> Iterator[Match]:
+    """Yield every unordered pairing of the given IDs once."""
+    for a_id, b_id in itertools.combinations(wrestler_ids, 2):
+        yield Match(a_id, b_id)
+
+
+def run_tournament(
+    matches: Iterable[Match],
+    roster: Dict[str, Wrestler],
+    seed: int = 1,
+    workers: Optional[int] = 1,
+    shard_size: int = 20000,
+    rng_factory: RngFactory = RNG,
+) -> List[MatchResult]:
+    """Simulate independent matches against a fixed roster.
+
+    Match i uses seed + i, so the output is bit-identical to
+    `[simulate_match(m, roster, seed + i) for i, m in enumerate(matches)]`
+    regardless of worker count or shard size. With workers other than 1, shards
+    run on a process pool; the roster and the compiled rules of every registered
+    match type are sent to each worker once through the pool initializer, and
+    results are merged back in input order. The roster is not mutated.
+    """
+    shards = _shards(matches, seed, shard_size)
+    if workers == 1:
+        results: List[MatchResult] = []
+        for shard in shards:
+            results.extend(_simulate_shard(shard, roster, rng_factory))
+        return results
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(roster, rng_factory, portable_registry()),
+    ) as pool:
+        return [result for shard in pool.map(_run_shard, shards) for result in shard]
+
+
+def _shards(
+    matches: Iterable[Match], seed: int, shard_size: int
+) -> Iterator[Tuple[int, List[Match]]]:
+    """Split matches into (first seed, matches) shards in input order."""
+    iterator = iter(matches)
+    start = seed
+    while True:
+        shard = list(itertools.islice(iterator, shard_size))
+        if not shard:
+            return
+        yield start, shard
+        start += len(shard)
+
+
+def _simulate_shard(
+    shard: Tuple[int, Sequence[Match]], roster: Dict[str, Wrestler], rng_factory: RngFactory
+) -> List[MatchResult]:
+    """Simulate one shard with consecutive seeds."""
+    start, matches = shard
+    return [
+        simulate_match(match, roster, start + offset, rng_factory)
+        for offset, match in enumerate(matches)
+    ]
+
+
+def _init_worker(
+    roster: Dict[str, Wrestler], rng_factory: RngFactory, rules: Sequence[CompiledRules]
+) -> None:
+    """Install the shared roster, RNG backend, and match rules in a worker process."""
+    global _WORKER_ROSTER, _WORKER_RNG
+    _WORKER_ROSTER = roster
+    _WORKER_RNG = rng_factory
+    install_rules(rules)
+
+
+def _run_shard(shard: Tuple[int, Sequence[Match]]) -> List[MatchResult]:
+    """Worker entry point: simulate a shard against the installed roster."""
+    return _simulate_shard(shard, _WORKER_ROSTER, _WORKER_RNG)
@@ -0,0 +1,89 @@
+"""Headless season simulation over an evolving roster."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterator
+
+from domain.models import Match, Wrestler, clamp_stat
+from sim.engine import apply_result, simulate_match
+from sim.rng import CounterRNG, derive_seed
+
+
+@dataclass(frozen=True)
+class WeekSummary:
+    """Aggregate view of one simulated week.
+
+    Stat ranges describe the roster after the week's results (and recovery)
+    are applied. Clamp counts report wrestlers pinned at 0 or 100.
+    """
+    week: int
+    matches: int
+    mean_rating: float
+    popularity_min: int
+    popularity_mean: float
+    popularity_max: int
+    stamina_min: int
+    stamina_mean: float
+    stamina_max: int
+    popularity_clamped: int
+    stamina_clamped: int
+
+
+def run_season(
+    roster: Dict[str, Wrestler],
+    weeks: int,
+    matches_per_week: int = 4,
+    seed: int = 1,
+    stamina_recovery: int = 0,
+) -> Iterator[WeekSummary]:
+    """Simulate weekly cards and yield one summary per week.
+
+    Each week books up to `matches_per_week` matches between distinct,
+    randomly drawn wrestlers, simulates them in order, and applies each result
+    before the next match. Every wrestler then recovers `stamina_recovery`.
+    The roster is mutated in place; no per-match results are retained, so
+    memory stays flat however many weeks are run.
+
+    Card draws and matches use counter-based streams derived from
+    (seed, week) and (seed, week, slot), so any single match can be replayed
+    from the roster state before it without rerunning the season.
+    """
+    if matches_per_week * 2 > len(roster):
+        raise ValueError("roster is too small for the requested card size")
+    ids = list(roster)
+    for week in range(1, weeks + 1):
+        card = list(ids)
+        CounterRNG.for_stream(seed, week).shuffle(card)
+        rating_total = 0
+        for slot in range(matches_per_week):
+            match = Match(card[2 * slot], card[2 * slot + 1])
+            match_seed = derive_seed(seed, week, slot)
+            result = simulate_match(match, roster, match_seed, rng_factory=CounterRNG)
+            apply_result(roster, result)
+            rating_total += result.rating
+        if stamina_recovery:
+            for wrestler in roster.values():
+                wrestler.stamina = clamp_stat(wrestler.stamina + stamina_recovery)
+        yield _summarize(week, matches_per_week, rating_total, roster)
+
+
+def _summarize(
+    week: int, matches: int, rating_total: int, roster: Dict[str, Wrestler]
+) -> WeekSummary:
+    """Build a WeekSummary from the current roster state."""
+    popularity = [wrestler.popularity for wrestler in roster.values()]
+    stamina = [wrestler.stamina for wrestler in roster.values()]
+    return WeekSummary(
+        week=week,
+        matches=matches,
+        mean_rating=rating_total / matches if matches else 0.0,
+        popularity_min=min(popularity),
+        popularity_mean=sum(popularity) / len(popularity),
+        popularity_max=max(popularity),
+        stamina_min=min(stamina),
+        stamina_mean=sum(stamina) / len(stamina),
+        stamina_max=max(stamina),
+        popularity_clamped=sum(1 for value in popularity if value in (0, 100)),
+        stamina_clamped=sum(1 for value in stamina if value in (0, 100)),
+    )
@@ -0,0 +1 @@
+"""Persistence for match history, roster snapshots, and app state."""
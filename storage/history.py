@@ -0,0 +1,301 @@
+"""Append-only binary match-history log with memory-mapped reads.
+
+Each `MatchResult` is stored as one fixed-width little-endian record. Wrestler
+IDs are interned into a sidecar `<path>.ids` file (one ID per line) so records
+hold compact integer references. Writing needs only the standard library;
+`HistoryReader` maps the log and exposes zero-copy NumPy views.
+
+The log is never rewritten. Undoing a booking appends a revert marker, which
+is a record with rating REVERTED and the withdrawn match number. Redo appends
+the withdrawn record again. A record is live when it is the last record for its
+match number and is not a marker, so undone bookings drop out of reads the
+same way they drop out of `SQLiteStore`. Version 1 logs have no markers and
+are upgraded in place when reopened for writing.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from domain.models import MatchResult
+from sim.rng import MASK64
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC = b"WGHL"
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sHH8x")
+# match_no, seed, winner, loser, rating, winner pop/sta delta, loser pop/sta delta
+RECORD = struct.Struct("<QQIIBhhhh")
+# Rating of a revert marker; real ratings are 0-100.
+REVERTED = 0xFF
+
+
+class HistoryWriter:
+    """Appends match results to a history log, creating it if needed.
+
+    Seeds are stored as unsigned 64-bit values. Match numbers start at 1 and
+    continue from the last live match when a log is reopened, as in
+    `SQLiteStore`. `revert()` and `restore()` mirror undo and redo. Use as a
+    context manager or call `close()` so buffered records reach disk.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (or create) the log and its ID sidecar for appending."""
+        self.path = path
+        self._ids: Dict[str, int] = {
+            wrestler_id: index for index, wrestler_id in enumerate(_read_ids(path))
+        }
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as handle:
+                handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        elif _check_header(path) != VERSION:
+            with open(path, "r+b") as handle:
+                handle.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+        # Drop a torn trailing record left by an interrupted write.
+        os.truncate(path, HEADER.size + self._count * RECORD.size)
+        self._last_no = _last_match_no(path, self._count)
+        self._log = open(path, "ab")
+        self._id_file = open(_ids_path(path), "a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        """Return the number of records in the log."""
+        return self._count
+
+    def append(self, result: MatchResult, seed: int, match_no: Optional[int] = None) -> int:
+        """Append a result and return its match number (defaults to the last one plus 1)."""
+        if match_no is None:
+            match_no = self._last_no + 1
+        self._log.write(
+            RECORD.pack(
+                match_no,
+                seed & MASK64,
+                self._intern(result.winner_id),
+                self._intern(result.loser_id),
+                result.rating,
+                result.winner_delta.popularity,
+                result.winner_delta.stamina,
+                result.loser_delta.popularity,
+                result.loser_delta.stamina,
+            )
+        )
+        self._count += 1
+        self._last_no = match_no
+        return match_no
+
+    def revert(self) -> Optional[int]:
+        """Withdraw the latest live match and return its number, or None if there is none."""
+        if self._last_no == 0:
+            return None
+        match_no = self._last_no
+        self._log.write(RECORD.pack(match_no, 0, 0, 0, REVERTED, 0, 0, 0, 0))
+        self._count += 1
+        self._last_no = match_no - 1
+        return match_no
+
+    def restore(self) -> Optional[int]:
+        """Re-append the most recently withdrawn match and return its number, or None."""
+        match_no = self._last_no + 1
+        self._log.flush()
+        record = _find_record(self.path, self._count, match_no)
+        if record is None:
+            return None
+        self._log.write(record)
+        self._count += 1
+        self._last_no = match_no
+        return match_no
+
+    def flush(self) -> None:
+        """Flush buffered IDs and records to disk."""
+        self._id_file.flush()
+        self._log.flush()
+
+    def close(self) -> None:
+        """Flush and close the log files."""
+        self._id_file.close()
+        self._log.close()
+
+    def __enter__(self) -> HistoryWriter:
+        """Return the writer for use in a with block."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the writer on exit."""
+        self.close()
+
+    def _intern(self, wrestler_id: str) -> int:
+        """Return the integer reference for an ID, adding it to the sidecar if new."""
+        index = self._ids.get(wrestler_id)
+        if index is None:
+            index = self._ids[wrestler_id] = len(self._ids)
+            self._id_file.write(wrestler_id + "\n")
+        return index
+
+
+class HistoryReader:
+    """Read-only, memory-mapped view of a history log.
+
+    `records` is a NumPy structured array backed directly by the mapped file;
+    nothing is parsed into Python objects until asked for. It holds every
+    record, including revert markers and the records they withdrew.
+    `live_records()`, `matches_for()`, and `ratings_for()` only see live matches.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map the log and load the ID table."""
+        import numpy as np
+
+        _check_header(path)
+        self.ids: List[str] = _read_ids(path)
+        self._index = {wrestler_id: index for index, wrestler_id in enumerate(self.ids)}
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        count = (len(self._map) - HEADER.size) // RECORD.size
+        self.records = np.frombuffer(
+            self._map, dtype=record_dtype(), count=count, offset=HEADER.size
+        )
+        self._live = _live_mask(self.records)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.records)
+
+    def index_of(self, wrestler_id: str) -> int:
+        """Return the interned integer for an ID."""
+        return self._index[wrestler_id]
+
+    def live_records(self) -> np.ndarray:
+        """Return the records of matches that were not undone, in log order."""
+        if self._live is None:
+            return self.records
+        return self.records[self._live]
+
+    def matches_for(self, wrestler_id: str) -> np.ndarray:
+        """Return the live records a wrestler appeared in, in log order."""
+        if wrestler_id not in self._index:
+            return self.records[:0]
+        index = self._index[wrestler_id]
+        records = self.records
+        mask = (records["winner"] == index) | (records["loser"] == index)
+        if self._live is not None:
+            mask &= self._live
+        return records[mask]
+
+    def ratings_for(self, wrestler_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (match numbers, ratings) for a wrestler's matches."""
+        records = self.matches_for(wrestler_id)
+        return records["match_no"], records["rating"]
+
+    def close(self) -> None:
+        """Release the mapping and file handle.
+
+        If views of `records` are still alive the mapping stays open until the
+        last one is garbage collected.
+        """
+        self.records = self.records[:0].copy()
+        self._live = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self) -> HistoryReader:
+        """Return the reader for use in a with block."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the reader on exit."""
+        self.close()
+
+
+def record_dtype() -> np.dtype:
+    """Return the NumPy structured dtype matching RECORD."""
+    import numpy as np
+
+    dtype = np.dtype(
+        [
+            ("match_no", "<u8"),
+            ("seed", "<u8"),
+            ("winner", "<u4"),
+            ("loser", "<u4"),
+            ("rating", "u1"),
+            ("winner_popularity", "<i2"),
+            ("winner_stamina", "<i2"),
+            ("loser_popularity", "<i2"),
+            ("loser_stamina", "<i2"),
+        ]
+    )
+    if dtype.itemsize != RECORD.size:
+        raise RuntimeError("history record dtype does not match the on-disk layout")
+    return dtype
+
+
+def _ids_path(path: str) -> str:
+    """Return the sidecar path holding interned IDs."""
+    return path + ".ids"
+
+
+def _read_ids(path: str) -> List[str]:
+    """Load interned IDs in index order, or an empty list for a new log."""
+    try:
+        with open(_ids_path(path), encoding="utf-8") as handle:
+            return handle.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+
+def _live_mask(records: np.ndarray) -> Optional[np.ndarray]:
+    """Return a mask of live records, or None when every record is live."""
+    import numpy as np
+
+    match_no = records["match_no"]
+    reverted = records["rating"] == REVERTED
+    if not reverted.any() and bool(np.all(match_no[1:] > match_no[:-1])):
+        return None
+    # First index of each match number in the reversed log is its last record.
+    _, from_end = np.unique(match_no[::-1], return_index=True)
+    live = np.zeros(len(records), dtype=bool)
+    live[len(records) - 1 - from_end] = True
+    return live & ~reverted
+
+
+def _last_match_no(path: str, count: int) -> int:
+    """Return the number of the latest live match, or 0 for an empty log."""
+    if not count:
+        return 0
+    with open(path, "rb") as handle:
+        handle.seek(HEADER.size + (count - 1) * RECORD.size)
+        fields = RECORD.unpack(handle.read(RECORD.size))
+    # A trailing marker withdrew the match above the latest live one.
+    return fields[0] - 1 if fields[4] == REVERTED else fields[0]
+
+
+def _find_record(path: str, count: int, match_no: int) -> Optional[bytes]:
+    """Return the latest non-marker record for a match number, scanning back from the end."""
+    with open(path, "rb") as handle:
+        for index in range(count - 1, -1, -1):
+            handle.seek(HEADER.size + index * RECORD.size)
+            raw = handle.read(RECORD.size)
+            fields = RECORD.unpack(raw)
+            if fields[0] == match_no and fields[4] != REVERTED:
+                return raw
+    return None
+
+
+def _check_header(path: str) -> int:
+    """Return the log's version; raise ValueError unless the header is supported."""
+    with open(path, "rb") as handle:
+        raw = handle.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError(f"{path} is not a match history log")
+    magic, version, record_size = HEADER.unpack(raw)
+    if magic != MAGIC or version not in READABLE_VERSIONS or record_size != RECORD.size:
+        raise ValueError(f"{path} is not a supported match history log")
+    return version
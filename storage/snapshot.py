@@ -0,0 +1,341 @@
+"""Versioned binary snapshots of the roster and AppState.
+
+A full snapshot stores the roster column by column (IDs, names, alignment,
+popularity, stamina) followed by the app state. A delta snapshot stores only
+the rows whose stats changed since a base snapshot, plus the current state.
+Either body may be zlib-compressed. Version 2 added the last match's type;
+version 1 files still load, with that match read back as Singles. Only the
+standard library is needed; loading straight into a `RosterStore`
+additionally uses NumPy.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from collections.abc import Mapping
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.models import DEFAULT_MATCH_TYPE, Match, MatchResult, StatDelta, Wrestler
+from domain.state import AppState
+
+MAGIC = b"WGSN"
+VERSION = 2
+READABLE_VERSIONS = (1, 2)
+FLAG_COMPRESSED = 1
+FLAG_DELTA = 2
+HEADER = struct.Struct("<4sHHI")
+_U32 = struct.Struct("<I")
+_NONE = 0xFFFFFFFF
+
+
+class _Columns:
+    """Roster columns in row order, as stored on disk."""
+    __slots__ = ("ids", "names", "face", "popularity", "stamina")
+
+    def __init__(
+        self, ids: List[str], names: List[str], face: bytes, popularity: bytes, stamina: bytes
+    ) -> None:
+        """Hold the decoded columns."""
+        self.ids = ids
+        self.names = names
+        self.face = face
+        self.popularity = popularity
+        self.stamina = stamina
+
+
+def save_snapshot(path: str, roster: Mapping, state: AppState, compress: bool = False) -> None:
+    """Write a full snapshot of a roster mapping (or RosterStore) and state."""
+    columns = _columns(roster)
+    ids = "\n".join(columns.ids)
+    names = "\n".join(columns.names)
+    separators = max(0, len(columns.ids) - 1)
+    if ids.count("\n") != separators or names.count("\n") != separators:
+        raise ValueError("wrestler IDs and names cannot contain newlines")
+    body = b"".join(
+        [
+            _pack_blob(ids.encode("utf-8")),
+            _pack_blob(names.encode("utf-8")),
+            columns.face,
+            columns.popularity,
+            columns.stamina,
+            _pack_state(state),
+        ]
+    )
+    _write(path, body, len(columns.ids), FLAG_COMPRESSED if compress else 0)
+
+
+def load_snapshot(path: str, as_store: bool = False) -> Tuple[Mapping, AppState]:
+    """Read a full snapshot and return (roster, state).
+
+    The roster is a `Dict[str, Wrestler]`, or a `RosterStore` when as_store is
+    True, which skips building per-wrestler objects for large rosters.
+    """
+    version, flags, count, body = _read(path)
+    if flags & FLAG_DELTA:
+        raise ValueError(f"{path} is a delta snapshot; use load_delta")
+    with _parsing(path):
+        columns, offset = _unpack_columns(body, count)
+        state, _ = _unpack_state(body, offset, version)
+    return _build_roster(columns, as_store), state
+
+
+def save_delta(
+    path: str, base_path: str, roster: Mapping, state: AppState, compress: bool = False
+) -> int:
+    """Write only the rows whose stats differ from a base snapshot.
+
+    The roster must contain the same IDs in the same order as the base.
+    Returns the number of changed rows written.
+    """
+    _, flags, count, base_body = _read(base_path)
+    if flags & FLAG_DELTA:
+        raise ValueError(f"{base_path} is not a full snapshot")
+    base, _ = _unpack_columns(base_body, count)
+    columns = _columns(roster)
+    if columns.ids != base.ids:
+        raise ValueError("roster IDs differ from the base snapshot")
+    changed = [
+        row
+        for row in range(count)
+        if columns.popularity[row] != base.popularity[row]
+        or columns.stamina[row] != base.stamina[row]
+    ]
+    body = b"".join(
+        [
+            _U32.pack(zlib.crc32(base_body)),
+            _U32.pack(len(changed)),
+            struct.pack(f"<{len(changed)}I", *changed),
+            bytes(columns.popularity[row] for row in changed),
+            bytes(columns.stamina[row] for row in changed),
+            _pack_state(state),
+        ]
+    )
+    flags = FLAG_DELTA | (FLAG_COMPRESSED if compress else 0)
+    _write(path, body, count, flags)
+    return len(changed)
+
+
+def load_delta(path: str, base_path: str, as_store: bool = False) -> Tuple[Mapping, AppState]:
+    """Read a delta snapshot on top of its base and return (roster, state)."""
+    version, flags, count, body = _read(path)
+    if not flags & FLAG_DELTA:
+        raise ValueError(f"{path} is not a delta snapshot")
+    _, _, base_count, base_body = _read(base_path)
+    with _parsing(path):
+        (checksum,) = _U32.unpack_from(body, 0)
+    if base_count != count or checksum != zlib.crc32(base_body):
+        raise ValueError(f"{path} was not taken against {base_path}")
+    with _parsing(base_path):
+        columns, _ = _unpack_columns(base_body, count)
+    with _parsing(path):
+        (changed_count,) = _U32.unpack_from(body, 4)
+        offset = 8
+        rows = struct.unpack_from(f"<{changed_count}I", body, offset)
+        offset += 4 * changed_count
+    popularity = bytearray(columns.popularity)
+    stamina = bytearray(columns.stamina)
+    for row, pop, sta in zip(
+        rows,
+        body[offset : offset + changed_count],
+        body[offset + changed_count : offset + 2 * changed_count],
+    ):
+        popularity[row] = pop
+        stamina[row] = sta
+    columns.popularity = bytes(popularity)
+    columns.stamina = bytes(stamina)
+    with _parsing(path):
+        state, _ = _unpack_state(body, offset + 2 * changed_count, version)
+    return _build_roster(columns, as_store), state
+
+
+def _columns(roster: Mapping) -> _Columns:
+    """Extract on-disk columns from a roster mapping or RosterStore."""
+    store_cls = _store_class()
+    if store_cls is not None and isinstance(roster, store_cls):
+        return _Columns(
+            list(roster.ids),
+            list(roster.names),
+            roster.face.astype("u1").tobytes(),
+            roster.popularity.tobytes(),
+            roster.stamina.tobytes(),
+        )
+    wrestlers = list(roster.values())
+    return _Columns(
+        [wrestler.id for wrestler in wrestlers],
+        [wrestler.name for wrestler in wrestlers],
+        bytes(wrestler.alignment == "Face" for wrestler in wrestlers),
+        bytes(wrestler.popularity for wrestler in wrestlers),
+        bytes(wrestler.stamina for wrestler in wrestlers),
+    )
+
+
+def _build_roster(columns: _Columns, as_store: bool) -> Mapping:
+    """Turn decoded columns into a roster dict or RosterStore."""
+    if as_store:
+        import numpy as np
+
+        from domain.store import RosterStore
+
+        return RosterStore(
+            columns.ids,
+            columns.names,
+            np.frombuffer(columns.face, dtype=np.uint8).astype(bool),
+            np.frombuffer(columns.popularity, dtype=np.uint8),
+            np.frombuffer(columns.stamina, dtype=np.uint8),
+        )
+    roster: Dict[str, Wrestler] = {}
+    for wrestler_id, name, face, pop, sta in zip(
+        columns.ids, columns.names, columns.face, columns.popularity, columns.stamina
+    ):
+        roster[wrestler_id] = Wrestler(wrestler_id, name, "Face" if face else "Heel", pop, sta)
+    return roster
+
+
+def _unpack_columns(body: bytes, count: int) -> Tuple[_Columns, int]:
+    """Decode roster columns from a full snapshot body."""
+    ids_blob, offset = _unpack_blob(body, 0)
+    names_blob, offset = _unpack_blob(body, offset)
+    face = body[offset : offset + count]
+    popularity = body[offset + count : offset + 2 * count]
+    stamina = body[offset + 2 * count : offset + 3 * count]
+    ids = ids_blob.decode("utf-8").split("\n") if count else []
+    names = names_blob.decode("utf-8").split("\n") if count else []
+    if len(ids) != count or len(names) != count or len(stamina) != count:
+        raise ValueError("snapshot roster section is truncated or corrupt")
+    return _Columns(ids, names, face, popularity, stamina), offset + 3 * count
+
+
+def _pack_state(state: AppState) -> bytes:
+    """Encode AppState fields in declaration order."""
+    parts = [
+        struct.pack("<q", state.seed),
+        _pack_optional(state.selected_a_id),
+        _pack_optional(state.selected_b_id),
+    ]
+    match = state.last_match
+    parts.append(_pack_optional(match.wrestler_a_id if match else None))
+    parts.append(_pack_optional(match.wrestler_b_id if match else None))
+    if match:
+        parts.append(_pack_optional(match.match_type))
+    result = state.last_result
+    parts.append(_pack_optional(result.winner_id if result else None))
+    if result:
+        parts.append(_pack_optional(result.loser_id))
+        parts.append(
+            struct.pack(
+                "<ihhhh",
+                result.rating,
+                result.winner_delta.popularity,
+                result.winner_delta.stamina,
+                result.loser_delta.popularity,
+                result.loser_delta.stamina,
+            )
+        )
+    return b"".join(parts)
+
+
+def _unpack_state(body: bytes, offset: int, version: int = VERSION) -> Tuple[AppState, int]:
+    """Decode AppState written by _pack_state in the given format version."""
+    (seed,) = struct.unpack_from("<q", body, offset)
+    offset += 8
+    selected_a, offset = _unpack_optional(body, offset)
+    selected_b, offset = _unpack_optional(body, offset)
+    match_a, offset = _unpack_optional(body, offset)
+    match_b, offset = _unpack_optional(body, offset)
+    match_type = DEFAULT_MATCH_TYPE
+    if match_a is not None and version >= 2:
+        match_type, offset = _unpack_optional(body, offset)
+    winner, offset = _unpack_optional(body, offset)
+    result = None
+    if winner is not None:
+        loser, offset = _unpack_optional(body, offset)
+        rating, win_pop, win_sta, lose_pop, lose_sta = struct.unpack_from("<ihhhh", body, offset)
+        offset += 12
+        result = MatchResult(
+            winner_id=winner,
+            loser_id=loser,
+            rating=rating,
+            winner_delta=StatDelta(popularity=win_pop, stamina=win_sta),
+            loser_delta=StatDelta(popularity=lose_pop, stamina=lose_sta),
+        )
+    state = AppState(
+        selected_a_id=selected_a,
+        selected_b_id=selected_b,
+        last_match=Match(match_a, match_b, match_type) if match_a is not None else None,
+        last_result=result,
+        seed=seed,
+    )
+    return state, offset
+
+
+def _pack_blob(blob: bytes) -> bytes:
+    """Prefix bytes with their u32 length."""
+    return _U32.pack(len(blob)) + blob
+
+
+def _unpack_blob(body: bytes, offset: int) -> Tuple[bytes, int]:
+    """Read a length-prefixed blob."""
+    (length,) = _U32.unpack_from(body, offset)
+    start = offset + _U32.size
+    return body[start : start + length], start + length
+
+
+def _pack_optional(text: Optional[str]) -> bytes:
+    """Encode an optional string; None is a sentinel length."""
+    if text is None:
+        return _U32.pack(_NONE)
+    return _pack_blob(text.encode("utf-8"))
+
+
+def _unpack_optional(body: bytes, offset: int) -> Tuple[Optional[str], int]:
+    """Decode a string written by _pack_optional."""
+    (length,) = _U32.unpack_from(body, offset)
+    if length == _NONE:
+        return None, offset + _U32.size
+    blob, offset = _unpack_blob(body, offset)
+    return blob.decode("utf-8"), offset
+
+
+def _write(path: str, body: bytes, count: int, flags: int) -> None:
+    """Write header plus (optionally compressed) body."""
+    if flags & FLAG_COMPRESSED:
+        body = zlib.compress(body, 1)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, VERSION, flags, count))
+        handle.write(body)
+
+
+def _read(path: str) -> Tuple[int, int, int, bytes]:
+    """Read and validate a snapshot file, returning (version, flags, count, body)."""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a snapshot")
+    magic, version, flags, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a snapshot")
+    if version not in READABLE_VERSIONS:
+        raise ValueError(f"{path} has unsupported snapshot version {version}")
+    body = data[HEADER.size :]
+    if flags & FLAG_COMPRESSED:
+        with _parsing(path):
+            body = zlib.decompress(body)
+    return version, flags, count, body
+
+
+@contextmanager
+def _parsing(path: str) -> Iterator[None]:
+    """Report truncated or corrupt snapshot data as ValueError."""
+    try:
+        yield
+    except (struct.error, zlib.error) as exc:
+        raise ValueError(f"{path} is truncated or corrupt") from exc
+
+
+def _store_class() -> Optional[type]:
+    """Return RosterStore if it has been imported; otherwise no roster can be one."""
+    module = sys.modules.get("domain.store")
+    return getattr(module, "RosterStore", None)
@@ -0,0 +1,469 @@
+"""SQLite store for the roster, app state, and indexed match history.
+
+Uses only the standard library. The database runs in WAL mode, so readers
+(analytics, another process) do not block the app while it records. Each
+recorded match is one row holding the booking, the result, and both
+wrestlers' stats after the match. Undone matches stay as reverted rows, so
+a redo restores them, and every query skips them. The match number is the table's primary
+key, and indexes on (winner, rating), (loser, rating), and rating let
+queries such as "top-rated matches for X" or "stamina trend for Y" read
+only that wrestler's rows instead of scanning the history.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from domain.models import DEFAULT_MATCH_TYPE, Match, MatchResult, StatDelta, Wrestler, clamp_stat
+from domain.state import AppState
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS wrestlers (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        alignment TEXT NOT NULL,
+        popularity INTEGER NOT NULL,
+        stamina INTEGER NOT NULL
+    )""",
+    # *_delta columns are the result's deltas; *_after columns are the stats
+    # after the match, NULL for imported results without a starting roster.
+    # reverted is 1 for undone matches awaiting a redo.
+    """CREATE TABLE IF NOT EXISTS matches (
+        match_no INTEGER PRIMARY KEY,
+        seed INTEGER NOT NULL,
+        match_type TEXT NOT NULL,
+        wrestler_a_id TEXT,
+        wrestler_b_id TEXT,
+        winner_id TEXT NOT NULL,
+        loser_id TEXT NOT NULL,
+        rating INTEGER NOT NULL,
+        winner_popularity_delta INTEGER NOT NULL,
+        winner_stamina_delta INTEGER NOT NULL,
+        loser_popularity_delta INTEGER NOT NULL,
+        loser_stamina_delta INTEGER NOT NULL,
+        winner_popularity_after INTEGER,
+        winner_stamina_after INTEGER,
+        loser_popularity_after INTEGER,
+        loser_stamina_after INTEGER,
+        reverted INTEGER NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE IF NOT EXISTS app_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    ) WITHOUT ROWID""",
+)
+
+# Version 1 databases predate undo tracking.
+_MIGRATE_V1 = "ALTER TABLE matches ADD COLUMN reverted INTEGER NOT NULL DEFAULT 0"
+
+# Secondary indexes; dropped during bulk imports and rebuilt once afterwards.
+_INDEXES = {
+    "matches_winner_rating": "matches (winner_id, rating)",
+    "matches_loser_rating": "matches (loser_id, rating)",
+    "matches_rating": "matches (rating)",
+    # Partial index over the few undone rows awaiting redo.
+    "matches_reverted": "matches (match_no) WHERE reverted",
+}
+
+_RESULT_COLUMNS = (
+    "match_no, seed, match_type, wrestler_a_id, wrestler_b_id, winner_id, loser_id, rating, "
+    "winner_popularity_delta, winner_stamina_delta, loser_popularity_delta, loser_stamina_delta"
+)
+_INSERT_MATCH = (
+    f"INSERT INTO matches ({_RESULT_COLUMNS}, winner_popularity_after, winner_stamina_after, "
+    "loser_popularity_after, loser_stamina_after) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)"
+)
+_UPSERT_WRESTLER = (
+    "INSERT INTO wrestlers VALUES (?,?,?,?,?) ON CONFLICT(id) DO UPDATE SET "
+    "name = excluded.name, alignment = excluded.alignment, "
+    "popularity = excluded.popularity, stamina = excluded.stamina"
+)
+_UPDATE_STATS = "UPDATE wrestlers SET popularity = ?, stamina = ? WHERE id = ?"
+_TOP_OVERALL = (
+    f"SELECT {_RESULT_COLUMNS} FROM matches WHERE NOT reverted "
+    "ORDER BY rating DESC, match_no DESC LIMIT ?1"
+)
+# Per-wrestler queries: one index search on each side, merged by SQLite.
+_TOP_FOR_WRESTLER = (
+    f"SELECT {_RESULT_COLUMNS} FROM matches WHERE winner_id = ?1 AND NOT reverted "
+    f"UNION ALL SELECT {_RESULT_COLUMNS} FROM matches WHERE loser_id = ?1 AND NOT reverted "
+    "ORDER BY rating DESC, match_no DESC LIMIT ?2"
+)
+_STAT_TREND = (
+    "SELECT match_no, winner_popularity_after, winner_stamina_after FROM matches "
+    "WHERE winner_id = ?1 AND match_no > ?2 AND NOT reverted "
+    "UNION ALL SELECT match_no, loser_popularity_after, loser_stamina_after FROM matches "
+    "WHERE loser_id = ?1 AND match_no > ?2 AND NOT reverted ORDER BY match_no"
+)
+
+
+@dataclass(frozen=True)
+class StoredMatch:
+    """One recorded match: its number, seed, booking, and result.
+
+    `match` is None for results imported without their booking.
+    """
+    match_no: int
+    seed: int
+    match: Optional[Match]
+    result: MatchResult
+
+
+class SQLiteStore:
+    """Roster, app state, and match history in one SQLite database.
+
+    Each write method runs in one explicit transaction; `record` commits a
+    match and the two wrestlers' new stats together. `undo_last` and
+    `redo_next` mirror `RosterLedger` undo/redo: they flag or unflag the
+    newest match as reverted, and recording or importing after an undo
+    discards the reverted tail. Use as a context manager or call `close()`.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open (or create) the database and its schema."""
+        self.path = path
+        # Autocommit mode; transactions are opened explicitly by _transaction().
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, 1, SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"{path} has unsupported schema version {version}")
+        with self._transaction():
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+            if version == 1:
+                self.connection.execute(_MIGRATE_V1)
+            self._create_indexes()
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> SQLiteStore:
+        """Return the store for use in a with block."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the store on exit."""
+        self.close()
+
+    def save_roster(self, roster: Mapping) -> None:
+        """Insert or update every wrestler in a roster mapping."""
+        with self._transaction():
+            self.connection.executemany(
+                _UPSERT_WRESTLER,
+                (
+                    (
+                        wrestler.id,
+                        wrestler.name,
+                        wrestler.alignment,
+                        wrestler.popularity,
+                        wrestler.stamina,
+                    )
+                    for wrestler in roster.values()
+                ),
+            )
+
+    def load_roster(self) -> Dict[str, Wrestler]:
+        """Return the stored roster in insertion order (empty if none is stored)."""
+        rows = self.connection.execute(
+            "SELECT id, name, alignment, popularity, stamina FROM wrestlers ORDER BY rowid"
+        )
+        return {row[0]: Wrestler(*row) for row in rows}
+
+    def update_stats(self, wrestlers: Iterable[Wrestler]) -> None:
+        """Write the current popularity and stamina of the given wrestlers."""
+        with self._transaction():
+            self._write_stats(wrestlers)
+
+    def save_state(self, state: AppState) -> None:
+        """Store the seed and current selections."""
+        with self._transaction():
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO app_state VALUES (?, ?)",
+                [
+                    ("seed", str(state.seed)),
+                    ("selected_a_id", state.selected_a_id),
+                    ("selected_b_id", state.selected_b_id),
+                ],
+            )
+
+    def load_state(self) -> AppState:
+        """Return the stored state; the last match comes from the history."""
+        values = dict(self.connection.execute("SELECT key, value FROM app_state"))
+        last = self.last_match()
+        return AppState(
+            selected_a_id=values.get("selected_a_id"),
+            selected_b_id=values.get("selected_b_id"),
+            last_match=last.match if last else None,
+            last_result=last.result if last else None,
+            seed=int(values["seed"]) if "seed" in values else AppState.seed,
+        )
+
+    def match_count(self) -> int:
+        """Return the highest recorded, not undone, match number (0 when empty)."""
+        # Walks the primary key backwards past any reverted rows.
+        row = self.connection.execute(
+            "SELECT match_no FROM matches WHERE NOT reverted ORDER BY match_no DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def record(
+        self, match: Match, result: MatchResult, seed: int, roster: Mapping[str, Wrestler]
+    ) -> int:
+        """Record a match whose result is already applied to the roster.
+
+        Stores the booking, the result, and both wrestlers' post-match stats,
+        and updates their roster rows, in one transaction. Returns the match
+        number.
+        """
+        winner = roster[result.winner_id]
+        loser = roster[result.loser_id]
+        with self._transaction():
+            self._discard_reverted()
+            match_no = self.match_count() + 1
+            self.connection.execute(
+                _INSERT_MATCH,
+                _match_row(match_no, seed, match, result)
+                + (winner.popularity, winner.stamina, loser.popularity, loser.stamina),
+            )
+            self._write_stats((winner, loser))
+        return match_no
+
+    def undo_last(self, wrestlers: Iterable[Wrestler]) -> Optional[int]:
+        """Flag the newest match as reverted and write the wrestlers' restored stats.
+
+        Returns the reverted match number, or None when nothing is recorded.
+        """
+        with self._transaction():
+            match_no = self.match_count()
+            if not match_no:
+                return None
+            self.connection.execute(
+                "UPDATE matches SET reverted = 1 WHERE match_no = ?", (match_no,)
+            )
+            self._write_stats(wrestlers)
+        return match_no
+
+    def redo_next(self, wrestlers: Iterable[Wrestler]) -> Optional[int]:
+        """Restore the oldest reverted match and write the wrestlers' stats.
+
+        Returns the restored match number, or None when nothing is reverted.
+        """
+        with self._transaction():
+            row = self.connection.execute(
+                "SELECT MIN(match_no) FROM matches WHERE reverted"
+            ).fetchone()
+            if row[0] is None:
+                return None
+            self.connection.execute("UPDATE matches SET reverted = 0 WHERE match_no = ?", row)
+            self._write_stats(wrestlers)
+        return row[0]
+
+    def import_results(
+        self,
+        results: Iterable[Tuple[MatchResult, int]],
+        roster: Optional[Mapping[str, Wrestler]] = None,
+        batch_size: int = 100_000,
+    ) -> int:
+        """Bulk-append (result, seed) pairs and return how many were imported.
+
+        Results are numbered after the existing history. When `roster` gives
+        the stats before the first result, deltas are replayed (with
+        clamping) on a private copy to fill the post-match stat columns;
+        otherwise those are NULL. The roster itself is not changed. Rows are
+        inserted with `executemany` in batches inside one transaction, with
+        the secondary indexes dropped and rebuilt once at the end.
+        """
+        stats = (
+            {wrestler.id: [wrestler.popularity, wrestler.stamina] for wrestler in roster.values()}
+            if roster is not None
+            else None
+        )
+        imported = 0
+        rows = iter(results)
+        # One transaction, so a failed import also restores the dropped indexes.
+        with self._transaction():
+            self._discard_reverted()
+            start = self.match_count() + 1
+            self._drop_indexes()
+            while True:
+                chunk = list(islice(rows, batch_size))
+                if not chunk:
+                    break
+                self.connection.executemany(
+                    _INSERT_MATCH, _import_rows(chunk, start + imported, stats)
+                )
+                imported += len(chunk)
+            self._create_indexes()
+        return imported
+
+    def import_history(self, path: str, roster: Optional[Mapping[str, Wrestler]] = None) -> int:
+        """Bulk-append every live match of a binary history log (needs NumPy)."""
+        from storage.history import HistoryReader
+
+        with HistoryReader(path) as reader:
+            return self.import_results(_history_results(reader), roster)
+
+    def get_match(self, match_no: int) -> Optional[StoredMatch]:
+        """Return one recorded match, or None."""
+        row = self.connection.execute(
+            f"SELECT {_RESULT_COLUMNS} FROM matches WHERE match_no = ? AND NOT reverted",
+            (match_no,),
+        ).fetchone()
+        return _stored(row) if row else None
+
+    def last_match(self) -> Optional[StoredMatch]:
+        """Return the most recent recorded match, or None."""
+        row = self.connection.execute(
+            f"SELECT {_RESULT_COLUMNS} FROM matches WHERE NOT reverted "
+            "ORDER BY match_no DESC LIMIT 1"
+        ).fetchone()
+        return _stored(row) if row else None
+
+    def top_matches(self, wrestler_id: Optional[str] = None, limit: int = 10) -> List[StoredMatch]:
+        """Return the highest-rated matches overall or for one wrestler, newest first on ties."""
+        if wrestler_id is None:
+            rows = self.connection.execute(_TOP_OVERALL, (limit,))
+        else:
+            rows = self.connection.execute(_TOP_FOR_WRESTLER, (wrestler_id, limit))
+        return [_stored(row) for row in rows]
+
+    def stat_trend(
+        self, wrestler_id: str, since: int = 0
+    ) -> List[Tuple[int, Optional[int], Optional[int]]]:
+        """Return (match number, popularity, stamina) after each of a wrestler's matches."""
+        return self.connection.execute(_STAT_TREND, (wrestler_id, since)).fetchall()
+
+    def query_plan(self, sql: str, parameters: Tuple = ()) -> List[str]:
+        """Return SQLite's query plan details, e.g. to check index use."""
+        rows = self.connection.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)
+        return [row[-1] for row in rows]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run a block in BEGIN/COMMIT, rolling back on error."""
+        self.connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def _write_stats(self, wrestlers: Iterable[Wrestler]) -> None:
+        """Update roster rows inside the current transaction."""
+        self.connection.executemany(
+            _UPDATE_STATS,
+            ((wrestler.popularity, wrestler.stamina, wrestler.id) for wrestler in wrestlers),
+        )
+
+    def _discard_reverted(self) -> None:
+        """Delete undone matches; a new booking ends the redo history."""
+        self.connection.execute("DELETE FROM matches WHERE reverted")
+
+    def _create_indexes(self) -> None:
+        """Create any missing secondary indexes."""
+        for name, target in _INDEXES.items():
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def _drop_indexes(self) -> None:
+        """Drop the secondary indexes ahead of a bulk import."""
+        for name in _INDEXES:
+            self.connection.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _match_row(match_no: int, seed: int, match: Optional[Match], result: MatchResult) -> Tuple:
+    """Return the booking and result columns of a matches row."""
+    return (
+        match_no,
+        seed,
+        match.match_type if match else DEFAULT_MATCH_TYPE,
+        match.wrestler_a_id if match else None,
+        match.wrestler_b_id if match else None,
+        result.winner_id,
+        result.loser_id,
+        result.rating,
+        result.winner_delta.popularity,
+        result.winner_delta.stamina,
+        result.loser_delta.popularity,
+        result.loser_delta.stamina,
+    )
+
+
+def _import_rows(
+    chunk: List[Tuple[MatchResult, int]], start: int, stats: Optional[Dict[str, List[int]]]
+) -> List[Tuple]:
+    """Build matches rows for one import batch, replaying stats when known."""
+    if stats is None:
+        unknown = (None, None, None, None)
+        return [
+            _match_row(match_no, seed, None, result) + unknown
+            for match_no, (result, seed) in enumerate(chunk, start)
+        ]
+    rows = []
+    for match_no, (result, seed) in enumerate(chunk, start):
+        winner = stats[result.winner_id]
+        loser = stats[result.loser_id]
+        winner[0] = clamp_stat(winner[0] + result.winner_delta.popularity)
+        winner[1] = clamp_stat(winner[1] + result.winner_delta.stamina)
+        loser[0] = clamp_stat(loser[0] + result.loser_delta.popularity)
+        loser[1] = clamp_stat(loser[1] + result.loser_delta.stamina)
+        rows.append(
+            _match_row(match_no, seed, None, result) + (winner[0], winner[1], loser[0], loser[1])
+        )
+    return rows
+
+
+def _history_results(reader) -> Iterator[Tuple[MatchResult, int]]:
+    """Yield (result, seed) pairs from a HistoryReader's live records."""
+    records = reader.live_records()
+    ids = reader.ids
+    # The log stores seeds as unsigned 64-bit; SQLite integers are signed.
+    signed = 1 << 63
+    for seed, winner, loser, rating, win_pop, win_sta, lose_pop, lose_sta in zip(
+        records["seed"].tolist(),
+        records["winner"].tolist(),
+        records["loser"].tolist(),
+        records["rating"].tolist(),
+        records["winner_popularity"].tolist(),
+        records["winner_stamina"].tolist(),
+        records["loser_popularity"].tolist(),
+        records["loser_stamina"].tolist(),
+    ):
+        result = MatchResult(
+            winner_id=ids[winner],
+            loser_id=ids[loser],
+            rating=rating,
+            winner_delta=StatDelta(popularity=win_pop, stamina=win_sta),
+            loser_delta=StatDelta(popularity=lose_pop, stamina=lose_sta),
+        )
+        yield result, seed - (1 << 64) if seed >= signed else seed
+
+
+def _stored(row: Tuple) -> StoredMatch:
+    """Build a StoredMatch from the booking and result columns of a row."""
+    match_no, seed, match_type, a_id, b_id, winner_id, loser_id, rating = row[:8]
+    win_pop, win_sta, lose_pop, lose_sta = row[8:12]
+    return StoredMatch(
+        match_no=match_no,
+        seed=seed,
+        match=Match(a_id, b_id, match_type) if a_id is not None else None,
+        result=MatchResult(
+            winner_id=winner_id,
+            loser_id=loser_id,
+            rating=rating,
+            winner_delta=StatDelta(popularity=win_pop, stamina=win_sta),
+            loser_delta=StatDelta(popularity=lose_pop, stamina=lose_sta),
+        ),
+    )
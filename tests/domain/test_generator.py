@@ -0,0 +1,64 @@
+"""Tests for the procedural roster generator."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain import generator  # noqa: E402
+from domain.generator import (  # noqa: E402
+    BLOCK_SIZE,
+    GeneratorConfig,
+    StatDistribution,
+    generate_roster,
+    generate_store,
+)
+
+
+def test_generation_is_reproducible_and_prefix_stable() -> None:
+    """Same seed gives the same roster; a smaller roster is a prefix of a larger one."""
+    small = generate_store(1000, seed=4)
+    again = generate_store(1000, seed=4)
+    large = generate_store(BLOCK_SIZE + 10, seed=4)
+    assert small.ids == again.ids and small.names == again.names
+    assert np.array_equal(small.popularity, again.popularity)
+    assert large.names[:1000] == small.names
+    assert np.array_equal(large.stamina[:1000], small.stamina)
+    assert not np.array_equal(generate_store(1000, seed=5).popularity, small.popularity)
+
+
+def test_ids_unique_and_config_respected() -> None:
+    """IDs are sequential and unique; distributions and face ratio are honoured."""
+    config = GeneratorConfig(
+        popularity=StatDistribution(mean=80, stddev=5, low=60, high=90),
+        stamina=StatDistribution(mean=30, stddev=0),
+        face_ratio=0.25,
+    )
+    store = generate_store(BLOCK_SIZE + 5000, seed=1, config=config)
+    assert len(set(store.ids)) == len(store) and store.ids[0] == "w0000000"
+    assert 60 <= store.popularity.min() and store.popularity.max() <= 90
+    assert abs(float(store.popularity.mean()) - 80) < 0.5
+    assert set(store.stamina.tolist()) == {30}
+    assert abs(float(store.face.mean()) - 0.25) < 0.01
+
+
+def test_dict_roster_matches_store() -> None:
+    """The Wrestler stream agrees with the columnar store."""
+    roster = generate_roster(300, seed=9)
+    store = generate_store(300, seed=9)
+    assert roster == store.to_roster()
+
+
+def test_id_width_limit_and_invalid_ranges(monkeypatch) -> None:
+    """IDs keep a fixed width up to the limit; larger counts and empty ranges raise."""
+    monkeypatch.setattr(generator, "ID_WIDTH", 2)
+    ids = list(generate_roster(100))
+    assert ids[0] == "w00" and ids[-1] == "w99"
+    assert generate_store(50).ids == ids[:50]
+    with pytest.raises(ValueError):
+        generate_store(101)
+    with pytest.raises(ValueError):
+        generate_roster(101)
+    with pytest.raises(ValueError):
+        StatDistribution(low=80, high=60)
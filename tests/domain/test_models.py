@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from domain.models import Wrestler, clamp_stat
+import pickle
+
+from domain.models import Match, MatchResult, StatDelta, Wrestler, clamp_stat
 
 
 def test_clamp_stat_bounds() -> None:
@@ -18,3 +20,21 @@ def test_wrestler_clamps_on_init() -> None:
     wrestler = Wrestler("test", "Test", "Face", 120, -10)
     assert wrestler.popularity == 100
     assert wrestler.stamina == 0
+
+
+def test_models_are_slotted() -> None:
+    """Domain models should not carry a per-instance __dict__."""
+    wrestler = Wrestler("test", "Test", "Face", 50, 50)
+    assert not hasattr(wrestler, "__dict__")
+    assert not hasattr(Match("a", "b"), "__dict__")
+
+
+def test_match_result_deltas_view() -> None:
+    """The deltas view should map winner and loser IDs to fixed fields."""
+    win = StatDelta(popularity=3, stamina=-9)
+    lose = StatDelta(popularity=-1, stamina=-9)
+    result = MatchResult("a", "b", 60, winner_delta=win, loser_delta=lose)
+    assert dict(result.deltas) == {"a": win, "b": lose}
+    assert result.deltas["b"] is lose
+    assert "c" not in result.deltas
+    assert pickle.loads(pickle.dumps(result)) == result
@@ -0,0 +1,85 @@
+"""Tests for roster name search and query parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from domain.search import NameIndex, filter_rows, parse_query
+from sim.engine import simulate_match
+from sim.ledger import RosterLedger
+
+
+def _names(index: NameIndex, rows) -> list:
+    """Return IDs for result rows."""
+    return [index.ids[row] for row in rows]
+
+
+def test_prefix_and_trigram_search() -> None:
+    """Short queries match word starts; longer ones match substrings."""
+    index = NameIndex.from_roster(seed_roster())
+    assert _names(index, index.search("v")) == ["ember"]
+    assert _names(index, index.search("b")) == ["asha"]
+    assert _names(index, index.search("ale")) == ["ember"]
+    assert _names(index, index.search("STEEL")) == ["rohan"]
+    assert index.search("zzz") == []
+    assert len(index.search("")) == 8
+
+
+def test_incremental_search_matches_fresh_search() -> None:
+    """Type-ahead narrowing should agree with a cold lookup at every step."""
+    roster = seed_roster()
+    index = NameIndex.from_roster(roster)
+    for typed in ("e", "em", "emb", "embe", "ember v", "o", "ov", "ova"):
+        fresh = NameIndex.from_roster(roster).search(typed)
+        assert index.search(typed) == fresh
+
+
+def test_parse_query_and_filters() -> None:
+    """Filter tokens should parse out and apply to live stats."""
+    query = parse_query("Heel pop>=50 sta>60 wolfe")
+    assert query.text == "wolfe"
+    assert query.alignment == "Heel"
+    assert query.min_popularity == 50
+    assert query.min_stamina == 61
+    roster = seed_roster()
+    index = NameIndex.from_roster(roster)
+    rows = filter_rows(index.search(""), index.ids, roster, parse_query("heel pop>=50"))
+    assert _names(index, rows) == ["rohan", "ivy", "goro"]
+
+
+@pytest.mark.parametrize("raw", ["heel pop>=50", "a face sta>=60", "pop>60 sta>=70", "zz heel"])
+def test_index_filter_matches_filter_rows_and_follows_the_ledger(raw: str) -> None:
+    """The index's compact stat columns give the same rows as live lookups, after every change."""
+    ledger = RosterLedger(seed_roster())
+    index = NameIndex.from_roster(ledger.roster)
+    ledger.subscribe(index)
+    query = parse_query(raw)
+
+    def check() -> None:
+        rows = index.search(query.text)
+        assert index.filter(rows, query) == filter_rows(rows, index.ids, ledger.roster, query)
+
+    check()
+    for seed in range(30):
+        ledger.apply(simulate_match(Match("asha", "rohan"), ledger.roster, seed))
+        check()
+    ledger.undo()
+    check()
+    with pytest.raises(ValueError):
+        NameIndex(index.ids, ["x"] * len(index.ids)).filter([0], query)
+
+
+def test_index_filter_reads_store_columns() -> None:
+    """A RosterStore index filters on the store's live NumPy columns."""
+    pytest.importorskip("numpy")
+    from domain.generator import generate_store
+
+    store = generate_store(3000, seed=2)
+    index = NameIndex.from_roster(store)
+    store.popularity[:100] = 100
+    for raw in ("heel pop>=60", "ka face", "sta>=80 pop>=90"):
+        query = parse_query(raw)
+        rows = index.search(query.text)
+        assert index.filter(rows, query) == filter_rows(rows, index.ids, store, query)
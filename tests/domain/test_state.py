@@ -0,0 +1,32 @@
+"""Tests for observable app state."""
+
+from __future__ import annotations
+
+from domain.state import ROSTER, AppState
+
+
+def test_flush_reports_only_changed_fields() -> None:
+    """Assignments to new values are reported once; same-value writes are not."""
+    state = AppState()
+    seen = []
+    state.subscribe(seen.append)
+    state.selected_a_id = "asha"
+    state.selected_b_id = None
+    state.seed = 1
+    assert state.flush() == {"selected_a_id"}
+    assert state.flush() == frozenset()
+    assert seen == [{"selected_a_id"}]
+
+
+def test_touch_and_unsubscribe() -> None:
+    """Touched names are delivered; unsubscribed listeners stop hearing changes."""
+    state = AppState()
+    seen = []
+    unsubscribe = state.subscribe(seen.append)
+    state.touch(ROSTER)
+    state.flush()
+    unsubscribe()
+    state.seed = 2
+    state.flush()
+    assert seen == [{ROSTER}]
+    assert state == AppState(seed=2)
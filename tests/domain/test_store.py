@@ -0,0 +1,45 @@
+"""Tests for the columnar roster store."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain.models import Match  # noqa: E402
+from domain.roster import seed_roster  # noqa: E402
+from domain.store import RosterStore  # noqa: E402
+from sim.engine import apply_result, simulate_match  # noqa: E402
+
+
+def test_store_round_trips_roster() -> None:
+    """Converting to a store and back should preserve every wrestler."""
+    roster = seed_roster()
+    store = RosterStore.from_roster(roster)
+    assert list(store) == list(roster)
+    assert store.to_roster() == roster
+    assert store["leo"].alignment == "Face"
+    assert store.index_of("leo") == list(roster).index("leo")
+
+
+def test_store_views_work_with_engine() -> None:
+    """The engine should simulate and apply results through store views."""
+    roster = seed_roster()
+    store = RosterStore.from_roster(seed_roster())
+    match = Match("asha", "rohan")
+    assert simulate_match(match, store, seed=4) == simulate_match(match, roster, seed=4)
+    result = simulate_match(match, store, seed=4)
+    apply_result(store, result)
+    apply_result(roster, result)
+    assert store.to_roster() == roster
+
+
+def test_apply_deltas_accumulates_and_clamps() -> None:
+    """Repeated rows should accumulate deltas before clamping."""
+    store = RosterStore.from_roster(seed_roster())
+    rows = store.indices(["asha", "asha", "rohan"])
+    store.apply_deltas(rows, popularity=np.array([30, 40, -100]), stamina=-5)
+    assert store["asha"].popularity == 100
+    assert store["rohan"].popularity == 0
+    assert store["asha"].stamina == 80
+    assert store["rohan"].stamina == 80
@@ -0,0 +1,139 @@
+"""Tests for incrementally maintained roster analytics."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.roster import seed_roster
+from sim.analytics import RosterAnalytics
+from sim.engine import simulate_match
+from sim.ledger import RosterLedger
+from sim.runner import round_robin
+
+
+def _snapshot(analytics: RosterAnalytics) -> tuple:
+    """Return every aggregate as plain values for comparison."""
+    wrestlers = {}
+    for wrestler_id in analytics.roster:
+        stats = analytics.wrestler(wrestler_id)
+        wrestlers[wrestler_id] = (
+            stats.matches,
+            stats.wins,
+            stats.rating_total,
+            stats.popularity_trend,
+            stats.rolling_stamina,
+        )
+    matchups = {}
+    for winner in ("Face", "Heel"):
+        for loser in ("Face", "Heel"):
+            matchup = analytics.matchup(winner, loser)
+            matchups[winner, loser] = (matchup.matches, matchup.rating_total)
+    return analytics.matches, analytics.rating_total, wrestlers, matchups
+
+
+def test_aggregates_match_a_full_rescan() -> None:
+    """Running aggregates should equal values recomputed from the history."""
+    roster = seed_roster()
+    start = {wrestler_id: (w.popularity, w.stamina) for wrestler_id, w in roster.items()}
+    analytics = RosterAnalytics(roster, window=3)
+    matches = list(round_robin(roster))
+    history = []
+    for seed in range(60):
+        result = simulate_match(matches[seed % len(matches)], roster, seed)
+        analytics.apply_result(roster, result)
+        after = {wrestler_id: (w.popularity, w.stamina) for wrestler_id, w in roster.items()}
+        history.append((result, after))
+
+    assert analytics.matches == 60
+    for wrestler_id in roster:
+        played = [
+            (result, after[wrestler_id])
+            for result, after in history
+            if wrestler_id in (result.winner_id, result.loser_id)
+        ]
+        stats = analytics.wrestler(wrestler_id)
+        assert stats.matches == len(played)
+        assert stats.wins == sum(result.winner_id == wrestler_id for result, _ in played)
+        assert stats.average_rating == pytest.approx(
+            sum(result.rating for result, _ in played) / len(played)
+        )
+        recent = [stamina for _, (_, stamina) in played[-3:]]
+        assert stats.rolling_stamina == pytest.approx(sum(recent) / len(recent))
+        popularity = [start[wrestler_id][0]] + [pop for _, (pop, _) in played]
+        assert stats.popularity_trend == popularity[-1] - popularity[-4]
+
+    face_over_heel = sum(
+        (roster[result.winner_id].alignment, roster[result.loser_id].alignment)
+        == ("Face", "Heel")
+        for result, _ in history
+    )
+    assert analytics.matchup("Face", "Heel").matches == face_over_heel
+
+
+def test_ledger_undo_redo_keeps_aggregates_in_sync() -> None:
+    """Undo should restore the exact prior aggregates and redo should reapply them."""
+    ledger = RosterLedger(seed_roster())
+    analytics = RosterAnalytics(ledger.roster, window=2)
+    ledger.subscribe(analytics)
+    matches = list(round_robin(ledger.roster))
+    snapshots = [_snapshot(analytics)]
+    for seed in range(12):
+        ledger.apply(simulate_match(matches[seed % len(matches)], ledger.roster, seed))
+        snapshots.append(_snapshot(analytics))
+
+    for expected in reversed(snapshots[:-1]):
+        ledger.undo()
+        assert _snapshot(analytics) == expected
+    for expected in snapshots[1:]:
+        ledger.redo()
+        assert _snapshot(analytics) == expected
+    assert ledger.fork()._observers == []
+
+
+def test_memory_is_bounded_and_deep_undo_stays_consistent() -> None:
+    """Per-wrestler buffers stay capped; undo is exact within `undo_depth`."""
+    ledger = RosterLedger(seed_roster())
+    start = {wrestler_id: w.stamina for wrestler_id, w in ledger.roster.items()}
+    analytics = RosterAnalytics(ledger.roster, window=2, undo_depth=1)
+    ledger.subscribe(analytics)
+    matches = list(round_robin(ledger.roster))
+    snapshots = [_snapshot(analytics)]
+    for seed in range(200):
+        ledger.apply(simulate_match(matches[seed % len(matches)], ledger.roster, seed))
+        snapshots.append(_snapshot(analytics))
+    assert all(len(analytics.wrestler(wrestler_id).recent) <= 4 for wrestler_id in start)
+
+    ledger.undo()
+    assert _snapshot(analytics) == snapshots[-2]
+    while ledger.undo() is not None:
+        for wrestler_id, wrestler in ledger.roster.items():
+            stats = analytics.wrestler(wrestler_id)
+            if stats.matches:
+                assert stats.recent[-1] == (wrestler.popularity, wrestler.stamina)
+    assert _snapshot(analytics)[:2] == (0, 0)
+    assert all(
+        analytics.wrestler(wrestler_id).rolling_stamina == stamina
+        for wrestler_id, stamina in start.items()
+    )
+
+
+def test_leaderboard_orders_and_filters() -> None:
+    """Leaderboards should sort by the chosen key and skip wrestlers without matches."""
+    roster = seed_roster()
+    analytics = RosterAnalytics(roster)
+    assert analytics.leaderboard() == []
+    matches = list(round_robin(roster))
+    for seed in range(20):
+        analytics.apply_result(roster, simulate_match(matches[seed % 3], roster, seed))
+
+    rows = analytics.leaderboard("average_rating", limit=3)
+    assert len(rows) <= 3
+    ratings = [row.average_rating for row in rows]
+    assert ratings == sorted(ratings, reverse=True)
+    assert all(row.matches >= 1 for row in rows)
+    with pytest.raises(KeyError):
+        analytics.leaderboard("charisma")
+    with pytest.raises(ValueError):
+        RosterAnalytics(roster, window=0)
+    with pytest.raises(ValueError):
+        RosterAnalytics(roster, undo_depth=-1)
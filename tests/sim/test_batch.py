@@ -0,0 +1,127 @@
+"""Tests for the vectorized batch simulator."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from domain.models import Match  # noqa: E402
+from domain.roster import seed_roster  # noqa: E402
+from domain.store import RosterStore  # noqa: E402
+from sim.batch import apply_batch, roster_arrays, simulate_batch  # noqa: E402
+from sim.engine import simulate_match  # noqa: E402
+from sim.rng import CounterRNG, derive_seed  # noqa: E402
+from sim.rules import MatchType, Modifier, register_match_type  # noqa: E402
+
+
+def test_simulate_batch_deterministic() -> None:
+    """Equal seeds should produce equal columnar outcomes."""
+    arrays = roster_arrays(seed_roster())
+    a_idx = np.zeros(100, dtype=np.int64)
+    b_idx = np.ones(100, dtype=np.int64)
+    seeds = np.arange(100)
+    first = simulate_batch(arrays, a_idx, b_idx, seeds)
+    second = simulate_batch(arrays, a_idx, b_idx, seeds)
+    assert np.array_equal(first.winner_idx, second.winner_idx)
+    assert np.array_equal(first.rating, second.rating)
+    assert np.array_equal(first.stamina_loss, second.stamina_loss)
+
+
+def test_simulate_batch_bounds() -> None:
+    """Ratings and stamina loss should stay within engine bounds."""
+    arrays = roster_arrays(seed_roster())
+    size = len(arrays.ids)
+    rng = np.random.default_rng(0)
+    a_idx = rng.integers(0, size, 5000)
+    b_idx = (a_idx + rng.integers(1, size, 5000)) % size
+    result = simulate_batch(arrays, a_idx, b_idx, np.arange(5000))
+    assert len(result) == 5000
+    assert result.rating.min() >= 0 and result.rating.max() <= 100
+    assert result.stamina_loss.min() >= 8 and result.stamina_loss.max() <= 12
+    assert np.all((result.winner_idx == a_idx) | (result.winner_idx == b_idx))
+    assert np.all(result.winner_idx != result.loser_idx)
+
+
+def test_simulate_batch_matches_scalar_distribution() -> None:
+    """Win rate and mean rating should match the scalar engine."""
+    roster = seed_roster()
+    arrays = roster_arrays(roster)
+    count = 20000
+    a_idx = np.full(count, arrays.ids.index("mina"))
+    b_idx = np.full(count, arrays.ids.index("goro"))
+    batch = simulate_batch(arrays, a_idx, b_idx, np.arange(count))
+
+    match = Match("mina", "goro")
+    scalar = [simulate_match(match, roster, seed) for seed in range(count)]
+    scalar_win = sum(result.winner_id == "mina" for result in scalar) / count
+    scalar_rating = sum(result.rating for result in scalar) / count
+
+    assert abs(float(np.mean(batch.winner_idx == a_idx)) - scalar_win) < 0.02
+    assert abs(float(batch.rating.mean()) - scalar_rating) < 0.2
+
+
+def test_apply_batch_updates_store() -> None:
+    """Batch deltas should land on the winner and loser rows."""
+    store = RosterStore.from_roster(seed_roster())
+    before = store.stamina.copy()
+    result = simulate_batch(store, np.array([0]), np.array([1]), np.array([9]))
+    apply_batch(store, result)
+    winner, loser = int(result.winner_idx[0]), int(result.loser_idx[0])
+    assert store.stamina[winner] == before[winner] - result.stamina_loss[0]
+    assert store.stamina[loser] == before[loser] - result.stamina_loss[0]
+
+
+def test_simulate_batch_is_bit_identical_to_counter_rng() -> None:
+    """Batch rows should equal scalar runs on the counter-based backend."""
+    roster = seed_roster()
+    arrays = roster_arrays(roster)
+    seeds = np.array([0, 1, 2, -3, 2**40])
+    batch = simulate_batch(arrays, np.zeros(5), np.full(5, 7), seeds)
+    match = Match(arrays.ids[0], arrays.ids[7])
+    for row, seed in enumerate(seeds.tolist()):
+        result = simulate_match(match, roster, seed, rng_factory=CounterRNG)
+        assert arrays.ids[batch.winner_idx[row]] == result.winner_id
+        assert batch.rating[row] == result.rating
+        assert -batch.stamina_loss[row] == result.winner_delta.stamina
+
+
+def test_simulate_batch_accepts_derived_stream_seeds() -> None:
+    """Unsigned derive_seed outputs go straight in, as a list or a uint64 array."""
+    roster = seed_roster()
+    arrays = roster_arrays(roster)
+    seeds = [derive_seed(9, week, match) for week in range(4) for match in range(8)] + [-1, 5]
+    assert any(seed >= 2**63 for seed in seeds)
+    a_idx, b_idx = np.zeros(len(seeds)), np.full(len(seeds), 3)
+    batch = simulate_batch(arrays, a_idx, b_idx, seeds)
+    unsigned = [seed & 0xFFFFFFFFFFFFFFFF for seed in seeds]
+    again = simulate_batch(arrays, a_idx, b_idx, np.array(unsigned, dtype=np.uint64))
+    assert np.array_equal(batch.rating, again.rating)
+    match = Match(arrays.ids[0], arrays.ids[3])
+    for row, seed in enumerate(seeds):
+        result = simulate_match(match, roster, seed, rng_factory=CounterRNG)
+        assert arrays.ids[batch.winner_idx[row]] == result.winner_id
+        assert batch.rating[row] == result.rating
+
+
+def test_simulate_batch_uses_match_type_rules() -> None:
+    """Batch runs of a custom match type should match the scalar engine."""
+    register_match_type(
+        MatchType(
+            "Test Batch Ladder",
+            modifiers=(Modifier("agility", weight=lambda profile: 100 - profile[1]),),
+            winner_popularity=5,
+        )
+    )
+    roster = seed_roster()
+    arrays = roster_arrays(roster)
+    seeds = np.arange(200)
+    batch = simulate_batch(
+        arrays, np.full(200, 2), np.full(200, 5), seeds, match_type="Test Batch Ladder"
+    )
+    match = Match(arrays.ids[2], arrays.ids[5], "Test Batch Ladder")
+    assert batch.winner_popularity == 5
+    for row, seed in enumerate(seeds.tolist()):
+        result = simulate_match(match, roster, seed, rng_factory=CounterRNG)
+        assert arrays.ids[batch.winner_idx[row]] == result.winner_id
+        assert batch.rating[row] == result.rating
@@ -0,0 +1,66 @@
+"""Tests for the memoized match result cache."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.cache import CacheInfo, ResultCache
+from sim.engine import simulate_match
+from sim.rng import CounterRNG
+
+
+def test_cached_results_match_engine() -> None:
+    """Hits and misses should both return exactly what simulate_match returns."""
+    roster = seed_roster()
+    cache = ResultCache()
+    match = Match("asha", "rohan")
+    for seed in range(20):
+        for rng_factory in (None, CounterRNG):
+            kwargs = {"rng_factory": rng_factory} if rng_factory else {}
+            expected = simulate_match(match, roster, seed, **kwargs)
+            assert cache.simulate(match, roster, seed, **kwargs) == expected
+            assert cache.simulate(match, roster, seed, **kwargs) is cache.simulate(
+                match, copy.deepcopy(roster), seed, **kwargs
+            )
+    assert cache.info() == CacheInfo(hits=80, misses=40, evictions=0, maxsize=65536, currsize=40)
+
+
+def test_stat_changes_miss_and_apply_invalidates() -> None:
+    """Changed stats never hit, and apply_result drops both wrestlers' entries."""
+    roster = seed_roster()
+    cache = ResultCache()
+    first = cache.simulate(Match("asha", "rohan"), roster, 1)
+    cache.simulate(Match("asha", "mina"), roster, 1)
+    cache.simulate(Match("mina", "jax"), roster, 1)
+    cache.apply_result(roster, first)
+    assert len(cache) == 1
+    assert cache.invalidate("asha") == 0
+    assert cache.simulate(Match("asha", "rohan"), roster, 1) == simulate_match(
+        Match("asha", "rohan"), roster, 1
+    )
+    roster["jax"].stamina -= 1
+    cache.simulate(Match("mina", "jax"), roster, 1)
+    assert cache.info().hits == 0
+
+
+def test_lru_eviction_is_bounded() -> None:
+    """The least recently used entry is evicted once maxsize is exceeded."""
+    roster = seed_roster()
+    cache = ResultCache(maxsize=2)
+    match = Match("asha", "rohan")
+    cache.simulate(match, roster, 1)
+    cache.simulate(match, roster, 2)
+    cache.simulate(match, roster, 1)
+    cache.simulate(match, roster, 3)
+    assert cache.info().evictions == 1 and len(cache) == 2
+    cache.simulate(match, roster, 1)
+    cache.simulate(match, roster, 2)
+    assert cache.info().hits == 2
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
@@ -0,0 +1,94 @@
+"""Tests for whole-card simulation."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.models import Card, Match, TeamMatch
+from domain.roster import seed_roster
+from sim.card import apply_card, is_valid_card, simulate_card, simulate_team_match
+from sim.engine import apply_result, simulate_match
+from sim.rules import MatchType, Modifier, register_match_type
+
+
+def test_singles_team_match_matches_engine() -> None:
+    """A one-on-one TeamMatch reproduces simulate_match exactly."""
+    roster = seed_roster()
+    for seed in range(50):
+        single = simulate_match(Match("asha", "goro"), roster, seed)
+        team = simulate_team_match(TeamMatch.free_for_all("asha", "goro"), roster, seed)
+        assert (team.winners, team.losers) == ((single.winner_id,), (single.loser_id,))
+        assert team.rating == single.rating
+        assert team.deltas == dict(single.deltas)
+
+
+def test_team_matches_use_registered_modifiers() -> None:
+    """Team matches follow the match type's modifiers, including 1v1 equivalence."""
+    register_match_type(
+        MatchType(
+            "Test Team Rules",
+            modifiers=(
+                Modifier("underdog", weight=lambda profile: 80 if profile[2] == "Heel" else 0),
+                Modifier("crowd", rating=lambda profile: 4),
+                Modifier("heel_heat", pairing=lambda a, b: 7 if a == "Heel" else 0),
+            ),
+            winner_popularity=5,
+        )
+    )
+    roster = seed_roster()
+    for seed in range(50):
+        single = simulate_match(Match("goro", "asha", "Test Team Rules"), roster, seed)
+        team = simulate_team_match(
+            TeamMatch.free_for_all("goro", "asha", match_type="Test Team Rules"), roster, seed
+        )
+        assert (team.winners, team.losers) == ((single.winner_id,), (single.loser_id,))
+        assert team.rating == single.rating
+        assert team.deltas == dict(single.deltas)
+
+    tag = TeamMatch.tag(("asha", "ember"), ("rohan", "goro"), "Test Team Rules")
+    plain = TeamMatch.tag(("asha", "ember"), ("rohan", "goro"))
+    boosted = [simulate_team_match(tag, roster, seed) for seed in range(50)]
+    baseline = [simulate_team_match(plain, roster, seed) for seed in range(50)]
+    assert all(result.winner_delta.popularity == 5 for result in boosted)
+    assert sum(result.winners == ("rohan", "goro") for result in boosted) > sum(
+        result.winners == ("rohan", "goro") for result in baseline
+    )
+
+
+def test_card_equals_sequential_bookings_and_commits_once() -> None:
+    """Stat changes feed later matches; the roster only changes on commit."""
+    matches = (Match("asha", "rohan"), Match("rohan", "mina"), Match("asha", "mina"))
+    sequential = seed_roster()
+    expected = []
+    for offset, match in enumerate(matches):
+        result = simulate_match(match, sequential, 5 + offset)
+        apply_result(sequential, result)
+        expected.append(result)
+
+    roster = seed_roster()
+    card_result = simulate_card(Card(matches), roster, 5)
+    assert list(card_result.results) == expected
+    assert roster == seed_roster()
+    apply_card(roster, card_result)
+    assert roster == sequential
+    assert set(card_result.deltas) == {"asha", "rohan", "mina"}
+
+
+def test_tag_and_multi_person_matches() -> None:
+    """Team matches split winners and losers by side and validate their shape."""
+    roster = seed_roster()
+    card = Card(
+        (
+            TeamMatch.tag(("asha", "ember"), ("rohan", "goro")),
+            TeamMatch.free_for_all("mina", "ivy", "jax"),
+        )
+    )
+    assert is_valid_card(card, roster)
+    tag, triple = simulate_card(card, roster, 1).results
+    assert sorted(tag.winners + tag.losers) == ["asha", "ember", "goro", "rohan"]
+    assert len(tag.winners) == 2
+    assert len(triple.winners) == 1 and len(triple.losers) == 2
+    assert not is_valid_card(Card((Match("asha", "nobody"),)), roster)
+    assert not is_valid_card(Card(()), roster)
+    with pytest.raises(ValueError):
+        TeamMatch.tag(("asha",), ("asha",))
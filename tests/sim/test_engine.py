@@ -42,10 +42,8 @@ def test_apply_result_clamps_stats() -> None:
         winner_id="a",
         loser_id="b",
         rating=80,
-        deltas={
-            "a": StatDelta(popularity=10, stamina=5),
-            "b": StatDelta(popularity=-10, stamina=-5),
-        },
+        winner_delta=StatDelta(popularity=10, stamina=5),
+        loser_delta=StatDelta(popularity=-10, stamina=-5),
     )
     apply_result(roster, result)
     assert roster["a"].popularity == 100
@@ -0,0 +1,81 @@
+"""Tests for the event-sourced roster ledger."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.engine import simulate_match
+from sim.ledger import RosterLedger
+from sim.runner import round_robin
+
+
+def _play(ledger: RosterLedger, count: int, seed: int = 1) -> list:
+    """Apply `count` round-robin results and return roster copies after each."""
+    matches = list(round_robin(ledger.roster))
+    history = [copy.deepcopy(ledger.roster)]
+    for offset in range(count):
+        match = matches[offset % len(matches)]
+        ledger.apply(simulate_match(match, ledger.roster, seed + offset))
+        history.append(copy.deepcopy(ledger.roster))
+    return history
+
+
+def test_roster_at_matches_recorded_states() -> None:
+    """Point-in-time reconstruction should match the roster at every step."""
+    ledger = RosterLedger(seed_roster(), checkpoint_every=4)
+    history = _play(ledger, 30)
+    for match_number, expected in enumerate(history):
+        assert ledger.roster_at(match_number) == expected
+    with pytest.raises(IndexError):
+        ledger.roster_at(31)
+
+
+def test_undo_redo_restores_clamped_stats() -> None:
+    """Undo should restore exact prior stats even after clamping."""
+    ledger = RosterLedger(seed_roster(), checkpoint_every=3)
+    history = _play(ledger, 40)
+    for match_number in range(40, 30, -1):
+        expected = ledger.event(match_number)
+        assert ledger.undo() is expected
+        assert ledger.roster == history[match_number - 1]
+    assert ledger.redo() is not None
+    assert ledger.roster == history[31]
+    ledger.apply(simulate_match(Match("asha", "rohan"), ledger.roster, 999))
+    assert ledger.match_count == 32
+    assert not ledger.can_redo
+
+
+def test_bookings_follow_undo_redo_and_forks() -> None:
+    """The booking stored with each result survives undo/redo and branches."""
+    ledger = RosterLedger(seed_roster())
+    match = Match("rohan", "asha")
+    ledger.apply(simulate_match(match, ledger.roster, 1), match)
+    ledger.apply(simulate_match(Match("mina", "leo"), ledger.roster, 2))
+    assert ledger.booking(1) == match
+    assert ledger.booking(2) is None
+    ledger.undo()
+    with pytest.raises(IndexError):
+        ledger.booking(2)
+    ledger.redo()
+    assert ledger.booking(2) is None
+    ledger.undo()
+    rematch = Match("asha", "mina")
+    ledger.apply(simulate_match(rematch, ledger.roster, 3), rematch)
+    assert ledger.booking(2) == rematch
+    assert ledger.fork(1).booking(1) == match
+
+
+def test_fork_is_independent() -> None:
+    """Forks should branch from a past state without touching the parent."""
+    ledger = RosterLedger(seed_roster(), checkpoint_every=5)
+    history = _play(ledger, 12)
+    fork = ledger.fork(7)
+    assert fork.roster == history[7]
+    fork.apply(simulate_match(Match("leo", "ivy"), fork.roster, 50))
+    assert ledger.roster == history[12]
+    assert fork.match_count == 8
+    assert fork.roster_at(7) == history[7]
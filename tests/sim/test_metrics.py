@@ -0,0 +1,71 @@
+"""Tests for opt-in metrics and session profiling."""
+
+from __future__ import annotations
+
+import pstats
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim import engine, ledger, metrics
+from sim.profiling import profile_session
+from sim.rng import RNG
+
+
+def test_install_counts_and_uninstall_restores() -> None:
+    """Instrumented calls are recorded, including by-name imports; uninstall undoes it."""
+    original = engine.simulate_match
+    registry = metrics.MetricsRegistry()
+    metrics.install(registry)
+    try:
+        assert hasattr(ledger.apply_result, "__wrapped__")
+        roster = seed_roster()
+        book = ledger.RosterLedger(roster)
+        book.apply(engine.simulate_match(Match("asha", "rohan"), roster, 1))
+    finally:
+        metrics.uninstall()
+    assert engine.simulate_match is original
+    assert not metrics.installed()
+    assert not hasattr(RNG.randint, "__wrapped__")
+    calls = {}
+    rng_calls = {}
+    for (name, labels), value in registry.counters.items():
+        if name == "rng_calls":
+            rng_calls[dict(labels)["method"]] = value
+        else:
+            calls[name] = value
+    assert calls == {"simulate_match_calls": 1, "apply_result_calls": 1}
+    assert rng_calls["randint"] >= 3 and rng_calls["weighted_choice"] == 1
+
+
+def test_exports() -> None:
+    """Snapshot and Prometheus text include counters and cumulative buckets."""
+    registry = metrics.MetricsRegistry()
+    registry.increment("screen_transitions", labels={"screen": "HubScreen"})
+    registry.observe("simulate_match", 0.0002)
+    registry.observe("simulate_match", 0.002)
+    snapshot = registry.snapshot()
+    histogram = snapshot["histograms"][0]
+    assert histogram["count"] == 2 and histogram["buckets"]["+Inf"] == 2
+    text = registry.to_prometheus()
+    assert 'wrestlegm_screen_transitions_total{screen="HubScreen"} 1' in text
+    assert 'wrestlegm_simulate_match_seconds_bucket{le="+Inf"} 2' in text
+    assert "wrestlegm_simulate_match_seconds_count 2" in text
+
+
+def test_profile_session_outputs(tmp_path) -> None:
+    """Both profilers write their output files."""
+    roster = seed_roster()
+    stats_path = tmp_path / "session.prof"
+    with profile_session(str(stats_path)):
+        engine.simulate_match(Match("asha", "rohan"), roster, 1)
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+    folded = tmp_path / "session.folded"
+    with profile_session(str(folded), "sample"):
+        for seed in range(3000):
+            engine.simulate_match(Match("asha", "rohan"), roster, seed)
+    assert "simulate_match" in folded.read_text()
+    with pytest.raises(ValueError):
+        with profile_session(str(folded), "perf"):
+            pass
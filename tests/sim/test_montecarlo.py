@@ -0,0 +1,65 @@
+"""Tests for Monte Carlo odds estimation."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim import montecarlo
+from sim.engine import simulate_match
+from sim.montecarlo import estimate_odds
+from sim.rules import Modifier, add_modifier, get_match_type, register_match_type
+
+
+def test_estimate_odds_matches_replicas() -> None:
+    """Without early stopping, the estimate should tally every replica."""
+    roster = seed_roster()
+    match = Match("asha", "goro")
+    odds = estimate_odds(match, roster, samples=500, seed=3, tolerance=None, chunk_size=64)
+    results = [simulate_match(match, roster, seed) for seed in range(3, 503)]
+    wins = sum(result.winner_id == "asha" for result in results)
+    assert odds.samples == 500
+    assert odds.win_probability == wins / 500
+    assert sum(odds.rating_histogram) == 500
+    assert odds.mean_rating == sum(result.rating for result in results) / 500
+    low, high = odds.win_interval
+    assert low <= odds.win_probability <= high
+
+
+def test_estimate_odds_stops_early() -> None:
+    """A loose tolerance should stop well before the sample cap."""
+    roster = seed_roster()
+    odds = estimate_odds(Match("asha", "goro"), roster, samples=50000, tolerance=0.05)
+    assert odds.samples < 50000
+    low, high = odds.win_interval
+    assert (high - low) / 2 <= 0.05
+
+
+def test_estimate_odds_parallel_matches_serial() -> None:
+    """Process-pool runs should be identical to serial runs."""
+    roster = seed_roster()
+    match = Match("leo", "ivy")
+    kwargs = dict(samples=4000, tolerance=None, chunk_size=500)
+    serial = estimate_odds(match, roster, workers=1, **kwargs)
+    parallel = estimate_odds(match, roster, workers=2, parallel_threshold=1, **kwargs)
+    assert serial == parallel
+
+
+def test_spawned_workers_see_runtime_modifiers(monkeypatch) -> None:
+    """Spawned workers replay the match under the parent's rules."""
+    spawn_pool = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(montecarlo, "ProcessPoolExecutor", spawn_pool)
+    roster = seed_roster()
+    match = Match("leo", "ivy")
+    kwargs = dict(samples=2000, tolerance=None, chunk_size=500)
+    singles = get_match_type("Singles")
+    try:
+        add_modifier("Singles", Modifier("hype", rating=lambda stats: 30))
+        serial = estimate_odds(match, roster, workers=1, **kwargs)
+        parallel = estimate_odds(match, roster, workers=2, parallel_threshold=1, **kwargs)
+        assert parallel == serial
+    finally:
+        register_match_type(singles)
@@ -0,0 +1,75 @@
+"""Tests for the booking optimizer."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import combinations
+
+import pytest
+
+from domain.roster import seed_roster
+from sim import optimizer
+from sim.optimizer import BookingConstraints, clear_rating_cache, expected_ratings, optimize_card
+from sim.outcomes import outcome_table, profile
+from sim.rules import Modifier, add_modifier, get_match_type, register_match_type
+
+
+def _brute_force(roster, matches: int, constraints: BookingConstraints) -> float:
+    """Return the best total expected rating by exhaustive search."""
+    wrestlers = [w for w in roster.values() if w.stamina >= constraints.min_stamina]
+    pairs = [
+        (outcome_table(profile(a), profile(b)).expected_rating, a, b)
+        for a, b in combinations(wrestlers, 2)
+    ]
+    best = float("-inf")
+    for card in combinations(pairs, matches):
+        ids = [w.id for _, a, b in card for w in (a, b)]
+        same = sum(a.alignment == b.alignment for _, a, b in card)
+        if len(set(ids)) != len(ids):
+            continue
+        if constraints.max_same_alignment is not None and same > constraints.max_same_alignment:
+            continue
+        best = max(best, sum(rating for rating, _, _ in card))
+    return best
+
+
+@pytest.mark.parametrize(
+    "constraints",
+    [BookingConstraints(), BookingConstraints(max_same_alignment=0), BookingConstraints(60, 1)],
+)
+def test_optimizer_matches_brute_force(constraints: BookingConstraints) -> None:
+    """On the seed roster the beam search finds the optimal card."""
+    roster = seed_roster()
+    card = optimize_card(roster, 3, constraints, workers=1)
+    assert card.total_expected_rating == pytest.approx(_brute_force(roster, 3, constraints))
+    ids = [w for match in card.matches for w in (match.wrestler_a_id, match.wrestler_b_id)]
+    assert len(set(ids)) == 6
+    assert all(roster[wrestler_id].stamina >= constraints.min_stamina for wrestler_id in ids)
+
+
+def test_infeasible_constraints_and_symmetric_cache() -> None:
+    """Too few eligible wrestlers raise; scores ignore pairing order."""
+    roster = seed_roster()
+    with pytest.raises(ValueError):
+        optimize_card(roster, 5, workers=1)
+    a, b = profile(roster["asha"]), profile(roster["goro"])
+    scores = expected_ratings([(a, b), (b, a)], workers=1)
+    assert scores[(a, b)] == scores[(b, a)] == outcome_table(a, b).expected_rating
+
+
+def test_spawned_workers_see_runtime_modifiers(monkeypatch) -> None:
+    """Pool workers score with the parent's rules, even when started with spawn."""
+    spawn_pool = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(optimizer, "ProcessPoolExecutor", spawn_pool)
+    roster = seed_roster()
+    pairs = [(profile(a), profile(b)) for a, b in combinations(roster.values(), 2)]
+    singles = get_match_type("Singles")
+    try:
+        add_modifier("Singles", Modifier("hype", rating=lambda stats: 10))
+        scores = expected_ratings(pairs, workers=2, parallel_threshold=1)
+        assert scores == {pair: outcome_table(*pair).expected_rating for pair in pairs}
+    finally:
+        register_match_type(singles)
+        clear_rating_cache()
@@ -0,0 +1,44 @@
+"""Tests for exact pairing outcome tables."""
+
+from __future__ import annotations
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.engine import simulate_match
+from sim.outcomes import outcome_table, pairing_odds
+
+
+def test_outcome_table_is_normalized() -> None:
+    """Rating probabilities should sum to one and the favourite should lead."""
+    table = outcome_table((80, 90, "Face"), (20, 30, "Heel"))
+    assert abs(sum(table.rating_distribution) - 1) < 1e-9
+    assert table.win_probability > 0.5
+    mirrored = outcome_table((20, 30, "Heel"), (80, 90, "Face"))
+    assert abs(table.win_probability + mirrored.win_probability - 1) < 1e-9
+
+
+def test_outcome_table_clamps_ratings() -> None:
+    """Low-rated pairings should pile probability onto a rating of 0."""
+    table = outcome_table((0, 10, "Face"), (0, 10, "Face"))
+    assert table.rating_distribution[0] > 0.5
+    assert table.expected_rating >= 0
+
+
+def test_pairing_odds_match_sampled_outcomes() -> None:
+    """Exact odds should agree with a large sample of simulations."""
+    roster = seed_roster()
+    match = Match("mina", "goro")
+    table = pairing_odds(match, roster)
+    results = [simulate_match(match, roster, seed) for seed in range(20000)]
+    win_rate = sum(result.winner_id == "mina" for result in results) / len(results)
+    mean_rating = sum(result.rating for result in results) / len(results)
+    assert abs(table.win_probability - win_rate) < 0.015
+    assert abs(table.expected_rating - mean_rating) < 0.1
+
+
+def test_outcome_table_is_cached() -> None:
+    """Repeated lookups should be served from the cache."""
+    outcome_table.cache_clear()
+    outcome_table((50, 50, "Face"), (50, 50, "Heel"))
+    outcome_table((50, 50, "Face"), (50, 50, "Heel"))
+    assert outcome_table.cache_info().hits == 1
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from sim.rng import RNG
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.engine import simulate_match
+from sim.rng import RNG, CounterRNG, derive_seed
 
 
 def test_rng_determinism() -> None:
@@ -12,3 +15,28 @@ def test_rng_determinism() -> None:
     rolls_a = [rng_a.randint(1, 10) for _ in range(5)]
     rolls_b = [rng_b.randint(1, 10) for _ in range(5)]
     assert rolls_a == rolls_b
+
+
+def test_counter_rng_skip_ahead() -> None:
+    """A stream skipped ahead by n draws should continue the original."""
+    full = CounterRNG(7)
+    rolls = [full.randint(0, 1000) for _ in range(10)]
+    skipped = CounterRNG(7, counter=6)
+    assert [skipped.randint(0, 1000) for _ in range(4)] == rolls[6:]
+
+
+def test_counter_rng_bounds_and_streams() -> None:
+    """Rolls should stay in range and derived streams should differ."""
+    rng = CounterRNG(derive_seed(1, 2, 3))
+    assert all(-5 <= rng.randint(-5, 5) <= 5 for _ in range(1000))
+    streams = {derive_seed(1, week, match) for week in range(20) for match in range(20)}
+    assert len(streams) == 400
+    assert derive_seed(1, 2, 3) == derive_seed(1, 2, 3)
+
+
+def test_engine_accepts_counter_rng() -> None:
+    """simulate_match should run deterministically on the counter backend."""
+    roster = seed_roster()
+    match = Match("asha", "rohan")
+    first = simulate_match(match, roster, 11, rng_factory=CounterRNG)
+    assert first == simulate_match(match, roster, 11, rng_factory=CounterRNG)
@@ -0,0 +1,93 @@
+"""Tests for compiled match rules and modifiers."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.cache import ResultCache
+from sim.engine import simulate_match
+from sim.optimizer import expected_ratings
+from sim.outcomes import outcome_table, pairing_odds, profile
+from sim.rules import (
+    MatchType,
+    Modifier,
+    add_modifier,
+    compiled_rules,
+    get_match_type,
+    match_type_names,
+    pack_profile,
+    register_match_type,
+)
+
+
+def test_default_tables_encode_singles_rules() -> None:
+    """Singles tables hold the alignment bonus and low-stamina penalty."""
+    rules = compiled_rules()
+    assert rules is compiled_rules("Singles")
+    assert rules.pairing == (0, 5, 5, 0)
+    assert rules.weight[pack_profile(60, 30, "Face")] == 90
+    assert rules.rating[pack_profile(60, 39, "Heel")] == -5
+    assert rules.rating[pack_profile(60, 40, "Heel")] == 0
+    assert "Singles" in match_type_names()
+
+
+def test_registered_modifiers_change_outcomes() -> None:
+    """A stipulation modifier shifts ratings and is compiled once per change."""
+    roster = seed_roster()
+    register_match_type(MatchType("Test Street Fight", stamina_loss_base=12))
+    match = Match("asha", "rohan", "Test Street Fight")
+    plain = [simulate_match(Match("asha", "rohan"), roster, seed) for seed in range(50)]
+    street = [simulate_match(match, roster, seed) for seed in range(50)]
+    assert [result.winner_id for result in street] == [result.winner_id for result in plain]
+    assert all(result.winner_delta.stamina <= -12 for result in street)
+    compiled = compiled_rules("Test Street Fight")
+
+    add_modifier("Test Street Fight", Modifier("crowd", rating=lambda profile: 3))
+    assert compiled_rules("Test Street Fight") is not compiled
+    assert len(get_match_type("Test Street Fight").modifiers) == 1
+    boosted = [simulate_match(match, roster, seed) for seed in range(50)]
+    # Asha (Face) vs Rohan (Heel) loses the alignment bonus but gains 3 each.
+    assert [result.rating for result in boosted] == [
+        min(100, result.rating + 1) for result in plain
+    ]
+    table = outcome_table((48, 90, "Face"), (52, 85, "Heel"), "Test Street Fight")
+    assert table.expected_stamina_loss == 14
+
+
+def test_unknown_match_type_raises() -> None:
+    """Simulating an unregistered match type is a KeyError."""
+    with pytest.raises(KeyError, match="Cage"):
+        simulate_match(Match("asha", "rohan", "Cage"), seed_roster(), 1)
+
+
+def test_reregistering_invalidates_derived_caches() -> None:
+    """Outcome tables, optimizer scores, and cached results follow rule changes."""
+    roster = seed_roster()
+    match = Match("asha", "rohan")
+    pair = (profile(roster["asha"]), profile(roster["rohan"]))
+    cache = ResultCache()
+    before_odds = pairing_odds(match, roster)
+    before_rating = expected_ratings([pair])[pair]
+    before_results = [cache.simulate(match, roster, seed) for seed in range(20)]
+    singles = get_match_type("Singles")
+    try:
+        add_modifier(
+            "Singles",
+            Modifier(
+                "heel_favourite",
+                weight=lambda stats: 200 if stats[2] == "Heel" else 0,
+                rating=lambda stats: 10,
+            ),
+        )
+        assert pairing_odds(match, roster).win_probability < before_odds.win_probability
+        assert expected_ratings([pair])[pair] == pytest.approx(before_rating + 20)
+        after_results = [cache.simulate(match, roster, seed) for seed in range(20)]
+        assert after_results == [simulate_match(match, roster, seed) for seed in range(20)]
+        assert after_results != before_results
+        assert len(cache) == 20
+    finally:
+        register_match_type(singles)
+    assert pairing_odds(match, roster) == before_odds
+    assert expected_ratings([pair])[pair] == before_rating
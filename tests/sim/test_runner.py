@@ -0,0 +1,55 @@
+"""Tests for the sharded tournament runner."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from domain.roster import seed_roster
+from sim import runner
+from sim.engine import simulate_match
+from sim.rng import CounterRNG
+from sim.rules import Modifier, add_modifier, get_match_type, register_match_type
+from sim.runner import round_robin, run_tournament
+
+
+def test_round_robin_covers_every_pairing() -> None:
+    """Each unordered pairing should appear exactly once."""
+    matches = list(round_robin(seed_roster()))
+    assert len(matches) == 28
+    assert len({frozenset((m.wrestler_a_id, m.wrestler_b_id)) for m in matches}) == 28
+
+
+def test_run_tournament_matches_serial_loop() -> None:
+    """Sharded serial runs should equal a plain simulate_match loop."""
+    roster = seed_roster()
+    matches = list(round_robin(roster))
+    expected = [simulate_match(m, roster, 5 + i) for i, m in enumerate(matches)]
+    assert run_tournament(matches, roster, seed=5, shard_size=3) == expected
+
+
+def test_run_tournament_parallel_is_bit_identical() -> None:
+    """Process-pool runs should merge back in input order."""
+    roster = seed_roster()
+    matches = list(round_robin(roster)) * 4
+    serial = run_tournament(matches, roster, seed=2, rng_factory=CounterRNG)
+    parallel = run_tournament(
+        matches, roster, seed=2, workers=2, shard_size=7, rng_factory=CounterRNG
+    )
+    assert parallel == serial
+
+
+def test_spawned_workers_see_runtime_modifiers(monkeypatch) -> None:
+    """Spawned workers simulate with the parent's rules, not just the built-ins."""
+    spawn_pool = partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", spawn_pool)
+    roster = seed_roster()
+    matches = list(round_robin(roster))
+    singles = get_match_type("Singles")
+    try:
+        add_modifier("Singles", Modifier("hype", rating=lambda stats: 30))
+        serial = run_tournament(matches, roster, seed=3)
+        assert run_tournament(matches, roster, seed=3, workers=2, shard_size=5) == serial
+    finally:
+        register_match_type(singles)
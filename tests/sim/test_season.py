@@ -0,0 +1,35 @@
+"""Tests for the headless season engine."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from domain.roster import seed_roster
+from sim.season import run_season
+
+
+def test_run_season_is_lazy_and_deterministic() -> None:
+    """Summaries should stream lazily and repeat under the same seed."""
+    first = list(itertools.islice(run_season(seed_roster(), weeks=10_000, seed=5), 20))
+    second = list(itertools.islice(run_season(seed_roster(), weeks=10_000, seed=5), 20))
+    assert first == second
+    assert [summary.week for summary in first] == list(range(1, 21))
+
+
+def test_run_season_applies_results_incrementally() -> None:
+    """Stamina should fall without recovery and stay within bounds."""
+    roster = seed_roster()
+    summaries = list(run_season(roster, weeks=30, matches_per_week=4))
+    assert summaries[-1].stamina_mean < summaries[0].stamina_mean
+    for summary in summaries:
+        assert 0 <= summary.stamina_min <= summary.stamina_max <= 100
+        assert 0 <= summary.popularity_min <= summary.popularity_max <= 100
+    assert summaries[-1].stamina_mean == sum(w.stamina for w in roster.values()) / len(roster)
+
+
+def test_run_season_rejects_oversized_cards() -> None:
+    """Cards cannot book more wrestlers than the roster holds."""
+    with pytest.raises(ValueError):
+        next(run_season(seed_roster(), weeks=1, matches_per_week=5))
@@ -0,0 +1,111 @@
+"""Tests for the binary match-history log."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from domain.models import Match  # noqa: E402
+from domain.roster import seed_roster  # noqa: E402
+from sim.engine import apply_result, simulate_match  # noqa: E402
+from storage.history import HEADER, MAGIC, RECORD, HistoryReader, HistoryWriter  # noqa: E402
+
+
+def _book(roster, pairs, seed=1):
+    """Simulate and apply a list of pairings, returning (seed, result) pairs."""
+    booked = []
+    for offset, (a_id, b_id) in enumerate(pairs):
+        result = simulate_match(Match(a_id, b_id), roster, seed + offset)
+        apply_result(roster, result)
+        booked.append((seed + offset, result))
+    return booked
+
+
+def test_history_round_trip(tmp_path) -> None:
+    """Records should read back with the IDs, rating, deltas, and seed."""
+    path = str(tmp_path / "history.bin")
+    booked = _book(seed_roster(), [("asha", "rohan"), ("leo", "asha"), ("ivy", "goro")])
+    with HistoryWriter(path) as writer:
+        for seed, result in booked:
+            writer.append(result, seed)
+
+    with HistoryReader(path) as reader:
+        assert len(reader) == 3
+        record = reader.records[1]
+        seed, result = booked[1]
+        assert reader.ids[record["winner"]] == result.winner_id
+        assert reader.ids[record["loser"]] == result.loser_id
+        assert record["rating"] == result.rating
+        assert record["seed"] == seed
+        assert record["winner_stamina"] == result.winner_delta.stamina
+        match_nos, ratings = reader.ratings_for("asha")
+        assert match_nos.tolist() == [1, 2]
+        assert ratings.tolist() == [booked[0][1].rating, booked[1][1].rating]
+        assert len(reader.matches_for("unknown")) == 0
+
+
+def test_history_appends_across_sessions(tmp_path) -> None:
+    """Reopening a log should continue numbering and reuse interned IDs."""
+    path = str(tmp_path / "history.bin")
+    roster = seed_roster()
+    with HistoryWriter(path) as writer:
+        for seed, result in _book(roster, [("asha", "rohan")]):
+            writer.append(result, seed)
+    with HistoryWriter(path) as writer:
+        assert len(writer) == 1
+        for seed, result in _book(roster, [("rohan", "asha")], seed=2):
+            assert writer.append(result, seed) == 2
+        assert writer.append(result, seed, match_no=10) == 10
+        assert writer.append(result, seed) == 11
+    with HistoryReader(path) as reader:
+        assert reader.records["match_no"].tolist() == [1, 2, 10, 11]
+        assert sorted(reader.ids) == ["asha", "rohan"]
+
+
+def test_revert_and_restore_hide_undone_matches(tmp_path) -> None:
+    """Reverted matches drop out of reads; restore and reopening keep numbering in step."""
+    path = str(tmp_path / "history.bin")
+    booked = _book(seed_roster(), [("asha", "rohan"), ("leo", "asha"), ("asha", "goro")])
+    with HistoryWriter(path) as writer:
+        for seed, result in booked[:2]:
+            writer.append(result, seed)
+        assert writer.revert() == 2
+        assert writer.restore() == 2
+        assert writer.revert() == 2
+        assert writer.revert() == 1
+        assert writer.revert() is None
+        assert writer.restore() == 1
+    with HistoryWriter(path) as writer:
+        seed, result = booked[2]
+        assert writer.append(result, seed) == 2
+        assert writer.restore() is None
+    with HistoryReader(path) as reader:
+        assert len(reader) == 8
+        assert reader.live_records()["match_no"].tolist() == [1, 2]
+        match_nos, ratings = reader.ratings_for("asha")
+        assert match_nos.tolist() == [1, 2]
+        assert ratings.tolist() == [booked[0][1].rating, booked[2][1].rating]
+        assert len(reader.matches_for("leo")) == 0
+
+
+def test_version_1_logs_are_upgraded(tmp_path) -> None:
+    """Version 1 logs stay readable and gain the current header when appended to."""
+    path = tmp_path / "history.bin"
+    with HistoryWriter(str(path)) as writer:
+        for seed, result in _book(seed_roster(), [("asha", "rohan")]):
+            writer.append(result, seed)
+    path.write_bytes(HEADER.pack(MAGIC, 1, RECORD.size) + path.read_bytes()[HEADER.size :])
+    with HistoryReader(str(path)) as reader:
+        assert len(reader.live_records()) == 1
+    with HistoryWriter(str(path)) as writer:
+        assert writer.revert() == 1
+    assert HEADER.unpack_from(path.read_bytes())[1] == 2
+
+
+def test_history_rejects_foreign_files(tmp_path) -> None:
+    """Files without the log header should not be opened."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a history log")
+    with pytest.raises(ValueError):
+        HistoryReader(str(path))
@@ -0,0 +1,92 @@
+"""Tests for roster and app-state snapshots."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from domain.state import AppState
+from sim.engine import apply_result, simulate_match
+from storage.snapshot import (
+    HEADER,
+    load_delta,
+    load_snapshot,
+    save_delta,
+    save_snapshot,
+)
+
+
+def _played_state(roster):
+    """Book one match and return the resulting AppState."""
+    match = Match("asha", "rohan")
+    result = simulate_match(match, roster, seed=4)
+    apply_result(roster, result)
+    return AppState("asha", "rohan", match, result, seed=5)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_snapshot_round_trip(tmp_path, compress) -> None:
+    """Roster and state should load back exactly."""
+    roster = seed_roster()
+    state = _played_state(roster)
+    path = str(tmp_path / "session.snap")
+    save_snapshot(path, roster, state, compress=compress)
+    loaded_roster, loaded_state = load_snapshot(path)
+    assert loaded_roster == roster
+    assert list(loaded_roster) == list(roster)
+    assert loaded_state == state
+
+
+def test_snapshot_round_trip_empty_state(tmp_path) -> None:
+    """A fresh AppState should survive a round trip."""
+    path = str(tmp_path / "fresh.snap")
+    save_snapshot(path, seed_roster(), AppState())
+    assert load_snapshot(path)[1] == AppState()
+
+
+def test_snapshot_keeps_match_type(tmp_path) -> None:
+    """A non-Singles last match should keep its type; version 1 files read as Singles."""
+    state = AppState(last_match=Match("asha", "rohan", "Hardcore"), seed=3)
+    path = tmp_path / "hardcore.snap"
+    save_snapshot(str(path), seed_roster(), state)
+    assert load_snapshot(str(path))[1].last_match == Match("asha", "rohan", "Hardcore")
+
+    data = path.read_bytes()
+    magic, _, flags, count = HEADER.unpack_from(data, 0)
+    blob = struct.pack("<I", len(b"Hardcore")) + b"Hardcore"
+    body = data[HEADER.size :].replace(blob, b"", 1)
+    path.write_bytes(HEADER.pack(magic, 1, flags, count) + body)
+    assert load_snapshot(str(path))[1].last_match == Match("asha", "rohan")
+
+
+def test_delta_snapshot_stores_changed_rows(tmp_path) -> None:
+    """Deltas should record only changed rows and rebuild the full roster."""
+    roster = seed_roster()
+    base = str(tmp_path / "base.snap")
+    save_snapshot(base, roster, AppState())
+    state = _played_state(roster)
+    delta = str(tmp_path / "delta.snap")
+    assert save_delta(delta, base, roster, state, compress=True) == 2
+    loaded_roster, loaded_state = load_delta(delta, base)
+    assert loaded_roster == roster
+    assert loaded_state == state
+    with pytest.raises(ValueError):
+        load_snapshot(delta)
+    (tmp_path / "cut.snap").write_bytes((tmp_path / "delta.snap").read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        load_delta(str(tmp_path / "cut.snap"), base)
+
+
+def test_snapshot_loads_into_store(tmp_path) -> None:
+    """Snapshots should load straight into a RosterStore."""
+    pytest.importorskip("numpy")
+    roster = seed_roster()
+    path = str(tmp_path / "store.snap")
+    save_snapshot(path, roster, AppState())
+    store, _ = load_snapshot(path, as_store=True)
+    assert store.to_roster() == roster
+    save_snapshot(path, store, AppState())
+    assert load_snapshot(path)[0] == roster
@@ -0,0 +1,172 @@
+"""Tests for the SQLite roster, state, and history store."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.engine import apply_result, simulate_match
+from storage.sqlite import _STAT_TREND, _TOP_FOR_WRESTLER, SQLiteStore
+
+PAIRS = [("asha", "rohan"), ("leo", "asha"), ("ivy", "goro"), ("asha", "mina"), ("jax", "leo")]
+
+
+def _book(roster, pairs, seed=1):
+    """Simulate and apply pairings, returning (match, result, seed) triples."""
+    booked = []
+    for offset, (a_id, b_id) in enumerate(pairs):
+        match = Match(a_id, b_id)
+        result = simulate_match(match, roster, seed + offset)
+        apply_result(roster, result)
+        booked.append((match, result, seed + offset))
+    return booked
+
+
+def test_record_round_trips_roster_state_and_history(tmp_path) -> None:
+    """Recorded matches, roster stats, and state should survive a reopen."""
+    path = str(tmp_path / "league.db")
+    roster = seed_roster()
+    with SQLiteStore(path) as store:
+        store.save_roster(roster)
+        booked = _book(roster, PAIRS)
+        for match, result, seed in booked:
+            store.record(match, result, seed, roster)
+        state = store.load_state()
+        state.seed = 6
+        state.selected_a_id = "ivy"
+        store.save_state(state)
+
+    with SQLiteStore(path) as store:
+        assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store.load_roster() == roster
+        assert list(store.load_roster()) == list(roster)
+        state = store.load_state()
+        assert (state.seed, state.selected_a_id, state.selected_b_id) == (6, "ivy", None)
+        assert (state.last_match, state.last_result) == booked[-1][:2]
+        stored = store.get_match(2)
+        assert (stored.match, stored.result, stored.seed) == booked[1]
+        assert store.match_count() == len(PAIRS)
+        trend = store.stat_trend("asha")
+        assert [match_no for match_no, _, _ in trend] == [1, 2, 4]
+        assert trend[-1][1:] == (roster["asha"].popularity, roster["asha"].stamina)
+
+
+def test_undo_hides_matches_and_redo_restores_them(tmp_path) -> None:
+    """Undone matches leave every query until redone; a new booking drops them."""
+    roster = seed_roster()
+    with SQLiteStore(str(tmp_path / "league.db")) as store:
+        store.save_roster(roster)
+        booked = _book(roster, PAIRS[:3])
+        for match, result, seed in booked:
+            store.record(match, result, seed, roster)
+        top = max(booked[:2], key=lambda entry: entry[1].rating)
+        rolled_back = copy.deepcopy(roster)
+        for wrestler_id, delta in booked[2][1].deltas.items():
+            rolled_back[wrestler_id].popularity -= delta.popularity
+            rolled_back[wrestler_id].stamina -= delta.stamina
+
+        assert store.undo_last([rolled_back["ivy"], rolled_back["goro"]]) == 3
+        assert store.match_count() == 2
+        assert store.get_match(3) is None
+        assert all(stored.match_no != 3 for stored in store.top_matches(limit=10))
+        assert store.top_matches("ivy") == []
+        assert store.stat_trend("goro") == []
+        state = store.load_state()
+        assert (state.last_match, state.last_result) == booked[1][:2]
+        assert store.load_roster()["ivy"] == rolled_back["ivy"]
+        assert store.top_matches(limit=1)[0].result == top[1]
+
+        assert store.redo_next([roster["ivy"], roster["goro"]]) == 3
+        assert store.redo_next([]) is None
+        assert store.load_state().last_match == booked[2][0]
+        assert store.connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 3
+
+        store.undo_last([rolled_back["ivy"], rolled_back["goro"]])
+        match, result, seed = _book(rolled_back, [("asha", "jax")], seed=9)[0]
+        assert store.record(match, result, seed, rolled_back) == 3
+        assert store.get_match(3).match == match
+        assert store.connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 3
+
+
+def test_version_1_databases_are_upgraded(tmp_path) -> None:
+    """Opening a schema-1 database adds the reverted flag in place."""
+    path = str(tmp_path / "league.db")
+    with SQLiteStore(path) as store:
+        store.connection.execute("DROP INDEX matches_reverted")
+        store.connection.execute("ALTER TABLE matches DROP COLUMN reverted")
+        store.connection.execute("PRAGMA user_version = 1")
+    roster = seed_roster()
+    with SQLiteStore(path) as store:
+        match, result, seed = _book(roster, PAIRS[:1])[0]
+        store.record(match, result, seed, roster)
+        assert store.undo_last([]) == 1
+        assert store.connection.execute("PRAGMA user_version").fetchone()[0] == 2
+
+
+def test_top_matches_use_indexes(tmp_path) -> None:
+    """Top-rated and trend queries should search indexes, not scan the table."""
+    roster = seed_roster()
+    with SQLiteStore(str(tmp_path / "league.db")) as store:
+        booked = _book(roster, PAIRS * 4)
+        for match, result, seed in booked:
+            store.record(match, result, seed, roster)
+        top = store.top_matches("asha", limit=3)
+        ratings = sorted(
+            (
+                result.rating
+                for _, result, _ in booked
+                if "asha" in (result.winner_id, result.loser_id)
+            ),
+            reverse=True,
+        )
+        assert [stored.result.rating for stored in top] == ratings[:3]
+        assert store.top_matches(limit=1)[0].result.rating == max(r.rating for _, r, _ in booked)
+        for query, parameters in ((_TOP_FOR_WRESTLER, ("asha", 3)), (_STAT_TREND, ("asha", 0))):
+            plan = store.query_plan(query, parameters)
+            searches = [step for step in plan if step.startswith(("SEARCH", "SCAN"))]
+            assert len(searches) == 2
+            assert all(step.startswith("SEARCH") and "INDEX" in step for step in searches)
+
+
+def test_import_results_replays_stats(tmp_path) -> None:
+    """Bulk imports should number after existing rows and replay clamped stats."""
+    start = seed_roster()
+    roster = copy.deepcopy(start)
+    booked = _book(roster, PAIRS * 30)
+    with SQLiteStore(str(tmp_path / "league.db")) as store:
+        match, result, seed = booked[0]
+        store.record(match, result, seed, roster)
+        count = store.import_results(
+            [(result, seed) for _, result, seed in booked], start, batch_size=7
+        )
+        assert count == len(booked) and store.match_count() == len(booked) + 1
+        trend = store.stat_trend("goro", since=1)
+        assert trend[-1][1:] == (roster["goro"].popularity, roster["goro"].stamina)
+        assert store.get_match(2).match is None
+        assert store.get_match(2).result == booked[0][1]
+        store.import_results([(result, seed) for _, result, seed in booked[:2]])
+        assert store.stat_trend("asha", since=len(booked) + 1)[0][1:] == (None, None)
+        # One recorded match, 3 per imported round of PAIRS, 2 in the last import.
+        assert len(store.top_matches("asha", limit=1000)) == 1 + 3 * 30 + 2
+
+
+def test_import_history_reads_binary_log(tmp_path) -> None:
+    """A binary history log should import with its results and seeds intact."""
+    pytest.importorskip("numpy")
+    from storage.history import HistoryWriter
+
+    log = str(tmp_path / "history.bin")
+    booked = _book(seed_roster(), PAIRS)
+    with HistoryWriter(log) as writer:
+        for _, result, seed in booked:
+            writer.append(result, seed)
+        writer.append(booked[0][1], -5)
+        writer.append(booked[1][1], 9)
+        writer.revert()
+    with SQLiteStore(str(tmp_path / "league.db")) as store:
+        assert store.import_history(log, seed_roster()) == len(PAIRS) + 1
+        assert [store.get_match(n).result for n in range(1, 6)] == [r for _, r, _ in booked]
+        assert store.get_match(6).seed == -5
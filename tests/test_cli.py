@@ -0,0 +1,94 @@
+"""Tests for the headless CLI."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli import main
+from domain.models import Match
+from domain.roster import seed_roster
+from sim.engine import apply_result, simulate_match
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(argv, text: str):
+    """Run the CLI in-process and return (status, stdout text)."""
+    out = io.StringIO()
+    status = main(argv, stdin=io.StringIO(text), stdout=out)
+    return status, out.getvalue()
+
+
+def test_jsonl_matches_sequential_simulation() -> None:
+    """Results should match booking the same matches one after another."""
+    status, out = _run(["--seed", "7"], "asha rohan\n# comment\n\nmina,goro\n")
+    assert status == 0
+    records = [json.loads(line) for line in out.splitlines()]
+    roster = seed_roster()
+    matches = (Match("asha", "rohan"), Match("mina", "goro"))
+    for seed, record, match in zip((7, 8), records, matches):
+        result = simulate_match(match, roster, seed)
+        apply_result(roster, result)
+        assert record["seed"] == seed
+        assert record["winner"] == result.winner_id
+        assert record["rating"] == result.rating
+
+
+def test_csv_output_and_bad_booking() -> None:
+    """CSV output has a header; invalid bookings exit with status 2."""
+    status, out = _run(["--format", "csv"], "asha rohan\n")
+    assert status == 0
+    assert out.splitlines()[0].startswith("match,seed,wrestler_a")
+    assert len(out.splitlines()) == 2
+    assert _run([], "asha asha\n")[0] == 2
+    assert _run([], "asha nobody\n")[0] == 2
+
+
+def test_missing_bookings_file_is_a_cli_error(tmp_path, capsys, monkeypatch) -> None:
+    """An unreadable bookings file exits with status 2 and closes the history log."""
+    pytest.importorskip("numpy")
+    from storage.history import HistoryWriter
+
+    closed = []
+    close = HistoryWriter.close
+    monkeypatch.setattr(HistoryWriter, "close", lambda self: closed.append(close(self)))
+    history = tmp_path / "history.bin"
+    status, out = _run([str(tmp_path / "missing.txt"), "--history", str(history)], "")
+    assert status == 2
+    assert out == ""
+    assert "missing.txt" in capsys.readouterr().err
+    assert closed
+
+
+def test_unreadable_roster_snapshot_is_a_cli_error(tmp_path, capsys) -> None:
+    """Missing, foreign, or truncated --roster files exit with status 2 and a message."""
+    from domain.state import AppState
+    from storage.snapshot import save_snapshot
+
+    garbage = tmp_path / "garbage.snap"
+    garbage.write_bytes(b"not a snapshot at all")
+    truncated = tmp_path / "truncated.snap"
+    save_snapshot(str(truncated), seed_roster(), AppState(), compress=True)
+    truncated.write_bytes(truncated.read_bytes()[:-10])
+    for path in (tmp_path / "missing.snap", garbage, truncated):
+        assert _run(["--roster", str(path)], "asha rohan\n") == (2, "")
+        assert path.name in capsys.readouterr().err
+
+
+def test_cli_does_not_import_textual() -> None:
+    """The headless path must not load the TUI stack."""
+    code = (
+        "import io, sys, cli; "
+        "cli.main([], stdin=io.StringIO('asha rohan'), stdout=io.StringIO()); "
+        "print('textual' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
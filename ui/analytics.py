@@ -0,0 +1,106 @@
+"""Roster analytics modal: leaderboard and Face/Heel matchup stats."""
+
+from __future__ import annotations
+
+from typing import List
+
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label, Static
+
+from sim.analytics import LEADERBOARD_KEYS, LeaderboardRow, RosterAnalytics
+
+_KEY_TITLES = {
+    "win_rate": "Win Rate",
+    "average_rating": "Avg Rating",
+    "popularity_trend": "Pop Trend",
+    "rolling_stamina": "Rolling Sta",
+    "wins": "Wins",
+}
+_PAIRINGS = (("Face", "Heel"), ("Heel", "Face"), ("Face", "Face"), ("Heel", "Heel"))
+
+
+class AnalyticsScreen(ModalScreen[None]):
+    """Modal showing a sortable leaderboard and alignment matchup stats.
+
+    Reads the app's running `RosterAnalytics`, so opening it costs the same
+    however many matches have been booked.
+    """
+    BINDINGS = [
+        ("escape", "close", "Back"),
+        ("o", "cycle_order", "Sort"),
+    ]
+
+    def __init__(self, analytics: RosterAnalytics, limit: int = 10) -> None:
+        """Create the modal over running analytics, showing the top `limit` rows."""
+        super().__init__()
+        self.analytics = analytics
+        self.limit = limit
+        self.order = "win_rate"
+
+    def compose(self) -> ComposeResult:
+        """Compose the analytics layout."""
+        with Container(id="analytics"):
+            yield Label("Roster Analytics", id="analytics-title")
+            yield Static("", id="analytics-summary")
+            yield Static("", id="analytics-leaderboard")
+            yield Button("Back", id="analytics-back")
+
+    def on_mount(self) -> None:
+        """Render summary and leaderboard, then focus the back button."""
+        self.query_one("#analytics-summary", Static).update(_format_summary(self.analytics))
+        self._render_leaderboard()
+        self.set_focus(self.query_one("#analytics-back", Button))
+
+    def action_cycle_order(self) -> None:
+        """Sort the leaderboard by the next metric."""
+        keys = list(LEADERBOARD_KEYS)
+        self.order = keys[(keys.index(self.order) + 1) % len(keys)]
+        self._render_leaderboard()
+
+    def action_close(self) -> None:
+        """Dismiss the modal."""
+        self.dismiss(None)
+
+    @on(Button.Pressed, "#analytics-back")
+    def _on_back(self) -> None:
+        """Dismiss the modal."""
+        self.dismiss(None)
+
+    def _render_leaderboard(self) -> None:
+        """Refresh the leaderboard for the current sort order."""
+        rows = self.analytics.leaderboard(self.order, self.limit)
+        self.query_one("#analytics-leaderboard", Static).update(
+            _format_leaderboard(rows, _KEY_TITLES[self.order])
+        )
+
+
+def _format_summary(analytics: RosterAnalytics) -> str:
+    """Return the session totals and Face/Heel matchup lines."""
+    lines: List[str] = [
+        f"Matches: {analytics.matches}  Avg rating: {analytics.average_rating:.1f}"
+    ]
+    for winner, loser in _PAIRINGS:
+        matchup = analytics.matchup(winner, loser)
+        lines.append(
+            f"  {winner} over {loser}: {matchup.matches}"
+            f" (avg {matchup.average_rating:.1f})"
+        )
+    lines.append(f"Face win rate vs Heels: {analytics.face_win_rate():.0%}")
+    return "\n".join(lines)
+
+
+def _format_leaderboard(rows: List[LeaderboardRow], title: str) -> str:
+    """Return leaderboard lines, one per wrestler."""
+    if not rows:
+        return f"Leaderboard by {title}\n  No matches yet."
+    lines = [f"Leaderboard by {title} (o to change)"]
+    for rank, row in enumerate(rows, start=1):
+        lines.append(
+            f"{rank:>2}. {row.name:<14} {row.wins}-{row.matches - row.wins}"
+            f"  {row.win_rate:>4.0%}  avg {row.average_rating:>4.1f}"
+            f"  pop {row.popularity_trend:+d}  sta {row.rolling_stamina:.0f}"
+        )
+    return "\n".join(lines)
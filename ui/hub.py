@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import FrozenSet, Mapping, Optional
 
 from textual import on
 from textual.app import ComposeResult
@@ -12,17 +12,26 @@ from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Static
 
 from domain.booking import is_valid_booking
-from domain.models import Wrestler
+from domain.models import Match, Wrestler
+from domain.state import ROSTER
+from sim.outcomes import pairing_odds
+
+_SELECTION_FIELDS = frozenset({"selected_a_id", "selected_b_id"})
+_HUB_FIELDS = _SELECTION_FIELDS | {ROSTER}
 
 
 class HubScreen(Screen):
     """Landing screen for slot selection and match booking.
 
     Provides two slots, a notes line for matchup context, and a booking action.
+    Subscribes to `AppState` and updates only the widgets whose inputs changed.
     """
     BINDINGS = [
         ("up", "focus_previous", "Up"),
         ("down", "focus_next", "Down"),
+        ("u", "undo", "Undo"),
+        ("r", "redo", "Redo"),
+        ("a", "analytics", "Analytics"),
     ]
 
     def compose(self) -> ComposeResult:
@@ -37,30 +46,49 @@ class HubScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Set initial focus to the first slot."""
-        self.set_focus(self.query_one("#slot-a", Button))
-
-    def update_view(
-        self, roster: Dict[str, Wrestler], selected_a_id: Optional[str], selected_b_id: Optional[str]
-    ) -> None:
-        """Update slot labels, notes, and booking button state."""
-        slot_a = roster[selected_a_id].name if selected_a_id else "Empty"
-        slot_b = roster[selected_b_id].name if selected_b_id else "Empty"
-        self.query_one("#slot-a", Button).label = f"Slot A: {slot_a}"
-        self.query_one("#slot-b", Button).label = f"Slot B: {slot_b}"
-
-        notes = "—"
-        if selected_a_id and selected_b_id and selected_a_id != selected_b_id:
-            wrestler_a = roster[selected_a_id]
-            wrestler_b = roster[selected_b_id]
-            if wrestler_a.alignment != wrestler_b.alignment:
-                notes = "Face vs Heel bonus"
-            else:
-                notes = "Same alignment"
-        self.query_one("#notes", Static).update(f"Notes: {notes}")
-
-        book_button = self.query_one("#book", Button)
-        book_button.disabled = not is_valid_booking(selected_a_id, selected_b_id)
+        """Cache widget references, subscribe to state, and render once."""
+        self._slot_a = self.query_one("#slot-a", Button)
+        self._slot_b = self.query_one("#slot-b", Button)
+        self._notes = self.query_one("#notes", Static)
+        self._book_button = self.query_one("#book", Button)
+        self._notes_text = ""
+        self._unsubscribe = self.app.state.subscribe(self.on_state_changed)
+        self.on_state_changed(_HUB_FIELDS)
+        self.set_focus(self._slot_a)
+
+    def on_unmount(self) -> None:
+        """Stop listening to state changes."""
+        self._unsubscribe()
+
+    def on_state_changed(self, changed: FrozenSet[str]) -> None:
+        """Re-render only the parts of the hub that depend on changed fields."""
+        state = self.app.state
+        roster = self.app.roster
+        if "selected_a_id" in changed:
+            self._slot_a.label = f"Slot A: {_slot_name(roster, state.selected_a_id)}"
+        if "selected_b_id" in changed:
+            self._slot_b.label = f"Slot B: {_slot_name(roster, state.selected_b_id)}"
+        if changed & _SELECTION_FIELDS:
+            self._book_button.disabled = not is_valid_booking(
+                state.selected_a_id, state.selected_b_id
+            )
+        if changed & _HUB_FIELDS:
+            notes = f"Notes: {_notes(roster, state.selected_a_id, state.selected_b_id)}"
+            if notes != self._notes_text:
+                self._notes_text = notes
+                self._notes.update(notes)
+
+    def action_undo(self) -> None:
+        """Undo the most recent booking."""
+        self.app.undo_booking()
+
+    def action_redo(self) -> None:
+        """Redo the most recently undone booking."""
+        self.app.redo_booking()
+
+    def action_analytics(self) -> None:
+        """Open the roster analytics panel."""
+        self.app.open_analytics()
 
     @on(Button.Pressed, "#slot-a")
     def _select_a(self) -> None:
@@ -85,3 +113,24 @@ class HubScreen(Screen):
         elif event.key in {"j", "s"}:
             self.focus_next()
             event.stop()
+
+
+def _slot_name(roster: Mapping[str, Wrestler], wrestler_id: Optional[str]) -> str:
+    """Return the slot label text for a selection."""
+    return roster[wrestler_id].name if wrestler_id else "Empty"
+
+
+def _notes(
+    roster: Mapping[str, Wrestler], selected_a_id: Optional[str], selected_b_id: Optional[str]
+) -> str:
+    """Build the matchup notes line for the current selection."""
+    if not (selected_a_id and selected_b_id and selected_a_id != selected_b_id):
+        return "—"
+    wrestler_a = roster[selected_a_id]
+    wrestler_b = roster[selected_b_id]
+    if wrestler_a.alignment != wrestler_b.alignment:
+        notes = "Face vs Heel bonus"
+    else:
+        notes = "Same alignment"
+    odds = pairing_odds(Match(selected_a_id, selected_b_id), roster)
+    return notes + f" · {wrestler_a.name} {odds.win_probability:.0%} to win"
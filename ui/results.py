@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from textual import on
 from textual.app import ComposeResult
@@ -45,13 +45,20 @@ class ResultsScreen(Screen):
     def on_mount(self) -> None:
         """Populate summary and stat changes after mount."""
         roster: Dict[str, Wrestler] = self.app.roster
+        ledger = self.app.ledger
         wrestler_a = roster[self.match.wrestler_a_id]
         wrestler_b = roster[self.match.wrestler_b_id]
         winner = wrestler_a if self.result.winner_id == wrestler_a.id else wrestler_b
-        summary = f"Winner: {winner.name} ({winner.alignment})\nRating: {self.result.rating}/100"
+        record = self.app.analytics.wrestler(winner.id)
+        summary = (
+            f"Winner: {winner.name} ({winner.alignment})\n"
+            f"Rating: {self.result.rating}/100\n"
+            f"Record: {record.wins}-{record.losses} ({record.win_rate:.0%})"
+        )
         self.query_one("#results-summary", Static).update(summary)
+        before = ledger.stats_at(ledger.match_count - 1)
         self.query_one("#results-stats", Static).update(
-            _format_stats(wrestler_a, wrestler_b, self.result)
+            _format_stats(wrestler_a, wrestler_b, self.result, before)
         )
 
     @on(Button.Pressed, "#results-reset")
@@ -86,13 +93,21 @@ class ResultsScreen(Screen):
             event.stop()
 
 
-def _format_stats(wrestler_a: Wrestler, wrestler_b: Wrestler, result: MatchResult) -> str:
-    """Return formatted before/after stat lines for both wrestlers."""
+def _format_stats(
+    wrestler_a: Wrestler,
+    wrestler_b: Wrestler,
+    result: MatchResult,
+    before: Dict[str, Tuple[int, int]],
+) -> str:
+    """Return formatted before/after stat lines for both wrestlers.
+
+    `before` holds (popularity, stamina) prior to the match, as recorded by the
+    roster ledger, so clamped changes show their true starting values.
+    """
     lines: List[str] = ["Stat Changes"]
     for wrestler in (wrestler_a, wrestler_b):
         delta = result.deltas[wrestler.id]
-        before_pop = wrestler.popularity - delta.popularity
-        before_sta = wrestler.stamina - delta.stamina
+        before_pop, before_sta = before[wrestler.id]
         lines.append(
             f"{wrestler.name}\n"
             f"  Pop: {before_pop} -> {wrestler.popularity} ({delta.popularity:+d})\n"
@@ -0,0 +1,134 @@
+"""Virtualized roster list widget."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+RowFormatter = Callable[[int], str]
+
+
+class RosterList(ScrollView, can_focus=True):
+    """Scrollable list that renders only the rows currently on screen.
+
+    Holds a list of row numbers (for example, search results) and a formatter
+    that turns a row number into its label, so a 100k roster costs the same to
+    show as a ten-wrestler one.
+    """
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("enter", "select", "Select", show=False),
+    ]
+    COMPONENT_CLASSES = {"roster-list--cursor"}
+    DEFAULT_CSS = """
+    RosterList > .roster-list--cursor {
+        background: $accent;
+        color: $text;
+    }
+    """
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to a different row."""
+
+        def __init__(self, row: Optional[int]) -> None:
+            """Carry the highlighted row number, or None when empty."""
+            super().__init__()
+            self.row = row
+
+    class Selected(Message):
+        """Posted when the user presses Enter on a row."""
+
+        def __init__(self, row: int) -> None:
+            """Carry the selected row number."""
+            super().__init__()
+            self.row = row
+
+    def __init__(self, formatter: RowFormatter, id: Optional[str] = None) -> None:
+        """Create an empty list that formats rows with `formatter`."""
+        super().__init__(id=id)
+        self._formatter = formatter
+        self._rows: List[int] = []
+        self.cursor = 0
+
+    @property
+    def highlighted_row(self) -> Optional[int]:
+        """Return the row number under the cursor, if any."""
+        if not self._rows:
+            return None
+        return self._rows[self.cursor]
+
+    def set_rows(self, rows: List[int]) -> None:
+        """Replace the visible rows and reset the cursor to the top."""
+        self._rows = rows
+        self.cursor = 0
+        self.virtual_size = Size(self.size.width, len(rows))
+        self.scroll_to(y=0, animate=False)
+        self.refresh()
+        self.post_message(self.Highlighted(self.highlighted_row))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible line of the list."""
+        index = self.scroll_offset.y + y
+        width = self.size.width
+        if index >= len(self._rows):
+            return Strip.blank(width)
+        text = self._formatter(self._rows[index])[:width].ljust(width)
+        style = Style()
+        if index == self.cursor:
+            style = self.get_component_rich_style("roster-list--cursor")
+        return Strip([Segment(text, style)], width)
+
+    def move_cursor(self, offset: int) -> None:
+        """Move the cursor by offset rows, clamped to the list, and keep it visible."""
+        if not self._rows:
+            return
+        cursor = max(0, min(len(self._rows) - 1, self.cursor + offset))
+        if cursor == self.cursor:
+            return
+        self.refresh_lines(self.cursor - self.scroll_offset.y)
+        self.cursor = cursor
+        self.scroll_to_region(Region(0, cursor, 1, 1), animate=False)
+        self.refresh_lines(cursor - self.scroll_offset.y)
+        self.post_message(self.Highlighted(self.highlighted_row))
+
+    def action_cursor_up(self) -> None:
+        """Move up one row."""
+        self.move_cursor(-1)
+
+    def action_cursor_down(self) -> None:
+        """Move down one row."""
+        self.move_cursor(1)
+
+    def action_page_up(self) -> None:
+        """Move up one page."""
+        self.move_cursor(-max(1, self.size.height))
+
+    def action_page_down(self) -> None:
+        """Move down one page."""
+        self.move_cursor(max(1, self.size.height))
+
+    def action_first(self) -> None:
+        """Jump to the first row."""
+        self.move_cursor(-self.cursor)
+
+    def action_last(self) -> None:
+        """Jump to the last row."""
+        self.move_cursor(len(self._rows))
+
+    def action_select(self) -> None:
+        """Post Selected for the highlighted row."""
+        row = self.highlighted_row
+        if row is not None:
+            self.post_message(self.Selected(row))
@@ -2,111 +2,134 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Mapping, Optional
 
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
-from textual.events import Key
 from textual.screen import ModalScreen
-from textual.widgets import Label, ListItem, ListView, Static
+from textual.widgets import Input, Label, Static
 
 from domain.models import Wrestler
+from domain.search import NameIndex, parse_query
+from ui.roster_list import RosterList
 
 
 class SelectorScreen(ModalScreen[Optional[str]]):
     """Modal for selecting a wrestler from the roster.
 
-    Displays a list of wrestlers and a detail panel for the highlighted entry.
-    Blocks selection of the opponent already chosen in the other slot.
+    Displays a search box, a virtualized list of matching wrestlers, and a
+    detail panel for the highlighted entry. Typing narrows the list by name
+    and by `face`/`heel`/`pop>=N`/`sta>=N` filters. Blocks selection of the
+    opponent already chosen in the other slot.
     """
     BINDINGS = [
         ("escape", "cancel", "Cancel"),
-        ("enter", "select", "Select"),
+        ("up", "cursor(-1)", "Up"),
+        ("down", "cursor(1)", "Down"),
+        ("pageup", "page(-1)", "Page Up"),
+        ("pagedown", "page(1)", "Page Down"),
     ]
 
     def __init__(
         self,
-        roster: Dict[str, Wrestler],
+        roster: Mapping[str, Wrestler],
         slot_label: str,
         locked_id: Optional[str],
+        index: Optional[NameIndex] = None,
     ) -> None:
-        """Store roster data, slot label, and locked opponent ID."""
+        """Store roster data, slot label, locked opponent ID, and name index.
+
+        Pass a prebuilt index (from `NameIndex.from_roster(roster)`) to avoid
+        re-indexing a large roster on every open.
+        """
         super().__init__()
         self.roster = roster
         self.slot_label = slot_label
         self.locked_id = locked_id
-        self._order: List[str] = []
+        self._index = index if index is not None else NameIndex.from_roster(roster)
 
     def compose(self) -> ComposeResult:
         """Compose the selector layout."""
         with Container(id="selector"):
             yield Label(f"Select Wrestler ({self.slot_label})", id="selector-title")
-            yield ListView(id="roster-list")
+            yield Input(placeholder="Search name, face/heel, pop>=N, sta>=N", id="search")
+            yield RosterList(self._format_row, id="roster-list")
             yield Static("", id="detail")
             with Horizontal(id="selector-actions"):
                 yield Static("Enter: Select")
                 yield Static("Esc: Cancel")
 
     def on_mount(self) -> None:
-        """Populate roster list and set initial focus."""
-        roster_list = self.query_one("#roster-list", ListView)
-        for wrestler in self.roster.values():
-            locked = " (locked)" if wrestler.id == self.locked_id else ""
-            label = f"{wrestler.name} ({wrestler.alignment}){locked}"
-            roster_list.append(ListItem(Label(label), id=wrestler.id))
-            self._order.append(wrestler.id)
-        self.set_focus(roster_list)
-        self._update_detail()
-
-    @on(ListView.Highlighted)
-    def _on_highlighted(self, _: ListView.Highlighted) -> None:
-        """Update detail panel when list selection changes."""
-        self._update_detail()
-
-    @on(ListView.Selected)
-    def _on_selected(self, event: ListView.Selected) -> None:
-        """Handle Enter selection from the list view."""
-        wrestler_id = self._order[event.index]
-        if wrestler_id == self.locked_id:
-            self.notify("That wrestler is locked.", severity="warning")
-            return
-        self.dismiss(wrestler_id)
-
-    def _update_detail(self) -> None:
-        """Render stats for the currently highlighted wrestler."""
-        roster_list = self.query_one("#roster-list", ListView)
-        if roster_list.index is None:
+        """Show the full roster and focus the search box."""
+        self.query_one(RosterList).set_rows(self._index.search(""))
+        self.set_focus(self.query_one("#search", Input))
+
+    @on(Input.Changed, "#search")
+    def _on_search_changed(self, event: Input.Changed) -> None:
+        """Narrow the list to wrestlers matching the search text."""
+        query = parse_query(event.value)
+        rows = self._index.search(query.text)
+        rows = self._index.filter(rows, query)
+        self.query_one(RosterList).set_rows(rows)
+
+    @on(Input.Submitted, "#search")
+    def _on_search_submitted(self, _: Input.Submitted) -> None:
+        """Select the highlighted wrestler when Enter is pressed in the search box."""
+        self.action_select()
+
+    @on(RosterList.Highlighted)
+    def _on_highlighted(self, event: RosterList.Highlighted) -> None:
+        """Update detail panel when the highlighted row changes."""
+        self._update_detail(event.row)
+
+    @on(RosterList.Selected)
+    def _on_selected(self, event: RosterList.Selected) -> None:
+        """Handle Enter selection from the list."""
+        self._choose(event.row)
+
+    def _format_row(self, row: int) -> str:
+        """Return the list label for an index row."""
+        wrestler = self.roster[self._index.ids[row]]
+        locked = " (locked)" if wrestler.id == self.locked_id else ""
+        return f"{wrestler.name} ({wrestler.alignment}){locked}"
+
+    def _update_detail(self, row: Optional[int]) -> None:
+        """Render stats for the given row, or a no-match note."""
+        detail = self.query_one("#detail", Static)
+        if row is None:
+            detail.update("No wrestlers match.")
             return
-        wrestler_id = self._order[roster_list.index]
-        wrestler = self.roster[wrestler_id]
-        detail = (
+        wrestler = self.roster[self._index.ids[row]]
+        detail.update(
             f"Alignment: {wrestler.alignment}\n"
             f"Popularity: {wrestler.popularity}\n"
             f"Stamina: {wrestler.stamina}"
         )
-        self.query_one("#detail", Static).update(detail)
 
-    def action_select(self) -> None:
-        """Select the highlighted wrestler."""
-        roster_list = self.query_one("#roster-list", ListView)
-        if roster_list.index is None:
-            return
-        wrestler_id = self._order[roster_list.index]
+    def _choose(self, row: int) -> None:
+        """Dismiss with the wrestler at row unless it is locked."""
+        wrestler_id = self._index.ids[row]
         if wrestler_id == self.locked_id:
             self.notify("That wrestler is locked.", severity="warning")
             return
         self.dismiss(wrestler_id)
 
+    def action_cursor(self, offset: int) -> None:
+        """Move the list cursor while the search box keeps focus."""
+        self.query_one(RosterList).move_cursor(offset)
+
+    def action_page(self, direction: int) -> None:
+        """Move the list cursor by one page."""
+        roster_list = self.query_one(RosterList)
+        roster_list.move_cursor(direction * max(1, roster_list.size.height))
+
+    def action_select(self) -> None:
+        """Select the highlighted wrestler."""
+        row = self.query_one(RosterList).highlighted_row
+        if row is not None:
+            self._choose(row)
+
     def action_cancel(self) -> None:
         """Dismiss the modal without selection."""
         self.dismiss(None)
-
-    def on_key(self, event: Key) -> None:
-        """Handle fallback list navigation keys."""
-        if event.key in {"k", "w"}:
-            self.action_cursor_up()
-            event.stop()
-        elif event.key in {"j", "s"}:
-            self.action_cursor_down()
-            event.stop()
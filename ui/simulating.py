@@ -1,26 +1,33 @@
-"""Simulating screen for pacing between booking and results."""
+"""Simulating screen that runs the pending match off the UI thread."""
 
 from __future__ import annotations
 
+from typing import Callable
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.screen import Screen
 from textual.widgets import Label, Static
+from textual.worker import Worker, WorkerState
 
 from domain.models import Match, MatchResult
-from ui.results import ResultsScreen
+
+ProgressCallback = Callable[[int, int], None]
+SimulationJob = Callable[[ProgressCallback], MatchResult]
 
 
 class SimulatingScreen(Screen):
-    """Short-lived screen that auto-advances to results.
+    """Screen shown while a simulation job runs in a worker thread.
 
-    Used as a pacing step between confirmation and results display.
+    The job receives a progress callback (done, total) that is safe to call
+    from the worker. The screen advances to results as soon as the job
+    finishes, committing the result through the app first.
     """
-    def __init__(self, match: Match, result: MatchResult) -> None:
-        """Create the simulating screen with the pending result."""
+    def __init__(self, match: Match, job: SimulationJob) -> None:
+        """Create the simulating screen for a pending job."""
         super().__init__()
         self.match = match
-        self.result = result
+        self.job = job
 
     def compose(self) -> ComposeResult:
         """Compose the simulating layout."""
@@ -29,10 +36,34 @@ class SimulatingScreen(Screen):
             yield Static("Please wait", id="sim-sub")
 
     def on_mount(self) -> None:
-        """Schedule the transition to results."""
-        self.set_timer(0.8, self._advance)
+        """Start the simulation worker."""
+        self.run_worker(self._run_job, thread=True, exit_on_error=False)
+
+    def _run_job(self) -> MatchResult:
+        """Run the job in the worker thread."""
+        return self.job(self._report_progress)
+
+    def _report_progress(self, done: int, total: int) -> None:
+        """Forward worker progress to the UI thread."""
+        self.app.call_from_thread(self._show_progress, done, total)
+
+    def _show_progress(self, done: int, total: int) -> None:
+        """Render job progress."""
+        percent = done / total if total else 1.0
+        self.query_one("#sim-sub", Static).update(f"{done}/{total} ({percent:.0%})")
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Advance to results on success, or return to the hub on failure."""
+        if event.state == WorkerState.SUCCESS:
+            self._advance(event.worker.result)
+        elif event.state == WorkerState.ERROR:
+            self.app.notify(f"Simulation failed: {event.worker.error}", severity="error")
+            self.app.pop_screen()
+
+    def _advance(self, result: MatchResult) -> None:
+        """Commit the result and replace this screen with the results screen."""
+        from ui.results import ResultsScreen
 
-    def _advance(self) -> None:
-        """Replace this screen with the results screen."""
+        self.app.finish_simulation(self.match, result)
         self.app.pop_screen()
-        self.app.push_screen(ResultsScreen(self.match, self.result))
+        self.app.push_screen(ResultsScreen(self.match, result))